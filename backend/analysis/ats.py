@@ -0,0 +1,278 @@
+"""
+ats.py — ATS-friendliness check for extracted resume text
+
+Everything the checker looks for (section keywords, action verbs, an email
+address, a phone number and "special" formatting characters) is found by
+ATS_MATCHER, which is compiled once at import. It makes one pass over the
+text per feature, plus one substring search per keyword and verb:
+
+- sections: the headings found by analysis.sections.segment_sections, with
+  the original keyword test kept for each section without a recognisable
+  heading
+- keywords and verbs: one C-level substring search (`in`) per term over a
+  shared lowercase copy, each stopping at its first hit. This is not a
+  single-pass automaton: one built from the terms' trie finds the same
+  terms but is several times slower (benchmarks/bench_ats.py)
+- email: only the '@' positions are inspected, with the local part checked
+  by hand and the domain by an anchored regex
+- phone: the pattern reduced to the part that decides whether it matches
+- special characters: counted with bytes.translate, leaving only non-ASCII
+  characters for the regex
+
+The features are scored by the rule tables in ats_rules.py. With
+section_detection='keywords' (LEGACY_ATS_MATCHER) the result is exactly that
+of the original regex-based check, kept below as check_ats_friendliness_regex
+for the benchmarks and regression checks.
+"""
+
+import re
+
+from analysis.ats_rules import ACTION_VERBS, ATS_SCORER, REQUIRED_SECTIONS, SECTION_KEYWORDS
+from analysis.sections import segment_sections
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+PHONE_PATTERN = r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}'
+SPECIAL_CHAR_PATTERN = r'[^\w\s.,;:!?()\-\'/\n]'
+
+
+class ATSMatcher:
+    """
+    Precompiled scanner for the features check_ats_friendliness scores.
+    """
+
+    # Characters allowed in the local part of an email (before the '@')
+    EMAIL_LOCAL_CHARS = frozenset(
+        'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-'
+    )
+
+    def __init__(self, section_keywords=SECTION_KEYWORDS, action_verbs=ACTION_VERBS,
+                 section_detection='headings'):
+        """
+        Args:
+            section_detection: 'headings' — a section counts when the segmenter
+                               finds its heading, or, failing that, when one
+                               of its keywords is anywhere in the text;
+                               'keywords' — the original rule, any keyword
+                               anywhere in the text
+        """
+        self.section_keywords = {section: tuple(keywords)
+                                 for section, keywords in section_keywords.items()}
+        self.section_detection = section_detection
+        self.action_verbs = tuple(action_verbs)
+
+        # Everything after the '@' of the email pattern, matched in place
+        self._email_domain = re.compile(r'[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+        # Both leading groups of the phone pattern are optional, so a phone
+        # number is present exactly when its last seven digits are
+        self._phone = re.compile(r'\d{3}[-.\s]?\d{4}')
+        # Same for ASCII text, where a literal digit class lets the regex
+        # engine skip ahead to candidate positions
+        self._phone_ascii = re.compile(r'[0-9][0-9][0-9][-.\s]?[0-9]{4}')
+
+        self._special = re.compile(SPECIAL_CHAR_PATTERN)
+        # ASCII characters that are not "special", deleted before counting
+        self._not_special_ascii = bytes(
+            code for code in range(128) if not self._special.match(chr(code))
+        )
+
+    def scan(self, text: str, text_lower: str = None, sections=None) -> dict:
+        """
+        Returns the raw features of `text`:
+            length, has_email, has_phone, sections_found (in SECTION_KEYWORDS
+            order), verb_count, special_chars
+
+        Args:
+            text_lower: text.lower(), if the caller already has it
+            sections:   segment_sections(text), if the caller already has it
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        is_ascii = text.isascii()
+        return {
+            'length': len(text),
+            'has_email': self.has_email(text),
+            'has_phone': self.has_phone(text, is_ascii),
+            'sections_found': self.sections_found(text, text_lower, sections),
+            'verb_count': sum(1 for v in self.action_verbs if v in text_lower),
+            'special_chars': self.count_special(text, is_ascii),
+        }
+
+    def sections_found(self, text: str, text_lower: str, sections=None) -> list:
+        if self.section_detection == 'headings':
+            if sections is None:
+                sections = segment_sections(text)
+            headed = {section.name for section in sections if section.heading is not None}
+            return self.headed_sections(headed, self.keyword_sections(text_lower))
+        return self.keyword_sections(text_lower)
+
+    def headed_sections(self, headed, keyword_found=()) -> list:
+        """
+        SECTION_KEYWORDS sections among the canonical section names `headed`,
+        plus those of `keyword_found` (keyword_sections) without a heading.
+        """
+        return [section for section in self.section_keywords
+                if section.lower() in headed or section in keyword_found]
+
+    def keyword_sections(self, text_lower: str) -> list:
+        """SECTION_KEYWORDS sections with a keyword anywhere in `text_lower`."""
+        return [section for section, keywords in self.section_keywords.items()
+                if any(k in text_lower for k in keywords)]
+
+    def verbs_found(self, text_lower: str) -> list:
+        return [v for v in self.action_verbs if v in text_lower]
+
+    def has_phone(self, text: str, is_ascii: bool = None) -> bool:
+        if is_ascii is None:
+            is_ascii = text.isascii()
+        return bool((self._phone_ascii if is_ascii else self._phone).search(text))
+
+    def has_email(self, text: str) -> bool:
+        at = text.find('@')
+        while at != -1:
+            if at and self._email_domain.match(text, at + 1) and self._email_local_part(text, at):
+                return True
+            at = text.find('@', at + 1)
+        return False
+
+    def count_special(self, text: str, is_ascii: bool = None) -> int:
+        if is_ascii is None:
+            is_ascii = text.isascii()
+        if is_ascii:
+            return len(text.encode('ascii').translate(None, self._not_special_ascii))
+        # Dropping ASCII bytes leaves multi-byte UTF-8 sequences intact, so only
+        # the (usually few) remaining characters go through the regex
+        rest = text.encode('utf-8', 'surrogatepass').translate(None, self._not_special_ascii)
+        return len(self._special.findall(rest.decode('utf-8', 'surrogatepass')))
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    def _email_local_part(self, text, at):
+        # Is there a start s < at with a word boundary at s and only local-part
+        # characters from s up to the '@'? (the "\b[A-Za-z0-9._%+-]+" part)
+        s = at - 1
+        while s >= 0 and text[s] in self.EMAIL_LOCAL_CHARS:
+            before_is_word = s > 0 and _is_word(text[s - 1])
+            if _is_word(text[s]) != before_is_word:
+                return True
+            s -= 1
+        return False
+
+
+def _is_word(ch):
+    # Same test the regex engine uses for \w and \b
+    return ch.isalnum() or ch == '_'
+
+
+ATS_MATCHER = ATSMatcher()
+LEGACY_ATS_MATCHER = ATSMatcher(section_detection='keywords')
+
+
+def check_ats_friendliness(text):
+    """
+    Args:
+        text: Resume text, or a ResumeDocument whose memoized features are reused
+    """
+    features = ATS_MATCHER.scan(text) if isinstance(text, str) else text.ats_features
+    return ATS_SCORER.score(features)
+
+
+def check_ats_friendliness_many(texts, matcher=None):
+    """ATS check of many documents, scored in one vectorized pass."""
+    matcher = matcher or ATS_MATCHER
+    return ATS_SCORER.score_many([matcher.scan(text) for text in texts])
+
+
+def check_ats_friendliness_regex(text):
+    """
+    The original implementation: one regex or substring scan per pattern.
+    Kept as the reference check_ats_friendliness is verified against.
+    """
+    issues = []
+    suggestions = []
+    score = 100
+    details = {}
+
+    if len(text) < 300:
+        issues.append("Resume is too short")
+        suggestions.append("Add more details about your experience, skills, and achievements")
+        score -= 25
+        details['length'] = 'Poor'
+    elif len(text) < 800:
+        issues.append("Resume could be more detailed")
+        suggestions.append("Expand on your key achievements and responsibilities")
+        score -= 10
+        details['length'] = 'Fair'
+    else:
+        details['length'] = 'Good'
+
+    text_lower = text.lower()
+    has_email = bool(re.search(EMAIL_PATTERN, text))
+    has_phone = bool(re.search(PHONE_PATTERN, text))
+
+    if not has_email:
+        issues.append("Missing email address")
+        suggestions.append("Add a professional email address")
+        score -= 15
+    if not has_phone:
+        issues.append("Missing phone number")
+        suggestions.append("Include your contact phone number")
+        score -= 10
+    details['contact_info'] = 'Complete' if (has_email and has_phone) else 'Incomplete'
+
+    sections_found = []
+    sections_missing = []
+    for section, keywords in SECTION_KEYWORDS.items():
+        if any(k in text_lower for k in keywords):
+            sections_found.append(section)
+        else:
+            sections_missing.append(section)
+            if section in REQUIRED_SECTIONS:
+                issues.append(f"Missing '{section}' section")
+                suggestions.append(f"Add a clear '{section}' section")
+                score -= 15
+
+    details['sections'] = f"{len(sections_found)}/4 key sections found"
+
+    verb_count = sum(1 for v in ACTION_VERBS if v in text_lower)
+    if verb_count < 3:
+        issues.append("Limited use of strong action verbs")
+        suggestions.append("Use more action verbs like: developed, managed, led")
+        score -= 12
+        details['action_verbs'] = 'Poor'
+    elif verb_count < 6:
+        details['action_verbs'] = 'Fair'
+    else:
+        details['action_verbs'] = 'Good'
+
+    special_char_ratio = len(re.findall(SPECIAL_CHAR_PATTERN, text)) / max(len(text), 1)
+    if special_char_ratio > 0.08:
+        issues.append("Excessive special characters detected")
+        suggestions.append("Use simple bullet points, avoid tables and text boxes")
+        score -= 12
+        details['formatting'] = 'Complex (may cause ATS issues)'
+    else:
+        details['formatting'] = 'Simple (ATS-friendly)'
+
+    score = max(0, min(100, score))
+    is_ats_friendly = score >= 70
+
+    if score >= 85:
+        overall = "Excellent - Highly ATS-friendly"
+    elif score >= 70:
+        overall = "Good - ATS-friendly with minor improvements possible"
+    elif score >= 50:
+        overall = "Fair - Needs improvement"
+    else:
+        overall = "Poor - Major improvements needed"
+
+    return {
+        'is_ats_friendly': is_ats_friendly,
+        'score': score,
+        'overall': overall,
+        'issues': issues,
+        'suggestions': suggestions,
+        'details': details
+    }
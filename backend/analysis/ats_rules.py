@@ -0,0 +1,252 @@
+"""
+ats_rules.py — Declarative ATS scoring rules and the scorer compiled from them
+
+The ATS check is described as data: which keywords and verbs are looked for,
+which feature thresholds cost how many points (and which issue/suggestion
+they add), how each entry of `details` is labelled, and how the final score
+is banded. ATSScorer compiles the tables once into predicates that work on
+plain values and on NumPy columns alike, so the same rules score a single
+document or a whole batch in vectorized form.
+"""
+
+import operator
+
+import numpy as np
+
+SECTION_KEYWORDS = {
+    'Experience': ['experience', 'work history', 'employment', 'professional experience'],
+    'Education': ['education', 'qualification', 'degree', 'academic', 'university', 'college'],
+    'Skills': ['skills', 'technical skills', 'competencies', 'proficiencies'],
+    'Summary': ['summary', 'objective', 'profile', 'about me']
+}
+
+REQUIRED_SECTIONS = ['Experience', 'Education', 'Skills']
+
+ACTION_VERBS = ['developed', 'managed', 'led', 'created', 'implemented', 'designed',
+                'analyzed', 'improved', 'coordinated', 'achieved', 'executed',
+                'established', 'built', 'optimized', 'delivered', 'increased']
+
+# ─────────────────────────────────────────────
+# RULE TABLES
+# ─────────────────────────────────────────────
+
+# (feature, op, value, penalty, issue, suggestion), in the order issues are reported.
+# 'range' is half-open: value[0] <= feature < value[1].
+PENALTY_RULES = [
+    ('length', '<', 300, 25, "Resume is too short",
+     "Add more details about your experience, skills, and achievements"),
+    ('length', 'range', (300, 800), 10, "Resume could be more detailed",
+     "Expand on your key achievements and responsibilities"),
+    ('has_email', '==', False, 15, "Missing email address",
+     "Add a professional email address"),
+    ('has_phone', '==', False, 10, "Missing phone number",
+     "Include your contact phone number"),
+] + [
+    (f"section:{section}", '==', False, 15, f"Missing '{section}' section",
+     f"Add a clear '{section}' section")
+    for section in SECTION_KEYWORDS if section in REQUIRED_SECTIONS
+] + [
+    ('verb_count', '<', 3, 12, "Limited use of strong action verbs",
+     "Use more action verbs like: developed, managed, led"),
+    ('special_ratio', '>', 0.08, 12, "Excessive special characters detected",
+     "Use simple bullet points, avoid tables and text boxes"),
+]
+
+# detail key -> (feature, [(op, value, label), ...] first match wins, default label),
+# or (feature, format string)
+DETAIL_RULES = {
+    'length': ('length', [('<', 300, 'Poor'), ('<', 800, 'Fair')], 'Good'),
+    'contact_info': ('has_contact', [('==', True, 'Complete')], 'Incomplete'),
+    'sections': ('section_count', f"{{}}/{len(SECTION_KEYWORDS)} key sections found"),
+    'action_verbs': ('verb_count', [('<', 3, 'Poor'), ('<', 6, 'Fair')], 'Good'),
+    'formatting': ('special_ratio', [('>', 0.08, 'Complex (may cause ATS issues)')],
+                   'Simple (ATS-friendly)'),
+}
+
+BASE_SCORE = 100
+ATS_FRIENDLY_SCORE = 70
+
+# (minimum score, label), highest first
+OVERALL_BANDS = [
+    (85, "Excellent - Highly ATS-friendly"),
+    (70, "Good - ATS-friendly with minor improvements possible"),
+    (50, "Fair - Needs improvement"),
+    (None, "Poor - Major improvements needed"),
+]
+
+
+def _in_range(values, bounds):
+    low, high = bounds
+    return (values >= low) & (values < high)
+
+
+OPS = {
+    '<': operator.lt,
+    '>': operator.gt,
+    '==': operator.eq,
+    'range': _in_range,
+}
+
+
+class ATSScorer:
+    """
+    Scorer compiled from the rule tables.
+
+    Features are the dicts produced by ATSMatcher.scan(); derived features
+    (special_ratio, has_contact, section_count, section:<name>) are computed
+    here.
+    """
+
+    def __init__(self, penalty_rules=PENALTY_RULES, detail_rules=DETAIL_RULES,
+                 overall_bands=OVERALL_BANDS, sections=SECTION_KEYWORDS):
+        self.sections = list(sections)
+        self.penalty_rules = [(feature, OPS[op], value) for feature, op, value, *_ in penalty_rules]
+        self.penalties = np.array([rule[3] for rule in penalty_rules], dtype=np.int64)
+        self.issues = [rule[4] for rule in penalty_rules]
+        self.suggestions = [rule[5] for rule in penalty_rules]
+
+        self.detail_rules = []
+        for key, spec in detail_rules.items():
+            if isinstance(spec[1], str):
+                self.detail_rules.append((key, spec[0], None, spec[1]))
+            else:
+                feature, bands, default = spec
+                compiled = [(OPS[op], value, label) for op, value, label in bands]
+                self.detail_rules.append((key, feature, compiled, default))
+
+        self.overall_bands = overall_bands
+
+    # ─────────────────────────────────────────────
+    # SINGLE DOCUMENT
+    # ─────────────────────────────────────────────
+
+    def score(self, features: dict) -> dict:
+        """ATS check result for one document."""
+        values = self._derive(features)
+        fired = [bool(test(values[feature], value)) for feature, test, value in self.penalty_rules]
+
+        score = BASE_SCORE - sum(int(p) for p, hit in zip(self.penalties, fired) if hit)
+        score = max(0, min(100, score))
+
+        details = {}
+        for key, feature, bands, default in self.detail_rules:
+            if bands is None:
+                details[key] = default.format(values[feature])
+                continue
+            details[key] = next((label for test, value, label in bands
+                                 if test(values[feature], value)), default)
+
+        return {
+            'is_ats_friendly': score >= ATS_FRIENDLY_SCORE,
+            'score': score,
+            'overall': self._overall(score),
+            'issues': [issue for issue, hit in zip(self.issues, fired) if hit],
+            'suggestions': [tip for tip, hit in zip(self.suggestions, fired) if hit],
+            'details': details
+        }
+
+    # ─────────────────────────────────────────────
+    # BATCH
+    # ─────────────────────────────────────────────
+
+    def score_columns(self, features_list) -> dict:
+        """
+        Vectorized scoring of many documents.
+
+        Returns:
+            NumPy columns: 'score', 'is_ats_friendly', 'fired' (documents x
+            penalty rules), 'overall' and one column per details key
+        """
+        columns = self._columns(features_list)
+        count = len(features_list)
+
+        fired = np.zeros((count, len(self.penalty_rules)), dtype=bool)
+        for j, (feature, test, value) in enumerate(self.penalty_rules):
+            fired[:, j] = test(columns[feature], value)
+
+        scores = np.clip(BASE_SCORE - fired.astype(np.int64) @ self.penalties, 0, 100)
+
+        result = {
+            'score': scores,
+            'is_ats_friendly': scores >= ATS_FRIENDLY_SCORE,
+            'fired': fired,
+            'overall': self._overall_column(scores),
+        }
+        for key, feature, bands, default in self.detail_rules:
+            if bands is None:
+                result[key] = np.array([default.format(v) for v in columns[feature].tolist()],
+                                       dtype=object)
+                continue
+            conditions = [test(columns[feature], value) for test, value, _ in bands]
+            labels = [label for _, _, label in bands]
+            result[key] = np.select(conditions, labels, default) if count else np.array([], dtype=object)
+        return result
+
+    def score_many(self, features_list) -> list:
+        """ATS check results for many documents, identical to score() on each."""
+        columns = self.score_columns(features_list)
+        detail_keys = [rule[0] for rule in self.detail_rules]
+        results = []
+        for i, (score, friendly, fired, overall) in enumerate(zip(
+                columns['score'].tolist(), columns['is_ats_friendly'].tolist(),
+                columns['fired'], columns['overall'].tolist())):
+            hits = np.flatnonzero(fired).tolist()
+            results.append({
+                'is_ats_friendly': friendly,
+                'score': score,
+                'overall': overall,
+                'issues': [self.issues[j] for j in hits],
+                'suggestions': [self.suggestions[j] for j in hits],
+                'details': {key: str(columns[key][i]) for key in detail_keys}
+            })
+        return results
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    def _derive(self, features):
+        values = dict(features)
+        values['special_ratio'] = features['special_chars'] / max(features['length'], 1)
+        values['has_contact'] = features['has_email'] and features['has_phone']
+        values['section_count'] = len(features['sections_found'])
+        for section in self.sections:
+            values[f"section:{section}"] = section in features['sections_found']
+        return values
+
+    def _columns(self, features_list):
+        length = np.array([f['length'] for f in features_list], dtype=np.int64)
+        special = np.array([f['special_chars'] for f in features_list], dtype=np.int64)
+        has_email = np.array([f['has_email'] for f in features_list], dtype=bool)
+        has_phone = np.array([f['has_phone'] for f in features_list], dtype=bool)
+        columns = {
+            'length': length,
+            'has_email': has_email,
+            'has_phone': has_phone,
+            'has_contact': has_email & has_phone,
+            'verb_count': np.array([f['verb_count'] for f in features_list], dtype=np.int64),
+            'special_ratio': special / np.maximum(length, 1),
+            'section_count': np.array([len(f['sections_found']) for f in features_list],
+                                      dtype=np.int64),
+        }
+        for section in self.sections:
+            columns[f"section:{section}"] = np.array(
+                [section in f['sections_found'] for f in features_list], dtype=bool
+            )
+        return columns
+
+    def _overall(self, score):
+        for minimum, label in self.overall_bands:
+            if minimum is None or score >= minimum:
+                return label
+
+    def _overall_column(self, scores):
+        conditions = [scores >= minimum for minimum, _ in self.overall_bands if minimum is not None]
+        labels = [label for minimum, label in self.overall_bands if minimum is not None]
+        default = next(label for minimum, label in self.overall_bands if minimum is None)
+        if not len(scores):
+            return np.array([], dtype=object)
+        return np.select(conditions, labels, default)
+
+
+ATS_SCORER = ATSScorer()
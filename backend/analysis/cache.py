@@ -0,0 +1,254 @@
+"""
+cache.py — Layered cache of resume analysis results, keyed on content
+
+The same resume text reaches the analysis endpoints again and again
+(re-uploads, re-submitted text, async jobs and batches), and near-identical
+texts (spacing, punctuation, letter case) preprocess to the same words. Each
+stage is cached on its own input, so a request reuses every stage whose
+input it shares with an earlier request:
+
+    processed   SHA-256 of the raw text           -> preprocessed text
+    features    SHA-256 of the preprocessed text  -> TF-IDF row
+    prediction  SHA-256 of the TF-IDF row         -> role prediction
+    ats         SHA-256 of the raw text           -> check_ats_friendliness result
+
+The ATS check reads the raw text (contact details, headings, special
+characters) and nothing of the model, so it is keyed on the raw text alone
+rather than on the features.
+
+Each layer is an LRU bounded in entries whose entries expire `ttl` seconds
+after they were stored. Keys of the model's layers (all but ats) carry the
+predictor's model_version, and the first lookup after it changes clears
+those layers. model_version is taken when the predictor loads its
+artifacts: a model retrained, re-exported or given a new lemma table on
+disk is picked up by restarting the app (or calling predictor.load_model()),
+not while it runs.
+
+Batches (bulk ingestion) go through processed_many and prediction_many: the
+texts missing from the processed layer are preprocessed together (on a
+process pool when the caller provides one), and the rows missing from the
+prediction layer are scored in one pass over the forest.
+
+Predictions and ATS results are returned as copies the caller may modify;
+the preprocessed text and TF-IDF rows are shared between requests and must
+not be modified.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import scipy.sparse as sp
+
+from analysis.ats import check_ats_friendliness
+
+LAYERS = ('processed', 'features', 'prediction', 'ats')
+
+# Layers whose results depend on the predictor's artifacts
+MODEL_LAYERS = ('processed', 'features', 'prediction')
+
+
+def row_digest(row) -> str:
+    """SHA-256 hex digest of a sparse 1 x vocabulary row."""
+    row = row.tocsr()
+    digest = hashlib.sha256(str(row.shape).encode())
+    digest.update(row.indices.tobytes())
+    digest.update(row.data.tobytes())
+    return digest.hexdigest()
+
+
+class CacheLayer:
+    """
+    LRU of at most `max_entries` values, each a miss once it is older than
+    `ttl` seconds.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()       # key -> (stored at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.expired = 0
+
+    def get(self, key):
+        """The value, or None if it is unknown or has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evicted': self.evicted,
+                'expired': self.expired,
+            }
+
+
+class AnalysisCache:
+    """
+    Args:
+        predictor:   ResumePredictor whose preprocessing, vectorizer and model
+                     the cached results come from (and whose model_version
+                     they are valid for)
+        max_entries: Entries kept per layer
+        ttl:         Seconds an entry stays valid
+    """
+
+    def __init__(self, predictor, max_entries: int = 1024, ttl: float = 3600.0):
+        self.predictor = predictor
+        self.layers = {name: CacheLayer(max_entries, ttl) for name in LAYERS}
+        self.model_version = predictor.model_version
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def features(self, document):
+        """
+        document.features, through the processed and features layers; the
+        document is filled in with what was found (as if it had computed it)
+        """
+        version = self._version()
+        if 'features' in document.__dict__:
+            return document.features
+
+        processed = document.__dict__.get('processed')
+        if processed is None:
+            key = f"{version}-{document.digest}"
+            processed = self.layers['processed'].get(key)
+            if processed is None:
+                processed = document.processed
+                self.layers['processed'].put(key, processed)
+            else:
+                document.__dict__['processed'] = processed
+
+        key = f"{version}-{hashlib.sha256(processed.encode('utf-8', 'surrogatepass')).hexdigest()}"
+        features = self.layers['features'].get(key)
+        if features is None:
+            features = document.features
+            self.layers['features'].put(key, features)
+        else:
+            document.__dict__['features'] = features
+        return features
+
+    def prediction(self, document, section_weights=None) -> dict:
+        """
+        predictor.predict(document, section_weights), through the prediction
+        layer (and the features layers when there are no section weights)
+        """
+        version = self._version()
+        row = (document.section_features(section_weights) if section_weights
+               else self.features(document))
+        key = f"{version}-{row_digest(row)}"
+        prediction = self.layers['prediction'].get(key)
+        if prediction is None:
+            prediction = self.predictor.predict_features(row)[0]
+            self.layers['prediction'].put(key, prediction)
+        return dict(prediction, top_3_roles=list(prediction['top_3_roles']))
+
+    def processed_many(self, documents, preprocess_many):
+        """
+        Fills in document.processed for each document, through the processed
+        layer; the texts missing from it are preprocessed in one call.
+
+        Args:
+            documents:       ResumeDocuments of this cache's predictor
+            preprocess_many: preprocess_many(texts) -> the preprocessed texts
+                             in order (e.g. ResumePreprocessor.preprocess_many
+                             on a process pool)
+        """
+        version = self._version()
+        missing = []
+        for document in documents:
+            if 'processed' in document.__dict__:
+                continue
+            processed = self.layers['processed'].get(f"{version}-{document.digest}")
+            if processed is None:
+                missing.append(document)
+            else:
+                document.__dict__['processed'] = processed
+        if missing:
+            for document, processed in zip(missing, preprocess_many([d.text for d in missing])):
+                document.__dict__['processed'] = processed
+                self.layers['processed'].put(f"{version}-{document.digest}", processed)
+
+    def prediction_many(self, documents, section_weights=None) -> list:
+        """
+        prediction() of each document; the rows missing from the prediction
+        layer are scored in a single predictor.predict_features call
+        """
+        version = self._version()
+        predictions, missing = [], []
+        for i, document in enumerate(documents):
+            row = (document.section_features(section_weights) if section_weights
+                   else self.features(document))
+            key = f"{version}-{row_digest(row)}"
+            prediction = self.layers['prediction'].get(key)
+            if prediction is None:
+                missing.append((i, key, row))
+            predictions.append(prediction)
+        if missing:
+            rows = sp.vstack([row for _, _, row in missing], format='csr')
+            for (i, key, _), prediction in zip(missing, self.predictor.predict_features(rows)):
+                self.layers['prediction'].put(key, prediction)
+                predictions[i] = prediction
+        return [dict(prediction, top_3_roles=list(prediction['top_3_roles']))
+                for prediction in predictions]
+
+    def ats(self, document) -> dict:
+        """check_ats_friendliness(document), through the ats layer."""
+        result = self.layers['ats'].get(document.digest)
+        if result is None:
+            result = check_ats_friendliness(document)
+            self.layers['ats'].put(document.digest, result)
+        return copy.deepcopy(result)
+
+    def stats(self) -> dict:
+        self._version()
+        return {
+            'model_version': self.model_version,
+            'invalidations': self.invalidations,
+            'layers': {name: layer.stats() for name, layer in self.layers.items()},
+        }
+
+    def _version(self):
+        version = self.predictor.model_version
+        if version != self.model_version:
+            with self._lock:
+                if version != self.model_version:
+                    for name in MODEL_LAYERS:
+                        self.layers[name].clear()
+                    self.model_version = version
+                    self.invalidations += 1
+        return version
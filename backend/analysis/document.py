@@ -0,0 +1,190 @@
+"""
+document.py — One resume and everything derived from it
+
+A ResumeDocument is built once per request and handed to both the ATS
+checker and ResumePredictor. Each derived artifact (lowercase text, ATS
+features, skills, cleaned text, tokens, preprocessed text, TF-IDF vector) is
+computed on first use and memoized, so no stage repeats another's work.
+Sections come from analysis.sections and can be weighted for prediction.
+"""
+
+import hashlib
+import threading
+import weakref
+from functools import cached_property
+
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+
+from analysis.ats import ATS_MATCHER
+from analysis.sections import segment_sections
+from analysis.skills import SKILL_GAZETTEER
+
+
+class TfidfSteps:
+    """
+    The two steps of a fitted TfidfVectorizer's transform, as public sklearn
+    objects: a CountVectorizer over its vocabulary, then a TfidfTransformer
+    with its idf_ and norm. Term counts can be reweighted in between;
+    tfidf(counts(texts)) is exactly vectorizer.transform(texts).
+
+    Args:
+        vectorizer: Fitted TfidfVectorizer
+    """
+
+    def __init__(self, vectorizer):
+        counting = CountVectorizer().get_params()
+        params = {name: value for name, value in vectorizer.get_params().items() if name in counting}
+        params['vocabulary'] = vectorizer.vocabulary_
+        # Fitting with a fixed vocabulary only validates it, once, here
+        self.counter = CountVectorizer(**params).fit([])
+
+        self.weighting = TfidfTransformer(norm=vectorizer.norm, use_idf=vectorizer.use_idf,
+                                          smooth_idf=vectorizer.smooth_idf,
+                                          sublinear_tf=vectorizer.sublinear_tf)
+        self.weighting.n_features_in_ = len(vectorizer.vocabulary_)
+        if vectorizer.use_idf:
+            self.weighting.idf_ = vectorizer.idf_
+
+    def counts(self, texts):
+        """Term count rows (len(texts) x vocabulary) of preprocessed texts."""
+        return self.counter.transform(texts)
+
+    def tfidf(self, counts, copy=True):
+        """TF-IDF rows of term count rows (copy=False may reuse `counts`)."""
+        return self.weighting.transform(counts, copy=copy)
+
+
+_tfidf_steps = weakref.WeakKeyDictionary()
+_tfidf_steps_lock = threading.Lock()
+
+
+def tfidf_steps(vectorizer) -> TfidfSteps:
+    """The TfidfSteps of `vectorizer`, built on first use."""
+    with _tfidf_steps_lock:
+        steps = _tfidf_steps.get(vectorizer)
+        if steps is None:
+            steps = _tfidf_steps[vectorizer] = TfidfSteps(vectorizer)
+        return steps
+
+
+class ResumeDocument:
+    """
+    Args:
+        text:         Extracted resume text
+        preprocessor: ResumePreprocessor used for the NLP artifacts
+        vectorizer:   Fitted TF-IDF vectorizer used for `features`
+    """
+
+    def __init__(self, text: str, preprocessor=None, vectorizer=None):
+        self.text = text
+        self.preprocessor = preprocessor
+        self.vectorizer = vectorizer
+
+    @cached_property
+    def digest(self) -> str:
+        """SHA-256 hex digest of the text, the key of content caches."""
+        return hashlib.sha256(self.text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def sections(self) -> list:
+        """analysis.sections.Section list, in document order."""
+        return segment_sections(self.text)
+
+    @cached_property
+    def ats_features(self) -> dict:
+        """Raw ATS features: email/phone hits, sections, verbs, special characters."""
+        return ATS_MATCHER.scan(self.text, text_lower=self.lower, sections=self.sections)
+
+    @cached_property
+    def skills(self) -> list:
+        """Gazetteer skills mentioned in the text (analysis.skills), first mention first."""
+        return SKILL_GAZETTEER.extract(self.text, text_lower=self.lower)
+
+    @cached_property
+    def cleaned(self) -> str:
+        """ResumePreprocessor.clean_text output, reusing the shared lowercase copy."""
+        return self._require('preprocessor').clean_lowercase_text(self.lower)
+
+    @cached_property
+    def tokens(self) -> list:
+        return self._require('preprocessor').tokenize(self.cleaned)
+
+    @cached_property
+    def processed(self) -> str:
+        """ResumePreprocessor.preprocess output: stopwords dropped, tokens lemmatized."""
+        return self._require('preprocessor').lemmatize_tokens(self.tokens)
+
+    @cached_property
+    def features(self):
+        """TF-IDF row vector (1 x vocabulary) of the preprocessed text."""
+        return self._require('vectorizer').transform([self.processed])
+
+    @cached_property
+    def term_counts(self):
+        """Term count row (1 x vocabulary) `features` is weighted from."""
+        return tfidf_steps(self._require('vectorizer')).counts([self.processed])
+
+    def section_features(self, weights: dict):
+        """
+        TF-IDF row vector with each section's terms weighted.
+
+        Each section's term counts (memoized across calls) are scaled by its
+        weight in the document's term counts; the rest of those counts
+        (heading words, n-grams spanning two sections) keep weight 1.0. The
+        weighted counts then get the vectorizer's tf-idf weighting and norm
+        once, so with every weight at 1.0 the row is `features` itself.
+        Sections missing from `weights` keep weight 1.0, a weight of 0
+        leaves the section out.
+
+        Args:
+            weights: canonical section name ('header', 'skills', ...) -> weight
+
+        Returns:
+            1 x vocabulary sparse row; `features` when every weight is 1.0,
+            or every section's is 0
+        """
+        counts = self.term_counts
+        weighted = counts
+        kept = False
+        for section, row in self._section_rows():
+            weight = weights.get(section.name, 1.0)
+            kept = kept or bool(weight)
+            if weight != 1.0:
+                weighted = weighted + row * (weight - 1.0)
+        if weighted is counts or not kept:
+            return self.features
+        # A section preprocessed on its own may keep a term its context drops
+        weighted = weighted.maximum(0)
+        weighted.eliminate_zeros()
+        if not weighted.nnz:
+            return self.features
+        return tfidf_steps(self._require('vectorizer')).tfidf(weighted, copy=False)
+
+    def _section_rows(self):
+        """(section, term count row) for each section's body."""
+        rows = self.__dict__.get('section_rows')
+        if rows is None:
+            preprocessor = self._require('preprocessor')
+            steps = tfidf_steps(self._require('vectorizer'))
+            texts = [preprocessor.preprocess(section.text(self.text)) for section in self.sections]
+            matrix = steps.counts(texts) if texts else None
+            rows = [(section, matrix[i]) for i, section in enumerate(self.sections)]
+            self.__dict__['section_rows'] = rows
+        return rows
+
+    def computed(self) -> list:
+        """Names of the artifacts computed so far."""
+        return [name for name in ('digest', 'lower', 'sections', 'ats_features', 'skills',
+                                  'cleaned', 'tokens', 'processed', 'features', 'term_counts',
+                                  'section_rows')
+                if name in self.__dict__]
+
+    def _require(self, name):
+        value = getattr(self, name)
+        if value is None:
+            raise ValueError(f"ResumeDocument needs a {name} for this artifact")
+        return value
@@ -0,0 +1,450 @@
+"""
+live.py — Incremental re-analysis of a resume while it is being edited
+
+A LiveSession remembers, for the last text it analyzed, the analysis of each
+paragraph: its preprocessed text, its terms and their counts over the TF-IDF
+vocabulary, and its share of the ATS features. A new submission is split the
+same way; unchanged paragraphs are reused, only new or edited ones go
+through the preprocessor, and the document's TF-IDF row, section rows and
+ATS features are put together from the per-paragraph parts. The result is a
+ResumeDocument with those artifacts already filled in, so the ATS check and
+ResumePredictor score it exactly as they would a fresh document.
+
+A paragraph is one line, together with the following lines that start with a
+digit. clean_text only removes text across a line break for an international
+phone number continued on the next line ("+44" / "20 7946 0000"), which
+needs that line to start with a digit, and no ATS feature or section heading
+spans two lines. With that split every per-paragraph part combines into
+exactly the whole-text artifact; the term n-grams that span paragraphs are
+counted from the paragraph edges.
+"""
+
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from analysis.ats import ATS_MATCHER
+from analysis.document import ResumeDocument, tfidf_steps
+from analysis.sections import Section, heading_for
+
+# Line breaks that end a paragraph: those not followed by a digit
+PARAGRAPH_BREAK = re.compile(r'\n(?!\d)')
+
+
+class Paragraph(NamedTuple):
+    """
+    text:          The paragraph as written (no trailing newline)
+    blank:         Whitespace only
+    section:       Canonical section if its first line is a heading, else None
+    heading:       That heading line, stripped
+    body_offset:   Offset of the section body within the paragraph
+    processed:     ResumePreprocessor.preprocess output
+    terms:         Vectorizer tokens of `processed`
+    counts:        vocabulary column -> count of the n-grams within `terms`
+    body_terms:    `terms` of the section body (the text after the heading)
+    body_counts:   `counts` of the section body
+    has_email:     ATS features of the paragraph ...
+    has_phone:
+    special_chars:
+    verbs:         Action verbs found
+    keywords:      SECTION_KEYWORDS sections with a keyword in the paragraph
+    """
+    text: str
+    blank: bool
+    section: str
+    heading: str
+    body_offset: int
+    processed: str
+    terms: list
+    counts: dict
+    body_terms: list
+    body_counts: dict
+    has_email: bool
+    has_phone: bool
+    special_chars: int
+    verbs: frozenset
+    keywords: frozenset
+
+
+class ParagraphAnalyzer:
+    """
+    Analyzes paragraphs and assembles document artifacts from them. Shared
+    by every session of a LiveSessionStore.
+
+    Args:
+        preprocessor: ResumePreprocessor
+        vectorizer:   Fitted TfidfVectorizer. Term counts are kept per
+                      paragraph for word analyzers; any other analyzer falls
+                      back to transforming the joined preprocessed text.
+        matcher:      ATSMatcher whose features are assembled
+    """
+
+    def __init__(self, preprocessor, vectorizer, matcher=ATS_MATCHER):
+        self.preprocessor = preprocessor
+        self.vectorizer = vectorizer
+        self.matcher = matcher
+
+        self.incremental = vectorizer.analyzer == 'word' and vectorizer.input == 'content'
+        self.vocabulary = vectorizer.vocabulary_
+        self.steps = tfidf_steps(vectorizer)
+        self.min_n, self.max_n = vectorizer.ngram_range
+        self._preprocess_terms = vectorizer.build_preprocessor()
+        self._tokenize_terms = vectorizer.build_tokenizer()
+        self._stop_words = vectorizer.get_stop_words()
+
+    def analyze(self, text: str) -> Paragraph:
+        section, body_offset = heading_for(text.partition('\n')[0])
+        processed = self.preprocessor.preprocess(text)
+        terms = self.terms(processed)
+        counts = self.count(terms)
+        if section:
+            body_terms = self.terms(self.preprocessor.preprocess(text[body_offset:]))
+            body_counts = self.count(body_terms)
+        else:
+            body_offset, body_terms, body_counts = 0, terms, counts
+
+        lower = text.lower()
+        return Paragraph(
+            text=text,
+            blank=not text.strip(),
+            section=section,
+            heading=text.partition('\n')[0].strip() if section else None,
+            body_offset=body_offset,
+            processed=processed,
+            terms=terms,
+            counts=counts,
+            body_terms=body_terms,
+            body_counts=body_counts,
+            has_email=self.matcher.has_email(text),
+            has_phone=self.matcher.has_phone(text),
+            special_chars=self.matcher.count_special(text),
+            verbs=frozenset(self.matcher.verbs_found(lower)),
+            keywords=frozenset(self.matcher.keyword_sections(lower)),
+        )
+
+    # ─────────────────────────────────────────────
+    # TF-IDF
+    # ─────────────────────────────────────────────
+
+    def terms(self, processed: str) -> list:
+        """The vectorizer's unigram tokens of a preprocessed text."""
+        if not self.incremental:
+            return []
+        tokens = self._tokenize_terms(self._preprocess_terms(processed))
+        if self._stop_words:
+            tokens = [token for token in tokens if token not in self._stop_words]
+        return tokens
+
+    def count(self, terms: list) -> dict:
+        """vocabulary column -> count of the n-grams of `terms`."""
+        counts = {}
+        vocabulary = self.vocabulary
+        for n in range(self.min_n, self.max_n + 1):
+            for i in range(len(terms) - n + 1):
+                column = vocabulary.get(terms[i] if n == 1 else ' '.join(terms[i:i + n]))
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+        return counts
+
+    def count_crossing(self, term_lists, counts: dict):
+        """Adds to `counts` the n-grams that span consecutive term lists."""
+        if self.max_n < 2:
+            return
+        vocabulary = self.vocabulary
+        if self.max_n == 2:
+            # Bigrams: the last term of one list and the first of the next
+            last = None
+            for terms in term_lists:
+                if terms:
+                    if last is not None:
+                        column = vocabulary.get(last + ' ' + terms[0])
+                        if column is not None:
+                            counts[column] = counts.get(column, 0) + 1
+                    last = terms[-1]
+            return
+
+        keep = self.max_n - 1
+        tail = []
+        for terms in term_lists:
+            if not terms:
+                continue
+            if tail:
+                # j terms from before the boundary, k from after it
+                for k in range(1, min(len(terms), keep) + 1):
+                    for j in range(max(1, self.min_n - k), min(len(tail), self.max_n - k) + 1):
+                        column = vocabulary.get(' '.join(tail[-j:] + terms[:k]))
+                        if column is not None:
+                            counts[column] = counts.get(column, 0) + 1
+            tail = terms[-keep:] if len(terms) >= keep else (tail + terms)[-keep:]
+
+    def count_row(self, counts: dict):
+        """
+        Term count row (1 x vocabulary) from n-gram counts, laid out as the
+        vectorizer's counting step lays out a document's: columns in
+        ascending order, in its dtype.
+        """
+        vectorizer = self.vectorizer
+        columns = np.array(sorted(counts), dtype=np.int32)
+        if vectorizer.binary:
+            values = np.ones(len(columns), dtype=vectorizer.dtype)
+        else:
+            values = np.array([counts[column] for column in columns.tolist()], dtype=vectorizer.dtype)
+        return sp.csr_matrix((values, columns, np.array([0, len(columns)], dtype=np.int32)),
+                             shape=(1, len(self.vocabulary)))
+
+    def tfidf(self, count_row):
+        """
+        TF-IDF row of a count row, weighted as the vectorizer weights its
+        counts (analysis.document.TfidfSteps): the row vectorizer.transform
+        returns, value for value.
+        """
+        return self.steps.tfidf(count_row)
+
+    # ─────────────────────────────────────────────
+    # DOCUMENT ARTIFACTS
+    # ─────────────────────────────────────────────
+
+    def sections(self, text: str, paragraphs: list) -> list:
+        """segment_sections(text), from the paragraphs' headings."""
+        sections = []
+        current = None
+        seen_text = False
+        pos = 0
+        for paragraph in paragraphs:
+            if paragraph.section:
+                if current is not None:
+                    sections.append(Section(*current, pos))
+                elif seen_text:
+                    sections.append(Section('header', None, 0, 0, pos))
+                current = (paragraph.section, paragraph.heading, pos, pos + paragraph.body_offset)
+            seen_text = seen_text or not paragraph.blank
+            pos += len(paragraph.text) + 1
+
+        if current is not None:
+            sections.append(Section(*current, len(text)))
+        elif seen_text:
+            sections.append(Section('header', None, 0, 0, len(text)))
+        return sections
+
+    def ats_features(self, text: str, paragraphs: list, sections: list) -> dict:
+        """ATSMatcher.scan(text), from the paragraphs' partial features."""
+        matcher = self.matcher
+        keywords = frozenset().union(*(paragraph.keywords for paragraph in paragraphs))
+        if matcher.section_detection == 'headings':
+            headed = {section.name for section in sections if section.heading is not None}
+            sections_found = matcher.headed_sections(headed, keywords)
+        else:
+            sections_found = [section for section in matcher.section_keywords if section in keywords]
+        verbs = frozenset().union(*(paragraph.verbs for paragraph in paragraphs))
+        return {
+            'length': len(text),
+            'has_email': any(paragraph.has_email for paragraph in paragraphs),
+            'has_phone': any(paragraph.has_phone for paragraph in paragraphs),
+            'sections_found': sections_found,
+            'verb_count': sum(1 for v in matcher.action_verbs if v in verbs),
+            'special_chars': sum(paragraph.special_chars for paragraph in paragraphs),
+        }
+
+    def section_rows(self, paragraphs: list, sections: list) -> list:
+        """ResumeDocument section count rows, from the paragraphs' body counts."""
+        groups = []
+        group = []           # paragraphs before the first heading: the header
+        for paragraph in paragraphs:
+            if paragraph.section:
+                groups.append(group)
+                group = []
+            group.append(paragraph)
+        groups.append(group)
+        if not (sections and sections[0].name == 'header'):
+            groups = groups[1:]
+
+        rows = []
+        for section, group in zip(sections, groups):
+            counts = {}
+            for paragraph in group:
+                for column, count in paragraph.body_counts.items():
+                    counts[column] = counts.get(column, 0) + count
+            self.count_crossing([paragraph.body_terms for paragraph in group], counts)
+            rows.append((section, self.count_row(counts)))
+        return rows
+
+
+class LiveDocument(ResumeDocument):
+    """ResumeDocument whose section rows come from a LiveSession's paragraphs."""
+
+    def __init__(self, text: str, analyzer: ParagraphAnalyzer, paragraphs: list):
+        super().__init__(text, preprocessor=analyzer.preprocessor, vectorizer=analyzer.vectorizer)
+        self.analyzer = analyzer
+        self.paragraphs = paragraphs
+
+    def _section_rows(self):
+        if not self.analyzer.incremental:
+            return super()._section_rows()
+        rows = self.__dict__.get('section_rows')
+        if rows is None:
+            rows = self.analyzer.section_rows(self.paragraphs, self.sections)
+            self.__dict__['section_rows'] = rows
+        return rows
+
+
+class LiveSession:
+    """
+    The paragraphs of one resume being edited. update() is thread-safe;
+    concurrent submissions to the same session are analyzed one at a time.
+    """
+
+    def __init__(self, analyzer: ParagraphAnalyzer):
+        self.id = uuid.uuid4().hex
+        self.analyzer = analyzer
+        self.paragraphs = []
+        self.last_used = time.time()
+        self.updates = 0
+        self.last_analyzed = 0
+        self.last_update_ms = 0.0
+
+        self._by_text = {}           # paragraph text -> Paragraph, current text only
+        self._multiset = Counter()   # paragraph text -> occurrences in the current text
+        self._counts = {}            # column -> n-gram count within the current paragraphs
+        self._lock = threading.Lock()
+
+    def update(self, text: str) -> LiveDocument:
+        """
+        Re-analyzes `text`, reusing every paragraph unchanged since the last
+        update, and returns its document with `sections`, `ats_features`,
+        `processed` and `features` (and `term_counts`, when incremental)
+        filled in.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            analyzer = self.analyzer
+            texts = PARAGRAPH_BREAK.split(text)
+
+            by_text = {}
+            for paragraph_text in texts:
+                if paragraph_text not in by_text:
+                    by_text[paragraph_text] = (self._by_text.get(paragraph_text)
+                                               or analyzer.analyze(paragraph_text))
+            paragraphs = [by_text[paragraph_text] for paragraph_text in texts]
+            self.last_analyzed = sum(1 for t in by_text if t not in self._by_text)
+
+            # Keep the within-paragraph counts current: remove the paragraphs
+            # that went away, add the new ones
+            multiset = Counter(texts)
+            for paragraph_text, times in (self._multiset - multiset).items():
+                self._add_counts(self._by_text[paragraph_text].counts, -times)
+            for paragraph_text, times in (multiset - self._multiset).items():
+                self._add_counts(by_text[paragraph_text].counts, times)
+            self._by_text, self._multiset, self.paragraphs = by_text, multiset, paragraphs
+
+            document = LiveDocument(text, analyzer, paragraphs)
+            sections = analyzer.sections(text, paragraphs)
+            processed = ' '.join(p.processed for p in paragraphs if p.processed)
+            document.__dict__.update(
+                sections=sections,
+                ats_features=analyzer.ats_features(text, paragraphs, sections),
+                processed=processed,
+            )
+            if analyzer.incremental:
+                counts = dict(self._counts)
+                analyzer.count_crossing([paragraph.terms for paragraph in paragraphs], counts)
+                document.term_counts = analyzer.count_row(counts)
+                document.features = analyzer.tfidf(document.term_counts)
+            else:
+                document.features = analyzer.vectorizer.transform([processed])
+
+            self.updates += 1
+            self.last_used = time.time()
+            self.last_update_ms = (time.perf_counter() - start) * 1000
+            return document
+
+    def summary(self) -> dict:
+        return {
+            'session_id': self.id,
+            'paragraphs': len(self.paragraphs),
+            'paragraphs_reanalyzed': self.last_analyzed,
+            'update_ms': round(self.last_update_ms, 3),
+        }
+
+    def _add_counts(self, counts, times):
+        totals = self._counts
+        for column, count in counts.items():
+            total = totals.get(column, 0) + count * times
+            if total:
+                totals[column] = total
+            else:
+                del totals[column]
+
+
+class LiveSessionStore:
+    """
+    Live-edit sessions by id, least recently used first out, each dropped
+    after `ttl` seconds without an update.
+
+    Args:
+        preprocessor: ResumePreprocessor
+        vectorizer:   Fitted TF-IDF vectorizer
+        max_sessions: Sessions kept at once
+        ttl:          Idle seconds before a session expires
+    """
+
+    def __init__(self, preprocessor, vectorizer, max_sessions: int = 256, ttl: float = 1800.0):
+        self.analyzer = ParagraphAnalyzer(preprocessor, vectorizer)
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def get(self, session_id: str):
+        """The session, or None if it is unknown or has expired."""
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def create(self) -> LiveSession:
+        session = LiveSession(self.analyzer)
+        with self._lock:
+            self._expire()
+            self._sessions[session.id] = session
+            self.created += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+        return session
+
+    def get_or_create(self, session_id: str = None) -> LiveSession:
+        session = self.get(session_id) if session_id else None
+        return session if session is not None else self.create()
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._expire()
+            return {
+                'sessions': len(self._sessions),
+                'max_sessions': self.max_sessions,
+                'ttl_seconds': self.ttl,
+                'created': self.created,
+                'expired': self.expired,
+                'evicted': self.evicted,
+                'incremental_tfidf': self.analyzer.incremental,
+            }
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_used >= cutoff:
+                break
+            del self._sessions[session_id]
+            self.expired += 1
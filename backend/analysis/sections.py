@@ -0,0 +1,126 @@
+"""
+sections.py — Splitting extracted resume text into sections
+
+A one-pass line lexer: every line is checked once against a lexicon of
+heading phrases ("Work Experience", "EDUCATION:", "Skill Details", ...),
+either on its own or as the label of an inline "Skills: Python, SQL" line.
+Each heading opens a section that runs to the next one; text before the
+first heading is the 'header' (name, contact details). Offsets index into
+the original text, and the whole pass is linear in its length.
+"""
+
+import re
+from typing import List, NamedTuple
+
+# canonical section -> heading phrases (lowercase, single-spaced)
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'career summary', 'executive summary',
+                'objective', 'career objective', 'professional objective', 'profile',
+                'professional profile', 'personal profile', 'about me', 'about'],
+    'experience': ['experience', 'work experience', 'professional experience',
+                   'work history', 'employment', 'employment history', 'career history',
+                   'relevant experience', 'experience details', 'company details',
+                   'internships', 'internship', 'internship experience'],
+    'education': ['education', 'education details', 'educational background',
+                  'academic background', 'academic details', 'academics', 'qualifications',
+                  'qualification', 'educational qualification', 'educational qualifications',
+                  'academic qualification', 'academic qualifications'],
+    'skills': ['skills', 'technical skills', 'key skills', 'core skills', 'skill set',
+               'skillset', 'skill details', 'core competencies', 'competencies',
+               'proficiencies', 'areas of expertise', 'expertise', 'it skills',
+               'technical proficiencies', 'tools and technologies', 'technologies'],
+    'projects': ['projects', 'project', 'project details', 'academic projects',
+                 'key projects', 'personal projects'],
+    'certifications': ['certifications', 'certification', 'certificates', 'courses',
+                       'training', 'trainings', 'licenses and certifications'],
+    'achievements': ['achievements', 'awards', 'honors', 'honours', 'accomplishments',
+                     'awards and achievements'],
+    'languages': ['languages', 'languages known'],
+    'interests': ['interests', 'hobbies', 'hobbies and interests', 'extracurricular activities'],
+    'publications': ['publications', 'research'],
+    'volunteering': ['volunteering', 'volunteer experience', 'volunteer work'],
+    'personal': ['personal details', 'personal information', 'personal data',
+                 'contact', 'contact details', 'contact information'],
+    'references': ['references'],
+}
+
+HEADING_LOOKUP = {phrase: name for name, phrases in SECTION_HEADINGS.items() for phrase in phrases}
+
+# Longest heading label considered; longer lines are body text
+MAX_HEADING_CHARS = 48
+
+# Decoration around headings: bullets, rules, numbering punctuation, colons
+_STRIP_CHARS = ' \t\r\f\v•·▪■●◆►*-–—_=#>|:.'
+
+# Non-empty lines; blank runs are skipped by the regex engine
+_LINE = re.compile(r'[^\n]+')
+
+
+class Section(NamedTuple):
+    """
+    name:       Canonical section ('header' for text before the first heading)
+    heading:    Heading line as written, or None for the header
+    start:      Offset of the heading line
+    body_start: Offset of the section body (after the heading / inline label)
+    end:        Offset one past the section's last character
+    """
+    name: str
+    heading: str
+    start: int
+    body_start: int
+    end: int
+
+    def text(self, document: str) -> str:
+        return document[self.body_start:self.end]
+
+
+def heading_for(line: str):
+    """
+    Returns (section name, body offset within the line) if the line is a
+    heading, else (None, None). The body offset is past an inline label.
+    """
+    if len(line) > 4 * MAX_HEADING_CHARS:
+        return None, None
+    label, colon, _ = line.partition(':')
+    if colon and len(label) <= MAX_HEADING_CHARS:
+        name = HEADING_LOOKUP.get(_normalize(label))
+        if name:
+            return name, len(label) + 1
+    if len(line) <= MAX_HEADING_CHARS:
+        name = HEADING_LOOKUP.get(_normalize(line))
+        if name:
+            return name, len(line)
+    return None, None
+
+
+def _normalize(label):
+    return ' '.join(label.strip(_STRIP_CHARS).lower().replace('&', 'and').split())
+
+
+def segment_sections(text: str) -> List[Section]:
+    """
+    Splits text into sections in one pass over its lines.
+
+    Returns:
+        Sections in document order, covering the text end to end (an empty
+        or whitespace-only header is omitted)
+    """
+    sections = []
+    length = len(text)
+    current = None          # (name, heading, start, body_start)
+    for match in _LINE.finditer(text):
+        line = match.group()
+        name, body_offset = heading_for(line)
+        if name:
+            pos = match.start()
+            if current is not None:
+                sections.append(Section(*current, pos))
+            elif text[:pos].strip():
+                sections.append(Section('header', None, 0, 0, pos))
+            current = (name, line.strip(), pos, pos + body_offset)
+
+    if current is not None:
+        sections.append(Section(*current, length))
+    elif text.strip():
+        sections.append(Section('header', None, 0, 0, length))
+    return sections
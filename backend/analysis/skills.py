@@ -0,0 +1,124 @@
+"""
+skills.py — Skills extraction from a precompiled gazetteer
+
+The gazetteer (data/skills_gazetteer.json: category -> canonical skill ->
+aliases) is compiled once into a token trie. Extraction tokenizes the
+lowercase text with one regex pass and walks the trie from each token,
+keeping the longest phrase that matches ("Spring Boot" over "Spring",
+"Microsoft SQL Server" over "SQL"). Matching works on whole tokens, so it is
+case-insensitive and respects word boundaries ("Java" never matches inside
+"JavaScript"), and its cost does not grow with the size of the gazetteer.
+"""
+
+import json
+import os
+import re
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'data', 'skills_gazetteer.json')
+
+# Per-resume extraction budget, checked by benchmarks/bench_skills.py
+# against resumes of up to 50,000 characters
+EXTRACTION_BUDGET_MS = 5.0
+
+# Words with an optional leading dot (".net"), inner dots ("node.js",
+# "asp.net") and trailing +/# ("c++", "c#"); anything else separates tokens
+TOKEN_PATTERN = r'\.?[^\W_]+(?:\.[^\W_]+)*[+#]*'
+
+# Trie key marking the end of a phrase; never equal to a token
+_END = ''
+
+
+class SkillGazetteer:
+    """
+    Args:
+        gazetteer: category -> {canonical name: [aliases]}; each canonical
+                   name is matched as well as its aliases
+    """
+
+    def __init__(self, gazetteer: dict):
+        self._token = re.compile(TOKEN_PATTERN)
+        self.skills = []            # index -> (name, category)
+        self.trie = {}
+        for category, entries in gazetteer.items():
+            for name, aliases in entries.items():
+                index = len(self.skills)
+                self.skills.append((name, category))
+                for phrase in [name, *aliases]:
+                    self._insert(phrase, index)
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> 'SkillGazetteer':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _insert(self, phrase, index):
+        tokens = self._token.findall(phrase.lower())
+        if not tokens:
+            raise ValueError(f"Gazetteer phrase {phrase!r} has no tokens")
+        node = self.trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        # First entry wins when two skills share an alias
+        node.setdefault(_END, index)
+
+    def match_indices(self, text_lower: str) -> list:
+        """Skill indices of the longest non-overlapping matches, in text order."""
+        tokens = self._token.findall(text_lower)
+        root = self.trie
+        found = []
+        count = len(tokens)
+        i = 0
+        while i < count:
+            node = root.get(tokens[i])
+            if node is None:
+                i += 1
+                continue
+            match = node.get(_END)
+            end = i + 1
+            j = i + 1
+            while j < count:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    match = node[_END]
+                    end = j
+            if match is None:
+                i += 1
+                continue
+            found.append(match)
+            i = end
+        return found
+
+    def extract(self, text: str, text_lower: str = None) -> list:
+        """
+        Skills mentioned in the text.
+
+        Args:
+            text_lower: text.lower(), if the caller already has it
+
+        Returns:
+            [{'name', 'category', 'count'}], in order of first mention
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        counts = {}
+        for index in self.match_indices(text_lower):
+            counts[index] = counts.get(index, 0) + 1
+        return [{'name': self.skills[index][0], 'category': self.skills[index][1], 'count': count}
+                for index, count in counts.items()]
+
+
+SKILL_GAZETTEER = SkillGazetteer.load()
+
+
+def extract_skills(text):
+    """
+    Args:
+        text: Resume text, or a ResumeDocument whose lowercase copy is reused
+    """
+    if isinstance(text, str):
+        return SKILL_GAZETTEER.extract(text)
+    return text.skills
@@ -1,27 +1,199 @@
-from flask import Flask, request, jsonify, session
+from flask import Flask, Response, request, jsonify, session, stream_with_context
 from flask_cors import CORS
+import io
 import json
 import os
 import sys
-import PyPDF2
-import docx
 import re
 from datetime import datetime
 import secrets
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from models.predict import ResumePredictor
+from models.nltk_resources import load_resources
+from analysis.ats import check_ats_friendliness
+from analysis.cache import AnalysisCache
+from analysis.live import LiveSessionStore
+from analysis.skills import extract_skills
+from extraction.documents import extract_document, kind_for_filename
+from extraction.pdf_text import process_context
+from extraction.cache import ExtractionCache
+from extraction.sandbox import ParserSandbox, ParserBudgetExceeded, SandboxBusyError
+from extraction.spool import SpoolingRequest, SpooledUpload, UploadMemoryStats
+from extraction.chunked import (ChunkedUploadStore, ChunkedUploadError, UploadNotFoundError,
+                                TooManyUploadsError, DEFAULT_CHUNK_BYTES)
+from jobs import Job, JobQueue, QueueFullError
+from bulk_ingest import BatchSummary, iter_upload_items, run_batch
 from database import Database
 
 app = Flask(__name__)
+app.request_class = SpoolingRequest
 CORS(app, supports_credentials=True)
 app.secret_key = secrets.token_hex(16)
 
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024
 app.config['UPLOAD_EXTENSIONS'] = ['.pdf', '.docx']
 
-predictor = ResumePredictor()
+# Extraction cache: texts kept in memory, plus an optional on-disk store
+# (set EXTRACTION_CACHE_DIR to a folder to enable it)
+app.config['EXTRACTION_CACHE_ENTRIES'] = 256
+app.config['EXTRACTION_CACHE_DIR'] = None
+app.config['EXTRACTION_CACHE_MAX_BYTES'] = 200 * 1024 * 1024
+
+# Parser sandbox: uploads are parsed in recyclable worker processes with a
+# per-document deadline and memory budget (False = parse in-process). Each
+# worker splits large PDFs across PARSER_PAGE_WORKERS page processes of its
+# own, within that budget (None = the CPUs shared between the workers,
+# 1 = no page parallelism)
+app.config['PARSER_SANDBOX'] = True
+app.config['PARSER_WORKERS'] = 2
+app.config['PARSER_PAGE_WORKERS'] = None
+app.config['PARSER_TIMEOUT_SECONDS'] = 20
+app.config['PARSER_MAX_MEMORY_MB'] = 512
+
+# Uploads above this size are spooled to a temporary file and parsed from a
+# read-only memory map instead of an in-memory buffer
+app.config['UPLOAD_SPOOL_THRESHOLD'] = 1024 * 1024
+SpoolingRequest.spool_threshold = app.config['UPLOAD_SPOOL_THRESHOLD']
+
+# Async analysis jobs: worker threads, queued jobs accepted before the API
+# answers 503, and how long finished results stay available for polling
+app.config['JOB_WORKERS'] = 2
+app.config['JOB_QUEUE_SIZE'] = 32
+app.config['JOB_RESULT_TTL_SECONDS'] = 600
+
+# Role prediction: optional per-section weights (e.g. {'skills': 2.0,
+# 'header': 0}); None predicts from the whole text
+app.config['PREDICTION_SECTION_WEIGHTS'] = None
+
+# Bulk ingestion: files of a batch parsed at once, on threads (one per parser
+# worker keeps every sandbox process busy without queueing behind each other),
+# and processes the extracted texts of a batch are preprocessed on, together
+# (None = all cores, 1 = in the request's thread)
+app.config['BULK_WORKERS'] = app.config['PARSER_WORKERS']
+app.config['BULK_ANALYSIS_PROCESSES'] = None
+
+# Model artifacts exported as .npy (saved_models/forest/, vectorizer/) are
+# memory-mapped read-only, so every worker process serves from one shared
+# copy in the page cache; False reads a private copy into each worker
+app.config['MODEL_MMAP'] = True
+
+# Analysis cache: preprocessed text, TF-IDF row, role prediction and ATS
+# check, each cached on its own input; entries kept per layer and seconds an
+# entry stays valid. The model is read once at startup, so restart the app
+# after retraining or re-exporting it
+app.config['ANALYSIS_CACHE_ENTRIES'] = 1024
+app.config['ANALYSIS_CACHE_TTL_SECONDS'] = 3600
+
+# NLTK data comes from the local bundle (backend/nltk_data), filled at build
+# time with `python models/nltk_resources.py download`; startup fails fast
+# with that instruction when it is missing. True downloads the missing data
+# into the bundle once instead (needs network access; never on air-gapped
+# hosts)
+app.config['NLTK_DOWNLOAD_MISSING'] = False
+
+# Live-edit sessions for /api/analyze-resume: sessions kept at once (least
+# recently used dropped first) and idle seconds before one expires
+app.config['LIVE_SESSIONS'] = 256
+app.config['LIVE_SESSION_TTL_SECONDS'] = 1800
+
+# Resumable chunked uploads: where partial files are assembled (None = system
+# temp dir), how long an upload may sit without a new chunk before it is
+# garbage-collected, and how many may be in progress at once before new ones
+# get 429 (each preallocates its full size on disk)
+app.config['CHUNKED_UPLOAD_DIR'] = None
+app.config['CHUNKED_UPLOAD_TTL_SECONDS'] = 3600
+app.config['CHUNKED_UPLOAD_GC_INTERVAL_SECONDS'] = 300
+app.config['CHUNKED_UPLOAD_MAX_ACTIVE'] = 64
+
+# ========================================
+# STARTUP WARM-UP
+# ========================================
+# NLTK data is loaded from the local bundle once, before the app serves
+# anything (NLTK's lazy loaders are not safe under concurrent first use),
+# then a sample resume runs through every analysis stage so the first real
+# request does not pay for cold caches.
+WARMUP_RESUME = """Jane Doe
+jane.doe@example.com | +1 555 010 2000
+SUMMARY
+Data analyst who developed dashboards and managed reporting.
+EXPERIENCE
+Analyst, Example Corp: built SQL pipelines, improved Tableau reports.
+EDUCATION
+BSc Statistics, State University
+SKILLS
+Python, SQL, Excel, Tableau
+"""
+
+startup_times = {}
+_step_start = time.perf_counter()
+load_resources(download_missing=app.config['NLTK_DOWNLOAD_MISSING'])
+startup_times['nltk_data_ms'] = round((time.perf_counter() - _step_start) * 1000, 1)
+
+_step_start = time.perf_counter()
+predictor = ResumePredictor(mmap_mode='r' if app.config['MODEL_MMAP'] else None)
+startup_times['model_load_ms'] = round((time.perf_counter() - _step_start) * 1000, 1)
+
+_step_start = time.perf_counter()
+_warmup_document = predictor.document(WARMUP_RESUME)
+check_ats_friendliness(_warmup_document)
+extract_skills(_warmup_document)
+predictor.predict(_warmup_document)
+startup_times['warmup_ms'] = round((time.perf_counter() - _step_start) * 1000, 1)
+print(f"[STARTUP] NLTK data {startup_times['nltk_data_ms']} ms, "
+      f"model {startup_times['model_load_ms']} ms, warm-up {startup_times['warmup_ms']} ms")
+
+extraction_cache = ExtractionCache(
+    max_entries=app.config['EXTRACTION_CACHE_ENTRIES'],
+    disk_dir=app.config['EXTRACTION_CACHE_DIR'],
+    max_disk_bytes=app.config['EXTRACTION_CACHE_MAX_BYTES']
+)
+
+parser_sandbox = ParserSandbox(
+    workers=app.config['PARSER_WORKERS'],
+    timeout=app.config['PARSER_TIMEOUT_SECONDS'],
+    max_memory_bytes=app.config['PARSER_MAX_MEMORY_MB'] * 1024 * 1024,
+    page_workers=app.config['PARSER_PAGE_WORKERS']
+)
+
+upload_memory = UploadMemoryStats()
+
+analysis_cache = AnalysisCache(
+    predictor,
+    max_entries=app.config['ANALYSIS_CACHE_ENTRIES'],
+    ttl=app.config['ANALYSIS_CACHE_TTL_SECONDS']
+)
+
+# Preprocessing processes for bulk ingestion, started on the first batch
+bulk_processes = app.config['BULK_ANALYSIS_PROCESSES'] or os.cpu_count() or 1
+bulk_preprocess_pool = (predictor.preprocessor.preprocess_executor(bulk_processes, process_context())
+                        if bulk_processes > 1 else None)
+
+live_sessions = LiveSessionStore(
+    predictor.preprocessor,
+    predictor.vectorizer,
+    max_sessions=app.config['LIVE_SESSIONS'],
+    ttl=app.config['LIVE_SESSION_TTL_SECONDS']
+)
+
+job_queue = JobQueue(
+    workers=app.config['JOB_WORKERS'],
+    max_queued=app.config['JOB_QUEUE_SIZE'],
+    result_ttl=app.config['JOB_RESULT_TTL_SECONDS']
+)
+
+chunked_uploads = ChunkedUploadStore(
+    directory=app.config['CHUNKED_UPLOAD_DIR'],
+    max_upload_bytes=app.config['MAX_CONTENT_LENGTH'],
+    ttl=app.config['CHUNKED_UPLOAD_TTL_SECONDS'],
+    gc_interval=app.config['CHUNKED_UPLOAD_GC_INTERVAL_SECONDS'],
+    max_active=app.config['CHUNKED_UPLOAD_MAX_ACTIVE']
+)
+chunked_uploads.start()
+
+SHA256_HEX = re.compile(r'[0-9a-f]{64}')
 
 db = Database(
     server='localhost\\SQLEXPRESS',
@@ -252,212 +424,266 @@ def normalize_role(predicted_role: str) -> str:
     return 'DEFAULT'
 
 
-def extract_text_from_pdf(file):
-    try:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        total_pages = len(pdf_reader.pages)
-        max_pages = min(total_pages, 50)
-        for page_num in range(max_pages):
-            try:
-                page = pdf_reader.pages[page_num]
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            except Exception as e:
-                print(f"Warning: Could not extract text from page {page_num + 1}: {str(e)}")
-                continue
-        if not text.strip():
-            raise Exception("No text could be extracted from PDF.")
-        if len(text) > 50000:
-            text = text[:50000]
+def extract_resume_text(upload):
+    """
+    Extracts text from an uploaded PDF/DOCX (a SpooledUpload), serving repeat
+    uploads of the exact same bytes from the extraction cache.
+    """
+    key = extraction_cache.key_for(upload.digest, upload.kind)
+
+    text = extraction_cache.get(key)
+    if text is not None:
+        print(f"[CACHE] Extraction hit for {upload.kind.upper()} ({upload.size} bytes)")
         return text
-    except Exception as e:
-        raise Exception(f"Error reading PDF: {str(e)}")
 
+    parse_peak = None
+    if app.config['PARSER_SANDBOX']:
+        text, parse_peak = parser_sandbox.parse(upload.kind, upload.source)
+    else:
+        text = extract_document(upload.kind, upload.open(), path=upload.path)
+    extraction_cache.put(key, text)
+
+    upload_memory.record(upload, parse_peak)
+    print(f"[UPLOAD] {upload.size / 1024:.0f} KB "
+          f"{'spooled to disk' if upload.spooled else 'in memory'}, "
+          f"{upload.buffered_bytes / 1024:.0f} KB buffered"
+          + (f", parser peak +{parse_peak / (1024 * 1024):.1f} MB" if parse_peak is not None else ""))
+    return text
+
+
+def validate_resume_file():
+    """Returns (uploaded file, None) or (None, error message) for the 'file' form field."""
+    if 'file' not in request.files:
+        return None, 'No file uploaded'
+
+    file = request.files['file']
+    if file.filename == '':
+        return None, 'No file selected'
+
+    filename = file.filename.lower()
+    if not (filename.endswith('.pdf') or filename.endswith('.docx')):
+        return None, 'Invalid file format. Please upload PDF or DOCX'
+    return file, None
+
+
+def analyze_text(resume_text, document=None):
+    """
+    Runs the ATS check and, for ATS-friendly resumes, the role prediction,
+    both through the analysis cache. Returns the response body shared by the
+    upload and analyze endpoints.
+
+    Args:
+        document: ResumeDocument of resume_text already prepared by the
+                  caller (e.g. by a live-edit session); built here if None
+    """
+    if document is None:
+        document = predictor.document(resume_text)
+    ats_result = analysis_cache.ats(document)
+    if not ats_result['is_ats_friendly']:
+        return analysis_response(document, ats_result)
 
-def extract_text_from_docx(file):
     try:
-        doc = docx.Document(file)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        tables_text = []
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = [cell.text for cell in row.cells if cell.text.strip()]
-                if row_text:
-                    tables_text.append(' '.join(row_text))
-        text = '\n'.join(paragraphs + tables_text)
-        if not text.strip():
-            raise Exception("No text could be extracted from DOCX file.")
-        if len(text) > 50000:
-            text = text[:50000]
-        return text
+        prediction = analysis_cache.prediction(
+            document, section_weights=app.config['PREDICTION_SECTION_WEIGHTS']
+        )
     except Exception as e:
-        raise Exception(f"Error reading DOCX: {str(e)}")
-
-
-def check_ats_friendliness(text):
-    issues = []
-    suggestions = []
-    score = 100
-    details = {}
-
-    if len(text) < 300:
-        issues.append("Resume is too short")
-        suggestions.append("Add more details about your experience, skills, and achievements")
-        score -= 25
-        details['length'] = 'Poor'
-    elif len(text) < 800:
-        issues.append("Resume could be more detailed")
-        suggestions.append("Expand on your key achievements and responsibilities")
-        score -= 10
-        details['length'] = 'Fair'
-    else:
-        details['length'] = 'Good'
-
-    text_lower = text.lower()
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    phone_pattern = r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}'
-    has_email = bool(re.search(email_pattern, text))
-    has_phone = bool(re.search(phone_pattern, text))
-
-    if not has_email:
-        issues.append("Missing email address")
-        suggestions.append("Add a professional email address")
-        score -= 15
-    if not has_phone:
-        issues.append("Missing phone number")
-        suggestions.append("Include your contact phone number")
-        score -= 10
-    details['contact_info'] = 'Complete' if (has_email and has_phone) else 'Incomplete'
-
-    sections_found = []
-    sections_missing = []
-    section_keywords = {
-        'Experience': ['experience', 'work history', 'employment', 'professional experience'],
-        'Education': ['education', 'qualification', 'degree', 'academic', 'university', 'college'],
-        'Skills': ['skills', 'technical skills', 'competencies', 'proficiencies'],
-        'Summary': ['summary', 'objective', 'profile', 'about me']
-    }
-    for section, keywords in section_keywords.items():
-        if any(k in text_lower for k in keywords):
-            sections_found.append(section)
-        else:
-            sections_missing.append(section)
-            if section in ['Experience', 'Education', 'Skills']:
-                issues.append(f"Missing '{section}' section")
-                suggestions.append(f"Add a clear '{section}' section")
-                score -= 15
-
-    details['sections'] = f"{len(sections_found)}/4 key sections found"
-
-    action_verbs = ['developed', 'managed', 'led', 'created', 'implemented', 'designed',
-                    'analyzed', 'improved', 'coordinated', 'achieved', 'executed',
-                    'established', 'built', 'optimized', 'delivered', 'increased']
-    verb_count = sum(1 for v in action_verbs if v in text_lower)
-    if verb_count < 3:
-        issues.append("Limited use of strong action verbs")
-        suggestions.append("Use more action verbs like: developed, managed, led")
-        score -= 12
-        details['action_verbs'] = 'Poor'
-    elif verb_count < 6:
-        details['action_verbs'] = 'Fair'
-    else:
-        details['action_verbs'] = 'Good'
-
-    special_char_ratio = len(re.findall(r'[^\w\s.,;:!?()\-\'/\n]', text)) / max(len(text), 1)
-    if special_char_ratio > 0.08:
-        issues.append("Excessive special characters detected")
-        suggestions.append("Use simple bullet points, avoid tables and text boxes")
-        score -= 12
-        details['formatting'] = 'Complex (may cause ATS issues)'
-    else:
-        details['formatting'] = 'Simple (ATS-friendly)'
+        return analysis_response(document, ats_result, error=e)
+    return analysis_response(document, ats_result, prediction)
 
-    score = max(0, min(100, score))
-    is_ats_friendly = score >= 70
 
-    if score >= 85:
-        overall = "Excellent - Highly ATS-friendly"
-    elif score >= 70:
-        overall = "Good - ATS-friendly with minor improvements possible"
-    elif score >= 50:
-        overall = "Fair - Needs improvement"
-    else:
-        overall = "Poor - Major improvements needed"
-
-    return {
-        'is_ats_friendly': is_ats_friendly,
-        'score': score,
-        'overall': overall,
-        'issues': issues,
-        'suggestions': suggestions,
-        'details': details
+def analyze_texts(resume_texts):
+    """
+    analyze_text for a batch of texts: the ATS-friendly ones are preprocessed
+    together on the bulk preprocessing processes and their roles predicted in
+    one pass over the forest. Returns the response bodies in order.
+    """
+    documents = [predictor.document(text) for text in resume_texts]
+    ats_results = [analysis_cache.ats(document) for document in documents]
+    friendly = [document for document, ats_result in zip(documents, ats_results)
+                if ats_result['is_ats_friendly']]
+
+    predictions, error = {}, None
+    if friendly:
+        try:
+            analysis_cache.processed_many(friendly, lambda texts: list(
+                predictor.preprocessor.preprocess_many(
+                    texts, workers=bulk_processes, executor=bulk_preprocess_pool,
+                    chunk_size=max(1, -(-len(texts) // bulk_processes))
+                )
+            ))
+            batch = analysis_cache.prediction_many(
+                friendly, section_weights=app.config['PREDICTION_SECTION_WEIGHTS']
+            )
+            predictions = {id(document): prediction for document, prediction in zip(friendly, batch)}
+        except Exception as e:
+            error = e
+
+    return [analysis_response(document, ats_result, predictions.get(id(document)),
+                              error if ats_result['is_ats_friendly'] else None)
+            for document, ats_result in zip(documents, ats_results)]
+
+
+def analysis_response(document, ats_result, prediction=None, error=None):
+    """Response body of analyze_text from the ATS result and the prediction (or its error)."""
+    response = {'ats_check': ats_result}
+    if error is not None:
+        print(f"Analysis error: {str(error)}")
+        response['analysis_error'] = f"Could not analyze resume: {str(error)}"
+        return response
+    if prediction is None:
+        return response
+
+    raw_role = prediction['predicted_role']
+
+    # ✅ FIX: Normalize the role before storing in session
+    normalized_role = normalize_role(raw_role)
+
+    print(f"[RESUME] Raw predicted role: '{raw_role}'")
+    print(f"[RESUME] Normalized role for DB: '{normalized_role}'")
+
+    questions = interview_questions.get(raw_role, interview_questions['DEFAULT'])
+
+    response['analysis'] = {
+        'predicted_role': raw_role,
+        'normalized_role': normalized_role,
+        'confidence': prediction['confidence'],
+        'top_3_roles': prediction['top_3_roles'],
+        'skills': extract_skills(document),
+        'interview_questions': questions
     }
+    return response
 
 
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    return jsonify({'status': 'ok', 'message': 'API is running'})
+def remember_prediction(response):
+    """Stores the predicted role in the session for the MCQ test endpoints."""
+    analysis = response.get('analysis') if response else None
+    if analysis:
+        session['predicted_job_role'] = analysis['normalized_role']
+        session['raw_predicted_role'] = analysis['predicted_role']
+        session['prediction_confidence'] = analysis['confidence']
 
 
-@app.route('/api/upload-resume', methods=['POST'])
-def upload_resume():
+def extract_upload(upload):
+    """
+    Text of one SpooledUpload.
+
+    Returns:
+        (resume text, None), or (None, (error body, HTTP status))
+    """
     try:
-        if 'file' not in request.files:
-            return jsonify({'error': 'No file uploaded'}), 400
+        return extract_resume_text(upload), None
+    except ParserBudgetExceeded as e:
+        print(f"[SANDBOX] Rejected {upload.kind.upper()} upload: {str(e)}")
+        return None, ({'error': str(e)}, 422)
+    except SandboxBusyError as e:
+        return None, ({'error': str(e)}, 503)
+    except Exception as e:
+        return None, ({'error': str(e)}, 400)
 
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
 
-        filename = file.filename.lower()
-        if not (filename.endswith('.pdf') or filename.endswith('.docx')):
-            return jsonify({'error': 'Invalid file format. Please upload PDF or DOCX'}), 400
+def process_upload(upload, progress=None):
+    """
+    Extracts and analyzes one SpooledUpload.
 
-        try:
-            if filename.endswith('.pdf'):
-                resume_text = extract_text_from_pdf(file)
-            else:
-                resume_text = extract_text_from_docx(file)
-        except Exception as e:
-            return jsonify({'error': str(e)}), 400
+    Args:
+        upload:   The upload to process
+        progress: Optional callback(stage, percent)
 
+    Returns:
+        (response body, HTTP status)
+    """
+    if progress:
+        progress('extracting', 20)
+    resume_text, error = extract_upload(upload)
+    if error:
+        return error
+
+    if progress:
+        progress('analyzing', 60)
+    return analyze_extracted_text(resume_text)
+
+
+def analyze_extracted_text(resume_text):
+    """Response body and HTTP status for text extracted from an uploaded file."""
+    if not resume_text or len(resume_text.strip()) < 50:
+        return {'error': 'Could not extract sufficient text from file.'}, 400
+
+    response = analyze_text(resume_text)
+    response['resume_text_length'] = len(resume_text)
+    return response, 200
+
+
+def analyze_extracted_texts(resume_texts):
+    """
+    analyze_extracted_text for the extracted texts of a bulk ingestion batch,
+    analyzed together (analyze_texts)
+    """
+    results = [None] * len(resume_texts)
+    valid = []
+    for i, resume_text in enumerate(resume_texts):
         if not resume_text or len(resume_text.strip()) < 50:
-            return jsonify({'error': 'Could not extract sufficient text from file.'}), 400
+            results[i] = ({'error': 'Could not extract sufficient text from file.'}, 400)
+        else:
+            valid.append(i)
 
-        ats_result = check_ats_friendliness(resume_text)
-        response = {'ats_check': ats_result, 'resume_text_length': len(resume_text)}
+    for i, response in zip(valid, analyze_texts([resume_texts[i] for i in valid])):
+        response['resume_text_length'] = len(resume_texts[i])
+        results[i] = (response, 200)
+    return results
 
-        if ats_result['is_ats_friendly']:
-            try:
-                prediction = predictor.predict(resume_text)
-                raw_role = prediction['predicted_role']
 
-                # ✅ FIX: Normalize the role before storing in session
-                normalized_role = normalize_role(raw_role)
+@app.route('/api/health', methods=['GET'])
+def health_check():
+    return jsonify({'status': 'ok', 'message': 'API is running', 'startup': startup_times})
+
 
-                print(f"[RESUME] Raw predicted role: '{raw_role}'")
-                print(f"[RESUME] Normalized role for DB: '{normalized_role}'")
+@app.route('/api/upload-resume', methods=['POST'])
+def upload_resume():
+    try:
+        file, error = validate_resume_file()
+        if error:
+            return jsonify({'error': error}), 400
 
-                session['predicted_job_role'] = normalized_role
-                session['raw_predicted_role'] = raw_role
-                session['prediction_confidence'] = prediction['confidence']
+        with SpooledUpload(file, kind_for_filename(file.filename.lower()),
+                           threshold=app.config['UPLOAD_SPOOL_THRESHOLD']) as upload:
+            response, status = process_upload(upload)
 
-                questions = interview_questions.get(raw_role, interview_questions['DEFAULT'])
+        remember_prediction(response)
+        return jsonify(response), status
 
-                response['analysis'] = {
-                    'predicted_role': raw_role,
-                    'normalized_role': normalized_role,
-                    'confidence': prediction['confidence'],
-                    'top_3_roles': prediction['top_3_roles'],
-                    'interview_questions': questions
-                }
-            except Exception as e:
-                print(f"Analysis error: {str(e)}")
-                response['analysis_error'] = f"Could not analyze resume: {str(e)}"
+    except Exception as e:
+        print(f"Server error: {str(e)}")
+        return jsonify({'error': f"Server error: {str(e)}"}), 500
 
-        return jsonify(response), 200
+
+@app.route('/api/resume-precheck', methods=['POST'])
+def resume_precheck():
+    """
+    Lets the client skip the upload of a document the server has already read.
+    Expects {"sha256": <hex digest of the file>, "filename": <name>}; answers
+    with the /api/upload-resume body plus "cached": true, or with
+    {"cached": false, "upload_required": true}.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        digest = str(data.get('sha256', '')).strip().lower()
+        filename = str(data.get('filename', '')).lower()
+
+        if not SHA256_HEX.fullmatch(digest):
+            return jsonify({'error': 'A SHA-256 hex digest is required'}), 400
+        if not (filename.endswith('.pdf') or filename.endswith('.docx')):
+            return jsonify({'error': 'Invalid file format. Please upload PDF or DOCX'}), 400
+
+        kind = kind_for_filename(filename)
+        resume_text = extraction_cache.get(extraction_cache.key_for(digest, kind))
+        if resume_text is None:
+            return jsonify({'cached': False, 'upload_required': True}), 200
+
+        print(f"[PRECHECK] Known {kind.upper()} {digest[:12]}…, skipping upload")
+        response, status = analyze_extracted_text(resume_text)
+        response['cached'] = True
+        remember_prediction(response)
+        return jsonify(response), status
 
     except Exception as e:
         print(f"Server error: {str(e)}")
@@ -466,45 +692,277 @@ def upload_resume():
 
 @app.route('/api/analyze-resume', methods=['POST'])
 def analyze_resume():
+    """
+    Analyzes pasted resume text. For live editing, send "live_session": true
+    with the first text and the returned live_session.session_id as
+    "live_session_id" with every later one: only the paragraphs changed
+    since the previous submission are re-analyzed. An unknown or expired id
+    starts a new session.
+    """
     try:
         data = request.get_json()
         resume_text = data.get('resume_text', '')
         if not resume_text:
             return jsonify({'error': 'No resume text provided'}), 400
 
-        ats_result = check_ats_friendliness(resume_text)
-        response = {'ats_check': ats_result}
+        live_session_id = data.get('live_session_id')
+        if live_session_id or data.get('live_session'):
+            live = live_sessions.get_or_create(str(live_session_id or ''))
+            response = analyze_text(resume_text, live.update(resume_text))
+            response['live_session'] = live.summary()
+        else:
+            response = analyze_text(resume_text)
+        remember_prediction(response)
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/live-sessions', methods=['GET'])
+def live_sessions_stats():
+    return jsonify({'success': True, 'stats': live_sessions.stats()})
+
+
+# ========================================
+# ASYNC RESUME JOBS
+# ========================================
+
+def process_source(kind, source, progress=None):
+    """
+    process_upload() for a document given as bytes or as a file path,
+    for work that outlives the request it arrived with.
+    """
+    file = open(source, 'rb') if isinstance(source, str) else io.BytesIO(source)
+    with file, SpooledUpload(file, kind,
+                             threshold=app.config['UPLOAD_SPOOL_THRESHOLD']) as upload:
+        return process_upload(upload, progress=progress)
 
-        if ats_result['is_ats_friendly']:
+
+def extract_source(kind, source):
+    """extract_upload() for a document given as bytes or as a file path (bulk ingestion)."""
+    file = open(source, 'rb') if isinstance(source, str) else io.BytesIO(source)
+    with file, SpooledUpload(file, kind,
+                             threshold=app.config['UPLOAD_SPOOL_THRESHOLD']) as upload:
+        return extract_upload(upload)
+
+
+def run_resume_job(job, kind, source):
+    """
+    Job body for /api/upload-resume-async. `source` is either the upload
+    bytes or a spool file handed over by the request; the job deletes it.
+    """
+    try:
+        return process_source(kind, source, progress=job.update)
+    finally:
+        if isinstance(source, str):
             try:
-                prediction = predictor.predict(resume_text)
-                raw_role = prediction['predicted_role']
+                os.remove(source)
+            except OSError:
+                pass
 
-                # ✅ FIX: Normalize role
-                normalized_role = normalize_role(raw_role)
 
-                session['predicted_job_role'] = normalized_role
-                session['raw_predicted_role'] = raw_role
-                session['prediction_confidence'] = prediction['confidence']
+@app.route('/api/upload-resume-async', methods=['POST'])
+def upload_resume_async():
+    try:
+        file, error = validate_resume_file()
+        if error:
+            return jsonify({'error': error}), 400
+
+        # The request deletes its spool files when it closes, so large
+        # uploads are handed over to the job instead of being copied.
+        stream = file.stream
+        name = getattr(stream, 'name', None)
+        if isinstance(name, str) and request.release_spool_file(name):
+            stream.flush()
+            source = name
+        else:
+            stream.seek(0)
+            source = stream.read()
 
-                questions = interview_questions.get(raw_role, interview_questions['DEFAULT'])
+        try:
+            job = job_queue.submit(run_resume_job, kind_for_filename(file.filename.lower()), source)
+        except QueueFullError as e:
+            if isinstance(source, str):
+                os.remove(source)
+            return jsonify({'error': str(e), 'queue_depth': job_queue.depth}), 503, {'Retry-After': '5'}
 
-                response['analysis'] = {
-                    'predicted_role': raw_role,
-                    'normalized_role': normalized_role,
-                    'confidence': prediction['confidence'],
-                    'top_3_roles': prediction['top_3_roles'],
-                    'interview_questions': questions
-                }
-            except Exception as e:
-                response['analysis_error'] = f"Could not analyze resume: {str(e)}"
+        print(f"[JOBS] Queued {job.id} for '{file.filename}' (depth {job_queue.depth})")
+        return jsonify({
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': f"/api/resume-jobs/{job.id}",
+            'queue_depth': job_queue.depth
+        }), 202
 
-        return jsonify(response), 200
+    except Exception as e:
+        print(f"Server error: {str(e)}")
+        return jsonify({'error': f"Server error: {str(e)}"}), 500
+
+
+@app.route('/api/resume-jobs/<job_id>', methods=['GET'])
+def resume_job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+
+    data = job.to_dict()
+    data['queue_depth'] = job_queue.depth
+    if job.status == Job.DONE:
+        remember_prediction(job.result)
+    return jsonify(data), 200
 
+
+@app.route('/api/resume-jobs', methods=['GET'])
+def resume_jobs_stats():
+    return jsonify({'success': True, 'stats': job_queue.stats()})
+
+
+# ========================================
+# RESUMABLE CHUNKED UPLOADS
+# ========================================
+# POST   /api/chunked-uploads                      {filename, size, sha256, chunk_size?}
+# PUT    /api/chunked-uploads/<id>/chunks/<index>  raw chunk bytes (X-Chunk-SHA256 optional)
+# GET    /api/chunked-uploads/<id>                 received / missing chunks, to resume
+# POST   /api/chunked-uploads/<id>/finalize        {async?} → same body as /api/upload-resume
+# DELETE /api/chunked-uploads/<id>
+#
+# sha256 is the digest of the whole file, checked on finalize; X-Chunk-SHA256
+# catches a corrupt chunk on arrival, so only that chunk has to be resent.
+
+def chunked_error(e):
+    if isinstance(e, TooManyUploadsError):
+        return jsonify({'error': str(e)}), 429, {'Retry-After': '30'}
+    status = 404 if isinstance(e, UploadNotFoundError) else 400
+    return jsonify({'error': str(e)}), status
+
+
+@app.route('/api/chunked-uploads', methods=['POST'])
+def initiate_chunked_upload():
+    try:
+        data = request.get_json(silent=True) or {}
+        filename = str(data.get('filename', ''))
+        lower = filename.lower()
+        if not (lower.endswith('.pdf') or lower.endswith('.docx')):
+            return jsonify({'error': 'Invalid file format. Please upload PDF or DOCX'}), 400
+
+        upload = chunked_uploads.initiate(
+            filename, kind_for_filename(lower), data.get('size'), data.get('sha256'),
+            chunk_size=data.get('chunk_size', DEFAULT_CHUNK_BYTES)
+        )
+        print(f"[UPLOADS] Chunked upload {upload.id} started: '{filename}', "
+              f"{upload.size} bytes in {upload.chunk_count} chunk(s)")
+        return jsonify(upload.to_dict()), 201
+
+    except ChunkedUploadError as e:
+        return chunked_error(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/chunked-uploads/<upload_id>/chunks/<int:index>', methods=['PUT'])
+def put_upload_chunk(upload_id, index):
+    try:
+        if request.content_length is not None and request.content_length > chunked_uploads.max_chunk_bytes:
+            return jsonify({'error': 'Chunk is too large'}), 400
+        upload = chunked_uploads.put_chunk(
+            upload_id, index, request.get_data(cache=False),
+            checksum=request.headers.get('X-Chunk-SHA256')
+        )
+        return jsonify({
+            'upload_id': upload.id,
+            'chunk': index,
+            'received_chunks': len(upload.received),
+            'chunk_count': upload.chunk_count,
+            'complete': len(upload.received) == upload.chunk_count
+        }), 200
+
+    except ChunkedUploadError as e:
+        return chunked_error(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/chunked-uploads/<upload_id>', methods=['GET'])
+def chunked_upload_status(upload_id):
+    try:
+        return jsonify(chunked_uploads.get(upload_id).to_dict()), 200
+    except ChunkedUploadError as e:
+        return chunked_error(e)
+
+
+@app.route('/api/chunked-uploads/<upload_id>', methods=['DELETE'])
+def abort_chunked_upload(upload_id):
+    try:
+        chunked_uploads.abort(upload_id)
+        return jsonify({'success': True}), 200
+    except ChunkedUploadError as e:
+        return chunked_error(e)
+
+
+@app.route('/api/chunked-uploads/<upload_id>/finalize', methods=['POST'])
+def finalize_chunked_upload(upload_id):
+    try:
+        data = request.get_json(silent=True) or {}
+        upload = chunked_uploads.finalize(upload_id)
+        print(f"[UPLOADS] Chunked upload {upload.id} assembled ({upload.size} bytes)")
+
+        if data.get('async'):
+            try:
+                job = job_queue.submit(run_resume_job, upload.kind, upload.path)
+            except QueueFullError as e:
+                os.remove(upload.path)
+                return jsonify({'error': str(e), 'queue_depth': job_queue.depth}), 503, {'Retry-After': '5'}
+            return jsonify({
+                'job_id': job.id,
+                'status': job.status,
+                'status_url': f"/api/resume-jobs/{job.id}",
+                'queue_depth': job_queue.depth
+            }), 202
+
+        try:
+            response, status = process_source(upload.kind, upload.path)
+        finally:
+            os.remove(upload.path)
+        remember_prediction(response)
+        return jsonify(response), status
+
+    except ChunkedUploadError as e:
+        return chunked_error(e)
+    except Exception as e:
+        print(f"Server error: {str(e)}")
+        return jsonify({'error': f"Server error: {str(e)}"}), 500
+
+
+# ========================================
+# BULK INGESTION
+# ========================================
+
+@app.route('/api/upload-resumes-batch', methods=['POST'])
+def upload_resumes_batch():
+    """
+    Accepts a zip archive and/or a list of PDF/DOCX files ('files' or 'file'
+    fields) and streams one NDJSON line per file as its analysis batch
+    finishes, followed by a summary line.
+    """
+    files = request.files.getlist('files') + request.files.getlist('file')
+    if not files:
+        return jsonify({'error': 'No file uploaded'}), 400
+
+    items = iter_upload_items(files, threshold=app.config['UPLOAD_SPOOL_THRESHOLD'])
+
+    def generate():
+        summary = BatchSummary()
+        for line in run_batch(items, extract_source, analyze_extracted_texts,
+                              workers=app.config['BULK_WORKERS']):
+            summary.add(line)
+            yield json.dumps(line) + '\n'
+        print(f"[BATCH] {summary.files} files: {summary.succeeded} ok, {summary.failed} failed")
+        yield json.dumps(summary.to_dict()) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 # ========================================
 # MCQ TEST ENDPOINTS
 # ========================================
@@ -621,6 +1079,25 @@ def get_test_history():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/extraction-cache-stats', methods=['GET'])
+def extraction_cache_stats():
+    return jsonify({'success': True, 'stats': extraction_cache.stats()})
+
+
+@app.route('/api/analysis-cache-stats', methods=['GET'])
+def analysis_cache_stats():
+    return jsonify({'success': True, 'stats': analysis_cache.stats()})
+
+
+@app.route('/api/parser-stats', methods=['GET'])
+def parser_stats():
+    return jsonify({
+        'success': True,
+        'stats': parser_sandbox.stats(),
+        'upload_memory': upload_memory.stats()
+    })
+
+
 # ✅ NEW: Debug endpoint to check what role was detected
 @app.route('/api/debug-role', methods=['GET'])
 def debug_role():
@@ -644,10 +1121,20 @@ if __name__ == '__main__':
     print("\n🔗 Endpoints:")
     print("  GET  /api/health")
     print("  POST /api/upload-resume")
-    print("  POST /api/analyze-resume")
+    print("  POST /api/resume-precheck")
+    print("  POST /api/analyze-resume  (live_session / live_session_id for live editing)")
+    print("  GET  /api/live-sessions")
+    print("  POST /api/upload-resume-async")
+    print("  GET  /api/resume-jobs/<job_id>")
+    print("  GET  /api/resume-jobs")
+    print("  POST /api/upload-resumes-batch")
+    print("  POST /api/chunked-uploads  (+ PUT …/chunks/<n>, POST …/finalize)")
     print("  GET  /api/get-mcq-test")
     print("  POST /api/submit-test")
     print("  GET  /api/get-test-history")
+    print("  GET  /api/extraction-cache-stats")
+    print("  GET  /api/analysis-cache-stats")
+    print("  GET  /api/parser-stats")
     print("  GET  /api/debug-role          ← Use this to debug role issues")
     print("=" * 60)
     app.run(debug=True, port=5000, host='0.0.0.0')
\ No newline at end of file
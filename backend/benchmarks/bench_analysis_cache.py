@@ -0,0 +1,146 @@
+"""
+bench_analysis_cache.py — Layered analysis cache vs analyzing every request
+
+Run from the backend folder:  python benchmarks/bench_analysis_cache.py
+
+Uses the trained model when it loads, otherwise the stand-in forest of
+bench_predict.py. Replays a stream of requests over a pool of synthetic
+resumes, the popular ones submitted far more often (Zipf-like), and a share
+of them near-identical to an earlier submission: another phone number or
+email address, doubled spaces, or the name line re-cased. Each request goes
+through what analyze_text runs (ATS check, then the role prediction for
+ATS-friendly resumes) once without a cache and once through AnalysisCache.
+Reports latency, per-layer hit rates and whether every response is the same,
+then checks that a model version change invalidates the model's layers
+(and keeps the ATS results). Needs the
+NLTK stopwords and WordNet data. Exit status is 1 on any mismatch.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.bench_predict import load_predictor
+from benchmarks.corpus import resume_texts
+from analysis.ats import check_ats_friendliness
+from analysis.cache import LAYERS, AnalysisCache
+
+RESUMES = 300
+REQUESTS = 3000
+NEAR_DUPLICATES = 0.3
+
+
+def normalize(role):
+    return role.upper().replace(' ', '-')
+
+
+def near_duplicate(text, rng):
+    """The same resume, differing only in what preprocessing throws away."""
+    lines = text.split('\n')
+    kind = rng.randrange(4)
+    if kind == 0:
+        lines[1] = lines[1].split('|')[0] + f"| +1-555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    elif kind == 1:
+        lines[1] = f"candidate{rng.randint(1, 99)}@example.org |" + lines[1].split('|')[1]
+    elif kind == 2:
+        lines = [line.replace(', ', ',  ') for line in lines]
+    else:
+        lines[0] = lines[0].title()
+    return '\n'.join(lines)
+
+
+def request_stream(texts, rng):
+    weights = [1 / (rank + 1) for rank in range(len(texts))]
+    for _ in range(REQUESTS):
+        text = rng.choices(texts, weights)[0]
+        yield near_duplicate(text, rng) if rng.random() < NEAR_DUPLICATES else text
+
+
+def analyze_uncached(predictor, text):
+    document = predictor.document(text)
+    response = {'ats_check': check_ats_friendliness(document)}
+    if response['ats_check']['is_ats_friendly']:
+        prediction = predictor.predict(document)
+        response['prediction'] = dict(prediction, normalized_role=normalize(prediction['predicted_role']))
+    return response
+
+
+def analyze_cached(predictor, cache, text):
+    document = predictor.document(text)
+    response = {'ats_check': cache.ats(document)}
+    if response['ats_check']['is_ats_friendly']:
+        prediction = cache.prediction(document)
+        response['prediction'] = dict(prediction, normalized_role=normalize(prediction['predicted_role']))
+    return response
+
+
+def timed_stream(stream, analyze):
+    times, responses = [], []
+    for text in stream:
+        start = time.perf_counter()
+        responses.append(analyze(text))
+        times.append(time.perf_counter() - start)
+    return times, responses
+
+
+def main():
+    try:
+        predictor, source = load_predictor()
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+
+    stream = list(request_stream(resume_texts(RESUMES, seed=95), random.Random(0)))
+    cache = AnalysisCache(predictor)
+    analyze_uncached(predictor, stream[0])
+
+    uncached_times, expected = timed_stream(stream, lambda text: analyze_uncached(predictor, text))
+    cached_times, responses = timed_stream(stream, lambda text: analyze_cached(predictor, cache, text))
+
+    print("=" * 72)
+    print("ANALYSIS CACHE BENCHMARK")
+    print("=" * 72)
+    print(f"Model: {source}")
+    print(f"Requests: {REQUESTS} over {RESUMES} synthetic resumes, "
+          f"{NEAR_DUPLICATES:.0%} near-identical to an original, {len(set(stream))} distinct texts")
+    print()
+
+    print(f"{'':<14} {'Total s':>9} {'p50 ms':>9} {'p95 ms':>9} {'Speedup':>9}")
+    print("-" * 72)
+    for label, times in (('uncached', uncached_times), ('cached', cached_times)):
+        print(f"{label:<14} {sum(times):>9.2f} {statistics.median(times) * 1000:>9.2f} "
+              f"{statistics.quantiles(times, n=20)[-1] * 1000:>9.2f} "
+              f"{sum(uncached_times) / sum(times):>8.1f}x")
+
+    stats = cache.stats()
+    print()
+    print(f"{'Layer':<14} {'Hits':>9} {'Misses':>9} {'Hit rate':>9} {'Entries':>9}")
+    print("-" * 72)
+    for name in LAYERS:
+        layer = stats['layers'][name]
+        print(f"{name:<14} {layer['hits']:>9} {layer['misses']:>9} {layer['hit_rate']:>9.1%} "
+              f"{layer['entries']:>9}")
+
+    mismatches = sum(a != b for a, b in zip(responses, expected))
+    print(f"\nResponses identical to the uncached path: "
+          f"{'yes' if not mismatches else f'NO ({mismatches})'}")
+
+    predictor.model_version = f"{predictor.model_version}-retrained"
+    misses = stats['layers']['processed']['misses']
+    analyze_cached(predictor, cache, stream[0])
+    after = cache.stats()
+    invalidated = (after['invalidations'] == 1
+                   and after['layers']['processed']['misses'] == misses + 1
+                   and after['layers']['processed']['entries'] == 1
+                   and after['layers']['ats']['entries'] == stats['layers']['ats']['entries'])
+    print(f"Model version change clears the model's layers only: {'yes' if invalidated else 'NO'}")
+    return 1 if mismatches or not invalidated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+bench_ats.py — Precompiled ATS matcher vs the original regex-based check
+
+Run from the backend folder:  python benchmarks/bench_ats.py
+
+First checks that the matcher in keyword mode (the original section rule)
+returns results identical to the regex check on a regression corpus
+(synthetic resumes plus variants without contact details, upper-cased,
+non-ASCII and symbol-heavy) and counts the documents whose result changes
+with heading-based section detection, then times both on 50,000-character
+inputs.
+
+Last, it times the keyword and verb lookup: the matcher's substring searches
+(one C-level `in` per keyword and verb, each stopping at its first hit)
+against a single-pass automaton over all of them (a regex built from their
+trie, scanned once with a lookahead at every position). The automaton is
+checked to find the same terms. The matcher keeps the substring searches
+because they are the faster of the two on resume text.
+"""
+
+import os
+import re
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_text, resume_texts
+from analysis.ats import LEGACY_ATS_MATCHER, check_ats_friendliness, check_ats_friendliness_regex
+from analysis.ats_rules import ACTION_VERBS, ATS_SCORER, SECTION_KEYWORDS
+
+TARGET_CHARS = 50000
+REPEATS = 20
+
+
+def variants(text):
+    yield text
+    yield text.upper()
+    yield text.replace('@', ' (at) ')
+    yield re.sub(r'\d', 'x', text)
+    yield text[:250]
+    yield text[:600]
+    yield '• ' + text.replace('\n- ', '\n★ ') + ' — Zürich, São Paulo'
+    yield ''.join(c if c.isspace() else '#' for c in text[:400]) + text
+
+
+def regression_corpus():
+    for text in resume_texts(200, seed=11):
+        yield from variants(text)
+
+
+def long_text(seed, strip_contact=False):
+    text = ''
+    while len(text) < TARGET_CHARS:
+        text += resume_text(seed=seed, jobs=6) + '\n'
+        seed += 1
+    text = text[:TARGET_CHARS]
+    if strip_contact:
+        text = re.sub(r'\d', 'x', text.replace('@', ' at '))
+    return text
+
+
+def check_keywords(text):
+    return ATS_SCORER.score(LEGACY_ATS_MATCHER.scan(text))
+
+
+def trie_pattern(terms):
+    """Regex matching any of `terms`, built from their trie, longest match first."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[None] = {}
+
+    def pattern(node):
+        branches = [re.escape(ch) + pattern(child)
+                    for ch, child in sorted(item for item in node.items() if item[0] is not None)]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if None in node else body
+
+    return pattern(trie)
+
+
+def automaton(terms):
+    """
+    terms_found(text_lower) in one scan: the longest term starting at each
+    position, plus every term inside it.
+    """
+    scanner = re.compile(f"(?=({trie_pattern(terms)}))")
+    implied = {term: frozenset(other for other in terms if other in term) for term in terms}
+
+    def terms_found(text_lower):
+        found = set()
+        for match in scanner.finditer(text_lower):
+            if match.group(1) not in found:
+                found |= implied[match.group(1)]
+        return found
+
+    return terms_found
+
+
+def substring_terms(terms):
+    """The same, as the matcher looks terms up: one substring search each."""
+    return lambda text_lower: {term for term in terms if term in text_lower}
+
+
+def best_of(fn, arg, repeats=REPEATS):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print("=" * 72)
+    print("ATS CHECK BENCHMARK")
+    print("=" * 72)
+
+    checked = mismatches = changed = 0
+    for text in regression_corpus():
+        checked += 1
+        expected = check_ats_friendliness_regex(text)
+        if check_keywords(text) != expected:
+            mismatches += 1
+        if check_ats_friendliness(text) != expected:
+            changed += 1
+    print(f"Regression corpus: {checked} documents, {mismatches} mismatches in keyword mode, "
+          f"{changed} changed by heading detection")
+    print()
+
+    cases = [
+        ('typical resume text', long_text(0)),
+        ('no email / phone', long_text(0, strip_contact=True)),
+        ('non-ASCII text', long_text(0).replace('- ', '• ')),
+    ]
+    print(f"{'50k-char input':<22} {'Regex ms':>9} {'Keywords ms':>12} {'Speedup':>8} "
+          f"{'Headings ms':>12}  Same")
+    print("-" * 72)
+    for label, text in cases:
+        regex_s = best_of(check_ats_friendliness_regex, text)
+        matcher_s = best_of(check_keywords, text)
+        headings_s = best_of(check_ats_friendliness, text)
+        same = check_keywords(text) == check_ats_friendliness_regex(text)
+        print(f"{label:<22} {regex_s * 1000:>9.2f} {matcher_s * 1000:>12.2f} "
+              f"{regex_s / matcher_s:>7.1f}x {headings_s * 1000:>12.2f}  {'yes' if same else 'NO'}")
+
+    terms = sorted({k for keywords in SECTION_KEYWORDS.values() for k in keywords} | set(ACTION_VERBS))
+    scan_once = automaton(terms)
+    search_each = substring_terms(terms)
+    cases.append(('no keywords or verbs', re.sub('|'.join(map(re.escape, terms)), 'x',
+                                                 long_text(0).lower())))
+    print()
+    print(f"{'Keywords and verbs':<22} {'Searches ms':>12} {'Automaton ms':>13} {'Ratio':>8}  Same")
+    print("-" * 72)
+    for label, text in cases:
+        text_lower = text.lower()
+        search_s = best_of(search_each, text_lower)
+        automaton_s = best_of(scan_once, text_lower)
+        same = scan_once(text_lower) == search_each(text_lower)
+        print(f"{label:<22} {search_s * 1000:>12.3f} {automaton_s * 1000:>13.3f} "
+              f"{automaton_s / search_s:>7.1f}x  {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
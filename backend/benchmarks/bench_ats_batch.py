@@ -0,0 +1,75 @@
+"""
+bench_ats_batch.py — Batch ATS re-scoring: per-document loop vs vectorized rules
+
+Run from the backend folder:  python benchmarks/bench_ats_batch.py
+
+Scores an archive-sized synthetic corpus three ways and checks that every
+result is identical:
+  - the original regex check, one document at a time
+  - the rule tables, one document at a time (keyword section detection, the
+    rule the regex check uses)
+  - the rule tables, vectorized over the batch (check_ats_friendliness_many)
+The scoring step is also timed on its own, from precomputed features.
+"""
+
+import os
+import re
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_texts
+from analysis.ats import (ATS_MATCHER, LEGACY_ATS_MATCHER, check_ats_friendliness_many,
+                          check_ats_friendliness_regex)
+from analysis.ats_rules import ATS_SCORER
+
+BATCH_SIZES = [100, 1000, 5000]
+
+
+def archive(count):
+    """Resumes with a spread of scores: some short, some without contact details."""
+    texts = []
+    for i, text in enumerate(resume_texts(count, seed=5)):
+        if i % 3 == 1:
+            text = re.sub(r'\d', 'x', text.replace('@', ' at '))
+        if i % 5 == 2:
+            text = text[:i % 700]
+        if i % 7 == 3:
+            text = '★ ' * 400 + text
+        texts.append(text)
+    return texts
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    print("=" * 94)
+    print("BATCH ATS SCORING BENCHMARK")
+    print("=" * 94)
+    print(f"{'Docs':>6} {'Regex loop ms':>14} {'Rules loop ms':>14} {'Vectorized ms':>14} "
+          f"{'Score-only loop':>16} {'Score-only vec':>15}  Same")
+    print("-" * 94)
+
+    for count in BATCH_SIZES:
+        texts = archive(count)
+        regex_s, expected = timed(lambda: [check_ats_friendliness_regex(t) for t in texts])
+        loop_s, looped = timed(lambda: [ATS_SCORER.score(LEGACY_ATS_MATCHER.scan(t)) for t in texts])
+        batch_s, batched = timed(check_ats_friendliness_many, texts, LEGACY_ATS_MATCHER)
+
+        features = [ATS_MATCHER.scan(t) for t in texts]
+        score_loop_s, _ = timed(lambda: [ATS_SCORER.score(f) for f in features])
+        score_vec_s, _ = timed(ATS_SCORER.score_columns, features)
+
+        same = expected == looped == batched
+        print(f"{count:>6} {regex_s * 1000:>14.1f} {loop_s * 1000:>14.1f} {batch_s * 1000:>14.1f} "
+              f"{score_loop_s * 1000:>14.1f}ms {score_vec_s * 1000:>13.1f}ms  {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+bench_boilerplate.py — Effect of header/footer stripping on text size and preprocessing
+
+Run from the backend folder:  python benchmarks/bench_boilerplate.py
+
+Each synthetic resume repeats its name/contact header and a page footer on
+every page, as multi-page resume templates do. Preprocessing timings need
+the NLTK data used by ResumePreprocessor.
+"""
+
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_pages
+from extraction.boilerplate import strip_repeated_lines
+
+RESUMES_PER_SIZE = 20
+PAGE_COUNTS = [1, 2, 3, 5, 10]
+
+
+def joined(page_texts):
+    return "".join(page_text + "\n" for page_text in page_texts)
+
+
+def corpus(pages):
+    return [["\n".join(lines) for lines in resume_pages(pages, seed=seed)]
+            for seed in range(RESUMES_PER_SIZE)]
+
+
+def load_preprocessor():
+    try:
+        from models.preprocessor import ResumePreprocessor
+        preprocessor = ResumePreprocessor()
+        preprocessor.preprocess("warm up")
+        return preprocessor
+    except LookupError:
+        print("NLTK data unavailable, skipping preprocessing timings")
+        return None
+
+
+def time_preprocess(preprocessor, texts):
+    start = time.perf_counter()
+    for text in texts:
+        preprocessor.preprocess(text)
+    return time.perf_counter() - start
+
+
+def main():
+    preprocessor = load_preprocessor()
+
+    print("=" * 92)
+    print("HEADER/FOOTER STRIPPING BENCHMARK")
+    print("=" * 92)
+    print(f"{'Pages':>5} {'Chars before':>13} {'Chars after':>12} {'Reduction':>10} "
+          f"{'Strip ms/doc':>13} {'Prep ms before':>15} {'Prep ms after':>14} {'Saved':>7}")
+    print("-" * 92)
+
+    total_before = total_after = 0
+    for pages in PAGE_COUNTS:
+        docs = corpus(pages)
+
+        start = time.perf_counter()
+        stripped = [strip_repeated_lines(page_texts) for page_texts in docs]
+        strip_s = time.perf_counter() - start
+
+        before = [joined(page_texts) for page_texts in docs]
+        after = [joined(page_texts) for page_texts in stripped]
+        chars_before = sum(map(len, before))
+        chars_after = sum(map(len, after))
+        total_before += chars_before
+        total_after += chars_after
+
+        line = (f"{pages:>5} {chars_before:>13} {chars_after:>12} "
+                f"{1 - chars_after / chars_before:>9.1%} {strip_s * 1000 / len(docs):>13.3f}")
+        if preprocessor:
+            prep_before = time_preprocess(preprocessor, before) * 1000 / len(docs)
+            prep_after = time_preprocess(preprocessor, after) * 1000 / len(docs)
+            line += f" {prep_before:>15.2f} {prep_after:>14.2f} {1 - prep_after / prep_before:>6.1%}"
+        print(line)
+
+    print("-" * 92)
+    print(f"Overall text size reduction: {1 - total_after / total_before:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+bench_clean_text.py — Fused clean_text vs the original step-by-step cleaner
+
+Run from the backend folder:  python benchmarks/bench_clean_text.py
+
+Checks byte-for-byte identical output on a regression corpus (synthetic
+resumes and variants dense in URLs, emails and phone numbers) and on
+randomized fragments built around the patterns' edge cases, then times both
+cleaners on short, typical and maximum-length (50,000 character) resumes and
+on inputs that stress the fused scanner. Exit status is 1 on any mismatch.
+"""
+
+import os
+import random
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_text, resume_texts
+from models.preprocessor import ResumePreprocessor, clean_lowercase_text_stepwise
+
+MAX_CHARS = 50000
+FUZZ_CASES = 200000
+REPEATS = 20
+
+FRAGMENTS = ['http', 'https://', 'www', 'www.', '.', '@', '@x', 'x@', '+', '+1', '+44 ', '+1\n2',
+             '555', '555-555-5555', '5555', '12 ', ' 3', '-', '/', ':', '_', ' ', '  ', '\n', '\t',
+             'a', 'xy', 'z', '1', '٣', 'é', '\x1c', '\xa0', '\u2003', '\x85', ' ']
+
+
+def stepwise(text):
+    return clean_lowercase_text_stepwise(text.lower())
+
+
+def sized_text(chars, seed=0):
+    text = ''
+    while len(text) < chars:
+        text += resume_text(seed=seed, jobs=4) + '\n'
+        seed += 1
+    return text[:chars]
+
+
+def contact_heavy(text):
+    return text.replace('\n', ' +1 555 0100 see https://example.com/x or me@example.com\n')
+
+
+def fuzz_texts(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 14)))
+
+
+def best_of(fn, arg, repeats=REPEATS):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    # clean_text needs no NLTK data
+    fused = ResumePreprocessor.__new__(ResumePreprocessor).clean_text
+
+    print("=" * 72)
+    print("CLEAN_TEXT BENCHMARK")
+    print("=" * 72)
+    corpus = resume_texts(300, seed=61)
+    corpus += [contact_heavy(text) for text in corpus] + [text.replace(' ', '') for text in corpus[:100]]
+    mismatches = sum(fused(text) != stepwise(text) for text in corpus)
+    fuzz_mismatches = sum(fused(text) != stepwise(text) for text in fuzz_texts(FUZZ_CASES))
+    print(f"Identical output: {mismatches} mismatches over {len(corpus)} resumes, "
+          f"{fuzz_mismatches} over {FUZZ_CASES} random fragments")
+    print()
+
+    cases = [
+        ('short resume (1k)', sized_text(1000)),
+        ('typical resume (4k)', sized_text(4000)),
+        ('long resume (15k)', sized_text(15000)),
+        ('maximum length (50k)', sized_text(MAX_CHARS)),
+        ('50k, contact-heavy', contact_heavy(sized_text(MAX_CHARS))[:MAX_CHARS]),
+        ('50k, one unbroken run', 'x' * MAX_CHARS),
+        ('50k, "+1 2 3 ..." chain', ' '.join(['+1'] + ['2'] * (MAX_CHARS // 2))[:MAX_CHARS]),
+    ]
+    print(f"{'Input':<26} {'Stepwise ms':>12} {'Fused ms':>10} {'Speedup':>8}  Same")
+    print("-" * 72)
+    for label, text in cases:
+        # The stepwise email pattern backtracks quadratically on long unbroken runs
+        stepwise_s = best_of(stepwise, text, repeats=1 if ' ' not in text else REPEATS)
+        fused_s = best_of(fused, text)
+        same = fused(text) == stepwise(text)
+        mismatches += not same
+        print(f"{label:<26} {stepwise_s * 1000:>12.3f} {fused_s * 1000:>10.3f} "
+              f"{stepwise_s / fused_s:>7.1f}x  {'yes' if same else 'NO'}")
+
+    return 1 if mismatches or fuzz_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
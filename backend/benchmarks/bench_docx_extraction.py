@@ -0,0 +1,75 @@
+"""
+bench_docx_extraction.py — python-docx object model vs streaming DOCX extraction
+
+Run from the backend folder:  python benchmarks/bench_docx_extraction.py
+
+The object-model path is quadratic in table rows (row.cells rebuilds the
+whole cell grid on every call), so cases stop at 200 rows to keep the run
+under a couple of minutes.
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import build_docx, resume_text
+from extraction.docx_text import extract_text_from_docx, extract_text_from_docx_dom
+
+REPEATS = 3
+
+# (label, table rows, merged cells) — skills/experience grids as produced by
+# resume templates that lay everything out in tables.
+CASES = [
+    ('plain, no tables', 0, False),
+    ('50-row table', 50, False),
+    ('50-row, merged', 50, True),
+    ('200-row table', 200, False),
+    ('200-row, merged', 200, True),
+]
+
+
+def best_of(fn, repeats=REPEATS):
+    best = float('inf')
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print("=" * 86)
+    print("DOCX EXTRACTION BENCHMARK")
+    print("=" * 86)
+    print(f"{'Document':<20} {'Chars':>7} {'DOM ms':>9} {'Stream ms':>10} {'Speedup':>8} "
+          f"{'DOM peak':>10} {'Stream peak':>12}  Same")
+    print("-" * 86)
+
+    lines = resume_text(seed=7, jobs=4).split('\n')
+    for label, rows, merged in CASES:
+        data = build_docx(lines, table_rows=rows, merged=merged)
+        dom_s, dom_text = best_of(lambda: extract_text_from_docx_dom(io.BytesIO(data)))
+        stream_s, stream_text = best_of(lambda: extract_text_from_docx(io.BytesIO(data)))
+        dom_peak = peak_memory(lambda: extract_text_from_docx_dom(io.BytesIO(data)))
+        stream_peak = peak_memory(lambda: extract_text_from_docx(io.BytesIO(data)))
+        print(f"{label:<20} {len(dom_text):>7} {dom_s * 1000:>9.1f} {stream_s * 1000:>10.1f} "
+              f"{dom_s / stream_s:>7.1f}x {dom_peak / 1024:>8.0f}KB {stream_peak / 1024:>10.0f}KB  "
+              f"{'yes' if dom_text == stream_text else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+bench_forest.py — ForestEngine vs the pickled RandomForestClassifier
+
+Run from the backend folder:  python benchmarks/bench_forest.py
+
+Uses saved_models/model.pkl when the trained model loads; otherwise the
+stand-in forest of bench_predict.py (the trainer's settings, fitted on the
+synthetic corpus). Both forms are saved to a temporary folder and compared
+on the TF-IDF rows of synthetic resumes:
+
+  - load: joblib.load of the pickle vs ForestEngine.load of the .npy arrays
+  - one resume at a time: predict_proba latency (the /api/analyze-resume path)
+  - batches of 64 and 512 resumes: throughput
+
+The pickled model is timed as the trainer saves it (n_jobs=-1). Exactness is
+checked against it with n_jobs=1, which sums the trees in estimator order
+like ForestEngine (with more threads the order, and so the last bit, varies).
+Needs the NLTK stopwords and WordNet data. Exit status is 1 on any mismatch.
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import joblib
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.bench_predict import stand_in_predictor
+from benchmarks.corpus import resume_texts
+from models.forest import ForestEngine
+from models.predict import ResumePredictor
+
+RESUMES = 512
+SINGLE_CALLS = 200
+LOADS = 5
+BATCH_SIZES = [64, 512]
+
+
+def load_forest():
+    """(forest, vectorizer, preprocessor, description): the trained model, or the stand-in."""
+    model_path = os.path.join(os.path.dirname(current_dir), 'saved_models', 'model.pkl')
+    try:
+        model = joblib.load(model_path)
+        predictor = ResumePredictor()
+        return model, predictor.vectorizer, predictor.preprocessor, "trained model (saved_models/)"
+    except LookupError:
+        raise
+    except Exception as e:
+        predictor = stand_in_predictor()
+        return (predictor.model, predictor.vectorizer, predictor.preprocessor,
+                f"stand-in forest (trained model unavailable: {type(e).__name__})")
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    try:
+        model, vectorizer, preprocessor, source = load_forest()
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+    model.set_params(verbose=0)
+
+    texts = resume_texts(RESUMES, seed=93)
+    features = vectorizer.transform(list(preprocessor.preprocess_many(texts)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, 'model.pkl')
+        forest_path = os.path.join(tmp, 'forest')
+        joblib.dump(model, pickle_path)
+        ForestEngine.from_model(model).save(forest_path)
+        pickle_s, model = best_of(lambda: joblib.load(pickle_path), LOADS)
+        engine_s, engine = best_of(lambda: ForestEngine.load(forest_path), LOADS)
+        model.set_params(verbose=0)
+
+    print("=" * 72)
+    print("FOREST INFERENCE BENCHMARK")
+    print("=" * 72)
+    print(f"Model: {source}; {engine.n_estimators} trees, {len(engine.feature)} nodes, "
+          f"depth {engine.max_depth}, {len(engine.classes_)} classes, {engine.n_features_in_} features")
+    print(f"Resumes: {RESUMES} synthetic")
+    print()
+
+    print(f"{'':<30} {'Pickle ms':>12} {'Engine ms':>12} {'Speedup':>8}")
+    print("-" * 72)
+    print(f"{'load':<30} {pickle_s * 1000:>12.1f} {engine_s * 1000:>12.1f} {pickle_s / engine_s:>7.1f}x")
+
+    rows = [features[i] for i in range(SINGLE_CALLS)]
+    for label, predict in (('pickle', model.predict_proba), ('engine', engine.predict_proba)):
+        predict(rows[0])
+    single = {}
+    for label, predict in (('pickle', model.predict_proba), ('engine', engine.predict_proba)):
+        times = []
+        for row in rows:
+            start = time.perf_counter()
+            predict(row)
+            times.append(time.perf_counter() - start)
+        single[label] = statistics.median(times)
+    print(f"{'one resume (p50)':<30} {single['pickle'] * 1000:>12.2f} {single['engine'] * 1000:>12.2f} "
+          f"{single['pickle'] / single['engine']:>7.1f}x")
+
+    for size in BATCH_SIZES:
+        batch = features[:size]
+        pickle_s, _ = best_of(lambda: model.predict_proba(batch), 3)
+        engine_s, _ = best_of(lambda: engine.predict_proba(batch), 3)
+        print(f"{f'batch of {size} (per resume)':<30} {pickle_s / size * 1000:>12.3f} "
+              f"{engine_s / size * 1000:>12.3f} {pickle_s / engine_s:>7.1f}x")
+
+    model.set_params(n_jobs=1)
+    same_proba = np.array_equal(model.predict_proba(features), engine.predict_proba(features))
+    same_single = all(np.array_equal(model.predict_proba(row), engine.predict_proba(row))
+                      for row in rows[:50])
+    same_labels = np.array_equal(model.predict(features), engine.predict(features))
+    exact = same_proba and same_single and same_labels
+    print(f"\nProbabilities identical to predict_proba (n_jobs=1): {'yes' if exact else 'NO'}")
+    return 0 if exact else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+bench_lemmas.py — Lemma table + LRU vs calling WordNet for every token
+
+Run from the backend folder:  python benchmarks/bench_lemmas.py
+
+Builds a lemma table from the training resumes (data/resumes_clean.csv, or
+the synthetic corpus when the CSV is not in this checkout), holding out the
+last fifth of them as "incoming" resumes. Reports the table size, the hit
+rate of each tier on the held-out resumes, and ResumePreprocessor.preprocess
+latency with WordNet only, with the LRU only and with table + LRU, checking
+that all three produce the same output. Needs the NLTK stopwords and
+WordNet data.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_texts, training_resumes
+from models.lemmas import (LemmaCache, build_lemma_table, load_lemma_table, save_lemma_table,
+                           training_vocabulary)
+from models.preprocessor import ResumePreprocessor
+
+SYNTHETIC_RESUMES = 1000
+HOLDOUT_FRACTION = 0.2
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    outputs = [fn(text) for text in texts]
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    texts = training_resumes()
+    source = "training CSV"
+    if texts is None:
+        texts = resume_texts(SYNTHETIC_RESUMES, seed=51)
+        source = "synthetic corpus (data/resumes_clean.csv not found)"
+    split = int(len(texts) * (1 - HOLDOUT_FRACTION))
+    train, incoming = texts[:split], texts[split:]
+
+    print("=" * 72)
+    print("LEMMA LOOKUP BENCHMARK")
+    print("=" * 72)
+    print(f"Corpus: {len(train)} training + {len(incoming)} held-out resumes, {source}")
+
+    try:
+        wordnet_only = ResumePreprocessor(lemma_cache=LemmaCache(cache_size=0))
+        cold_s, _ = timed(wordnet_only.preprocess, ["warm up"])
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+
+    start = time.perf_counter()
+    table = build_lemma_table(training_vocabulary(wordnet_only, train))
+    build_s = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'lemma_table.json')
+        save_lemma_table(table, path)
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        assert load_lemma_table(path) == table
+        load_s = time.perf_counter() - start
+    changed = sum(word != lemma for word, lemma in table.items())
+    print(f"Table: {len(table)} words ({changed} with a different lemma), {size / 1024:.0f} KB, "
+          f"built in {build_s:.1f}s, loaded in {load_s * 1000:.1f} ms")
+    print(f"WordNet first use (load): {cold_s * 1000:.0f} ms")
+    print()
+
+    modes = {
+        'WordNet only': wordnet_only,
+        'LRU only': ResumePreprocessor(lemma_cache=LemmaCache()),
+        'table + LRU': ResumePreprocessor(lemma_cache=LemmaCache(table=table)),
+    }
+    print(f"{'Held-out resumes':<16} {'Total ms':>10} {'Per resume':>11} {'Speedup':>8} "
+          f"{'Table hit':>10} {'LRU hit':>8} {'WordNet':>8}")
+    print("-" * 72)
+    baseline_s = expected = None
+    same = True
+    for label, preprocessor in modes.items():
+        seconds, outputs = timed(preprocessor.preprocess, incoming)
+        stats = preprocessor.lemmas.stats()
+        if expected is None:
+            baseline_s, expected = seconds, outputs
+        same &= outputs == expected
+        lookups = max(stats['lookups'], 1)
+        print(f"{label:<16} {seconds * 1000:>10.1f} {seconds / len(incoming) * 1000:>9.2f}ms "
+              f"{baseline_s / seconds:>7.1f}x {stats['table_hits'] / lookups:>9.1%} "
+              f"{stats['lru_hits'] / lookups:>7.1%} {stats['wordnet_calls']:>8}")
+    print(f"\nSame output in every mode: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+bench_live.py — Live-edit sessions vs full re-analysis after every edit
+
+Run from the backend folder:  python benchmarks/bench_live.py
+
+Fits a TF-IDF vectorizer with the trainer's settings on the training resumes
+(data/resumes_clean.csv, or the synthetic corpus when the CSV is not in this
+checkout), then replays editing sessions on typical and long resumes: keystrokes (one
+character typed or deleted), a bullet line pasted somewhere in the resume
+and one line deleted. After every edit a LiveSession update and a fresh
+ResumeDocument are timed producing what /api/analyze-resume scores (ATS
+features and the TF-IDF row), then checked to give identical sections, ATS
+features, preprocessed text, TF-IDF row and section-weighted row. Reports
+the latency of both per edit kind. Needs the NLTK stopwords and WordNet data. Exit
+status is 1 on any mismatch.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_text, resume_texts, training_resumes
+from analysis.document import ResumeDocument
+from analysis.live import LiveSessionStore
+from models.train_model import ResumeClassifierTrainer
+
+SYNTHETIC_RESUMES = 1000
+EDITS = 200
+SECTION_WEIGHTS = {'skills': 2.0, 'header': 0}
+BULLET = "- Automated invoice matching in Python, saving 20 hours a month"
+
+
+# Each edit takes the text before it and the resume it started from; pastes
+# and deletions start over from the original so the resume keeps its size
+
+
+def keystroke(text, original, rng):
+    pos = rng.randrange(len(text))
+    if rng.random() < 0.6:
+        return text[:pos] + rng.choice('abcdefghijklmnopqrstuvwxyz ,.') + text[pos:]
+    return text[:pos] + text[pos + 1:]
+
+
+def paste_line(text, original, rng):
+    lines = original.split('\n')
+    lines.insert(rng.randrange(len(lines)), BULLET)
+    return '\n'.join(lines)
+
+
+def delete_line(text, original, rng):
+    lines = original.split('\n')
+    del lines[rng.randrange(len(lines))]
+    return '\n'.join(lines)
+
+
+def scored(document):
+    """What /api/analyze-resume scores: ATS features and the TF-IDF row."""
+    return document.ats_features, document.features
+
+
+def artifacts(document):
+    return (document.sections, document.ats_features, document.processed,
+            document.features.toarray(), document.section_features(SECTION_WEIGHTS).toarray())
+
+
+def same(a, b):
+    return all(np.array_equal(x, y) if isinstance(x, np.ndarray) else x == y for x, y in zip(a, b))
+
+
+def main():
+    try:
+        trainer = ResumeClassifierTrainer()
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+    preprocessor, vectorizer = trainer.preprocessor, trainer.vectorizer
+
+    texts = training_resumes()
+    source = "training CSV"
+    if texts is None:
+        texts = resume_texts(SYNTHETIC_RESUMES, seed=81)
+        source = "synthetic corpus (data/resumes_clean.csv not found)"
+    vectorizer.fit(list(preprocessor.preprocess_many(texts)))
+
+    print("=" * 72)
+    print("LIVE-EDIT SESSION BENCHMARK")
+    print("=" * 72)
+    print(f"Vectorizer: {len(vectorizer.vocabulary_)} terms, ngram_range={vectorizer.ngram_range}, "
+          f"fitted on {len(texts)} resumes ({source})")
+    print()
+
+    store = LiveSessionStore(preprocessor, vectorizer)
+    rng = random.Random(0)
+    mismatches = 0
+    print(f"{'Resume':<14} {'Edit':<12} {'Full p50 ms':>12} {'Live p50 ms':>12} {'Live p95 ms':>12} "
+          f"{'Speedup':>8}")
+    print("-" * 72)
+    for label, jobs in (('typical', 3), ('long', 12)):
+        for kind, edit in (('keystroke', keystroke), ('paste line', paste_line),
+                           ('delete line', delete_line)):
+            original = text = resume_text(seed=rng.randrange(1000), jobs=jobs)
+            session = store.create()
+            session.update(text)
+            full, live = [], []
+            for _ in range(EDITS):
+                text = edit(text, original, rng)
+                start = time.perf_counter()
+                fresh = ResumeDocument(text, preprocessor=preprocessor, vectorizer=vectorizer)
+                scored(fresh)
+                full.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                document = session.update(text)
+                scored(document)
+                live.append(time.perf_counter() - start)
+                mismatches += not same(artifacts(document), artifacts(fresh))
+            full_p50, live_p50 = statistics.median(full), statistics.median(live)
+            live_p95 = statistics.quantiles(live, n=20)[-1]
+            print(f"{label + f' ({len(original) / 1000:.1f}k)':<14} {kind:<12} {full_p50 * 1000:>12.2f} "
+                  f"{live_p50 * 1000:>12.2f} {live_p95 * 1000:>12.2f} {full_p50 / live_p50:>7.1f}x")
+
+    print(f"\nIdentical artifacts after every edit: {'yes' if not mismatches else f'NO ({mismatches})'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+bench_predict.py — ResumePredictor.predict_many vs the original two-pass predict
+
+Run from the backend folder:  python benchmarks/bench_predict.py
+
+Uses the trained model in saved_models/ when it loads; otherwise fits a
+stand-in forest with the trainer's settings on the synthetic corpus (its
+labels are the role in each resume's summary line). Compares, per resume:
+
+  - the original predict: model.predict, then model.predict_proba, then a
+    full argsort for the top 3 roles (every tree evaluated twice)
+  - predict(): the single-pass wrapper over predict_many
+  - predict_many over batches of 8, 64 and 512 resumes
+
+first on documents whose TF-IDF rows are already computed (model cost only)
+and then end to end from raw text. Checks that every path gives the same
+role, confidence and top-3 probabilities. Needs the NLTK stopwords and
+WordNet data.
+"""
+
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_texts
+from models.predict import ResumePredictor
+from models.train_model import ResumeClassifierTrainer
+
+RESUMES = 512
+TRAINING_RESUMES = 1500
+BATCH_SIZES = [8, 64, 512]
+SUMMARY_ROLE = re.compile(r'PROFESSIONAL SUMMARY\n(.+?) with ')
+
+
+def load_predictor():
+    """(predictor, description): the trained model, or the stand-in."""
+    try:
+        return ResumePredictor(), "trained model (saved_models/)"
+    except LookupError:
+        raise
+    except Exception as e:
+        return stand_in_predictor(), f"stand-in forest (trained model unavailable: {type(e).__name__})"
+
+
+def stand_in_predictor():
+    """ResumePredictor over a forest fitted on the synthetic corpus."""
+    trainer = ResumeClassifierTrainer()
+    texts = resume_texts(TRAINING_RESUMES, seed=91)
+    roles = [SUMMARY_ROLE.search(text).group(1) for text in texts]
+    trainer.label_encoder = {role: i for i, role in enumerate(sorted(set(roles)))}
+    features = trainer.vectorizer.fit_transform(list(trainer.preprocessor.preprocess_many(texts)))
+    trainer.train_model(features, [trainer.label_encoder[role] for role in roles])
+    trainer.model.set_params(verbose=0)
+
+    predictor = ResumePredictor.__new__(ResumePredictor)
+    predictor.preprocessor = trainer.preprocessor
+    predictor.model = trainer.model
+    predictor.vectorizer = trainer.vectorizer
+    predictor.label_encoder = trainer.label_encoder
+    predictor.inverse_label_encoder = {v: k for k, v in trainer.label_encoder.items()}
+    predictor.column_roles = [predictor.inverse_label_encoder[c] for c in trainer.model.classes_]
+    predictor.model_version = 'stand-in'
+    return predictor
+
+
+def two_pass_predict(predictor, document):
+    """The original ResumePredictor.predict, for reference."""
+    features = document.features
+    prediction = predictor.model.predict(features)[0]
+    probabilities = predictor.model.predict_proba(features)[0]
+    top_3_indices = probabilities.argsort()[-3:][::-1]
+    return {
+        'predicted_role': predictor.inverse_label_encoder[prediction],
+        'confidence': float(probabilities[prediction]),
+        'top_3_roles': [(predictor.inverse_label_encoder[idx], float(probabilities[idx]))
+                        for idx in top_3_indices],
+    }
+
+
+def same_prediction(a, b):
+    # Roles tied on probability may be listed in either order. A forest with
+    # n_jobs != 1 sums its trees in thread completion order, which can move
+    # the last bit of a probability between two calls.
+    return (a['predicted_role'] == b['predicted_role']
+            and np.allclose([a['confidence']] + [p for _, p in a['top_3_roles']],
+                            [b['confidence']] + [p for _, p in b['top_3_roles']],
+                            rtol=0, atol=1e-12))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def in_batches(predictor, items, size):
+    results = []
+    for start in range(0, len(items), size):
+        results.extend(predictor.predict_many(items[start:start + size]))
+    return results
+
+
+def main():
+    try:
+        predictor, source = load_predictor()
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+
+    texts = resume_texts(RESUMES, seed=92)
+    documents = [predictor.document(text) for text in texts]
+    for document in documents:
+        document.features
+
+    print("=" * 72)
+    print("PREDICT BENCHMARK")
+    print("=" * 72)
+    print(f"Model: {source}; {len(predictor.column_roles)} roles, "
+          f"{getattr(predictor.model, 'n_estimators', '?')} trees")
+    print(f"Resumes: {RESUMES} synthetic")
+    print()
+
+    baseline_s, expected = timed(lambda: [two_pass_predict(predictor, d) for d in documents])
+    rows = [('original predict (2 passes)', baseline_s, expected)]
+    rows.append(('predict (1 pass)',) + timed(lambda: [predictor.predict(d) for d in documents]))
+    for size in BATCH_SIZES:
+        rows.append((f"predict_many, batches of {size}",)
+                    + timed(lambda: in_batches(predictor, documents, size)))
+
+    mismatches = 0
+    print(f"{'Features precomputed':<34} {'Total ms':>10} {'Resumes/s':>10} {'Speedup':>8}  Same")
+    print("-" * 72)
+    for label, seconds, results in rows:
+        same = all(same_prediction(a, b) for a, b in zip(results, expected))
+        mismatches += not same
+        print(f"{label:<34} {seconds * 1000:>10.1f} {RESUMES / seconds:>10.0f} "
+              f"{baseline_s / seconds:>7.1f}x  {'yes' if same else 'NO'}")
+
+    print()
+    print(f"{'End to end from raw text':<34} {'Total ms':>10} {'Resumes/s':>10} {'Speedup':>8}  Same")
+    print("-" * 72)
+    single_s, results = timed(lambda: [predictor.predict(text) for text in texts])
+    end_to_end = [('predict, one text at a time', single_s, results)]
+    for size in BATCH_SIZES:
+        end_to_end.append((f"predict_many, batches of {size}",)
+                          + timed(lambda: in_batches(predictor, texts, size)))
+    for label, seconds, results in end_to_end:
+        same = all(same_prediction(a, b) for a, b in zip(results, expected))
+        mismatches += not same
+        print(f"{label:<34} {seconds * 1000:>10.1f} {RESUMES / seconds:>10.0f} "
+              f"{single_s / seconds:>7.1f}x  {'yes' if same else 'NO'}")
+
+    ties = sum(a['top_3_roles'] != b['top_3_roles'] for a, b in zip(rows[1][2], expected))
+    print(f"\nTop-3 lists ordering tied roles differently from argsort: {ties}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+bench_preprocess_many.py — ResumePreprocessor.preprocess_many scaling with cores
+
+Run from the backend folder:  python benchmarks/bench_preprocess_many.py
+
+Preprocesses the training resumes (data/resumes_clean.csv, or the synthetic
+corpus when the CSV is not in this checkout) serially and with
+preprocess_many at 1, 2, 4, ... workers up to the core count, checking that
+every run returns the same texts in the same order. Reports throughput,
+speedup and parallel efficiency (speedup / workers), and the time to the
+first streamed result. Needs the NLTK stopwords and WordNet data.
+"""
+
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_texts, training_resumes
+from models.preprocessor import ResumePreprocessor
+
+SYNTHETIC_RESUMES = 4000
+
+
+def worker_counts():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    texts = training_resumes()
+    source = "training CSV"
+    if texts is None:
+        texts = resume_texts(SYNTHETIC_RESUMES, seed=71)
+        source = "synthetic corpus (data/resumes_clean.csv not found)"
+
+    print("=" * 72)
+    print("PREPROCESS_MANY BENCHMARK")
+    print("=" * 72)
+    print(f"Corpus: {len(texts)} resumes, {source}; {os.cpu_count() or 1} cores")
+
+    try:
+        preprocessor = ResumePreprocessor()
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+
+    start = time.perf_counter()
+    expected = [preprocessor.preprocess(text) for text in texts]
+    serial_s = time.perf_counter() - start
+    print(f"Serial preprocess loop: {serial_s:.2f}s ({len(texts) / serial_s:.0f} resumes/s)")
+    print()
+
+    print(f"{'Workers':>7} {'Total s':>9} {'Resumes/s':>10} {'Speedup':>8} {'Efficiency':>11} "
+          f"{'First ms':>9}  Same")
+    print("-" * 72)
+    same = True
+    for workers in worker_counts():
+        start = time.perf_counter()
+        stream = preprocessor.preprocess_many(texts, workers=workers)
+        outputs = [next(stream)]
+        first_s = time.perf_counter() - start
+        outputs.extend(stream)
+        seconds = time.perf_counter() - start
+        same &= outputs == expected
+        speedup = serial_s / seconds
+        print(f"{workers:>7} {seconds:>9.2f} {len(texts) / seconds:>10.0f} {speedup:>7.2f}x "
+              f"{speedup / workers:>10.0%} {first_s * 1000:>9.1f}  {'yes' if outputs == expected else 'NO'}")
+
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+bench_sections.py — Section segmentation: scaling and effect on the ATS check
+
+Run from the backend folder:  python benchmarks/bench_sections.py
+
+Segments synthetic resumes of 1k to 100k characters and a few pathological
+inputs (one giant line, thousands of one-word lines, thousands of "Label:"
+lines) to show that the time per character stays flat, then compares
+heading-based ATS section detection with the original keyword rule on
+resumes with and without headings.
+"""
+
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_text, resume_texts
+from analysis.ats import ATS_MATCHER, LEGACY_ATS_MATCHER
+from analysis.sections import segment_sections
+
+SIZES = [1000, 5000, 10000, 25000, 50000, 100000]
+REPEATS = 20
+ATS_DOCUMENTS = 500
+
+
+def sized_text(chars, seed=0):
+    text = ''
+    while len(text) < chars:
+        text += resume_text(seed=seed, jobs=4) + '\n'
+        seed += 1
+    return text[:chars]
+
+
+def pathological(chars):
+    return [
+        ('one giant line', 'x' * chars),
+        ('one-word lines', '\n'.join(['skills', 'python', 'sql'] * (chars // 18))[:chars]),
+        ('"Label:" lines', '\n'.join(['Education: BSc', 'Name: Jane'] * (chars // 26))[:chars]),
+        ('blank lines', '\n' * chars),
+    ]
+
+
+def best_of(fn, arg, repeats=REPEATS):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def headless(text):
+    """The same resume with its heading lines dropped, as in free-form resumes."""
+    return '\n'.join(line for line in text.split('\n')
+                     if not line.isupper() or len(line) > 30)
+
+
+def heading_dropped(text, heading='EDUCATION'):
+    """The same resume with one heading line dropped; its content stays."""
+    return '\n'.join(line for line in text.split('\n') if line != heading)
+
+
+def main():
+    print("=" * 72)
+    print("SECTION SEGMENTATION BENCHMARK")
+    print("=" * 72)
+    print(f"{'Input':<28} {'Chars':>8} {'Sections':>9} {'ms':>8} {'ns/char':>9}")
+    print("-" * 72)
+    cases = [(f"resume text {size // 1000}k", sized_text(size)) for size in SIZES]
+    cases += pathological(50000)
+    for label, text in cases:
+        seconds = best_of(segment_sections, text)
+        print(f"{label:<28} {len(text):>8} {len(segment_sections(text)):>9} "
+              f"{seconds * 1000:>8.2f} {seconds * 1e9 / max(len(text), 1):>9.1f}")
+    print()
+
+    print(f"{'ATS section detection':<28} {'Docs':>6} {'Changed':>8} {'Sections (kw)':>14} "
+          f"{'Sections (hd)':>14}")
+    print("-" * 72)
+    texts = list(resume_texts(ATS_DOCUMENTS, seed=21))
+    for label, corpus in [('resumes with headings', texts),
+                          ('one heading missing', [heading_dropped(t) for t in texts]),
+                          ('resumes without headings', [headless(t) for t in texts])]:
+        changed = keyword_total = heading_total = 0
+        for text in corpus:
+            by_keyword = LEGACY_ATS_MATCHER.scan(text)['sections_found']
+            by_heading = ATS_MATCHER.scan(text)['sections_found']
+            changed += by_keyword != by_heading
+            keyword_total += len(by_keyword)
+            heading_total += len(by_heading)
+        print(f"{label:<28} {len(corpus):>6} {changed:>8} {keyword_total / len(corpus):>14.2f} "
+              f"{heading_total / len(corpus):>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+bench_shared_memory.py — Per-worker memory and cold start: pickles vs memory-mapped artifacts
+
+Run from the backend folder:  python benchmarks/bench_shared_memory.py
+
+Uses saved_models/model.pkl and vectorizer.pkl when the trained model loads;
+otherwise the stand-in forest of bench_predict.py. Both are written to a
+temporary folder as pickles and as memory-mappable exports
+(models/artifacts.py), then 1, 4 and 16 worker processes are started at
+once, as a preforking server would, each:
+
+  - loading the model and vectorizer, timed (the page cache is warm after
+    the first run, so this is the load cost itself, not the disk read)
+  - scoring a batch of resumes, which touches the whole forest
+  - once every worker is up, reporting its unique memory (USS: pages no
+    other process maps) and proportional memory (PSS: shared pages split
+    between the processes mapping them)
+
+Workers that only import the same modules (sklearn.ensemble included, so
+unpickling pays no imports) give the baseline; "model MB" is a worker's USS
+above it. Needs psutil, and the NLTK stopwords and WordNet data for the
+stand-in.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import joblib
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.insert(0, backend_dir)
+
+from benchmarks.bench_forest import load_forest
+from benchmarks.corpus import resume_texts
+from models.artifacts import save_vectorizer
+from models.forest import ForestEngine
+
+WORKER_COUNTS = [1, 4, 16]
+RESUMES = 128
+MB = 1024 * 1024
+
+WORKER = """
+import json, os, sys, time
+sys.path.insert(0, {backend_dir!r})
+import joblib, psutil
+import sklearn.ensemble
+from models.artifacts import load_vectorizer
+from models.forest import ForestEngine
+mode, folder = sys.argv[1], sys.argv[2]
+
+start = time.perf_counter()
+if mode == 'pickle':
+    model = joblib.load(os.path.join(folder, 'model.pkl'))
+    vectorizer = joblib.load(os.path.join(folder, 'vectorizer.pkl'))
+elif mode == 'mmap':
+    model = ForestEngine.load(os.path.join(folder, 'forest'), mmap_mode='r')
+    vectorizer = load_vectorizer(os.path.join(folder, 'vectorizer'), mmap_mode='r')
+load_ms = (time.perf_counter() - start) * 1000
+
+if mode != 'baseline':
+    with open(os.path.join(folder, 'texts.json'), encoding='utf-8') as f:
+        model.predict_proba(vectorizer.transform(json.load(f)))
+
+print('ready', flush=True)
+sys.stdin.readline()
+memory = psutil.Process().memory_full_info()
+print(json.dumps({{'load_ms': load_ms, 'uss': memory.uss, 'pss': memory.pss}}), flush=True)
+sys.stdin.read()
+"""
+
+
+def run_workers(mode, folder, count):
+    """Starts `count` workers at once; their reports, measured while all are alive."""
+    code = WORKER.format(backend_dir=backend_dir)
+    workers = [subprocess.Popen([sys.executable, '-c', code, mode, folder], cwd=backend_dir,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+               for _ in range(count)]
+    try:
+        for worker in workers:
+            if worker.stdout.readline().strip() != 'ready':
+                raise RuntimeError(f"{mode} worker failed to start")
+        reports = []
+        for worker in workers:
+            worker.stdin.write('measure\n')
+            worker.stdin.flush()
+            reports.append(json.loads(worker.stdout.readline()))
+        return reports
+    finally:
+        for worker in workers:
+            worker.stdin.close()
+            worker.wait()
+
+
+def main():
+    try:
+        model, vectorizer, preprocessor, source = load_forest()
+    except LookupError:
+        print("Skipped: NLTK stopwords/wordnet data not installed")
+        return 1
+    model.set_params(verbose=0)
+
+    with tempfile.TemporaryDirectory() as folder:
+        joblib.dump(model, os.path.join(folder, 'model.pkl'))
+        joblib.dump(vectorizer, os.path.join(folder, 'vectorizer.pkl'))
+        ForestEngine.from_model(model).save(os.path.join(folder, 'forest'))
+        save_vectorizer(vectorizer, os.path.join(folder, 'vectorizer'))
+        with open(os.path.join(folder, 'texts.json'), 'w', encoding='utf-8') as f:
+            json.dump(list(preprocessor.preprocess_many(resume_texts(RESUMES, seed=94))), f)
+
+        def size(*names):
+            paths = [os.path.join(folder, name) for name in names]
+            files = [os.path.join(p, f) for p in paths if os.path.isdir(p) for f in os.listdir(p)]
+            return sum(os.path.getsize(f) for f in files + [p for p in paths if os.path.isfile(p)]) / MB
+
+        print("=" * 72)
+        print("SHARED MODEL MEMORY BENCHMARK (fresh worker processes)")
+        print("=" * 72)
+        print(f"Model: {source}; {model.n_estimators} trees, {len(vectorizer.vocabulary_)} terms")
+        print(f"On disk: pickles {size('model.pkl', 'vectorizer.pkl'):.1f} MB, "
+              f"exports {size('forest', 'vectorizer'):.1f} MB")
+        print()
+
+        print(f"{'Workers':<8} {'Artifacts':<10} {'Load p50 ms':>12} {'USS MB':>9} {'Model MB':>9} "
+              f"{'PSS MB':>9} {'Total USS':>10}")
+        print("-" * 72)
+        for count in WORKER_COUNTS:
+            baseline = statistics.median(r['uss'] for r in run_workers('baseline', folder, count))
+            for mode in ('pickle', 'mmap'):
+                reports = run_workers(mode, folder, count)
+                load_ms = statistics.median(r['load_ms'] for r in reports)
+                uss = statistics.median(r['uss'] for r in reports)
+                pss = statistics.median(r['pss'] for r in reports)
+                total = sum(r['uss'] for r in reports)
+                print(f"{count:<8} {mode:<10} {load_ms:>12.1f} {uss / MB:>9.1f} "
+                      f"{(uss - baseline) / MB:>9.2f} {pss / MB:>9.1f} {total / MB:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+bench_skills.py — Cost of gazetteer skills extraction per resume
+
+Run from the backend folder:  python benchmarks/bench_skills.py
+
+Times the trie extractor on typical synthetic resumes and on inputs up to
+100,000 characters, next to the obvious alternative of one word-boundary
+regex per gazetteer phrase, and checks the cost against
+analysis.skills.EXTRACTION_BUDGET_MS (exit status 1 when a resume of up to
+50,000 characters goes over it).
+"""
+
+import os
+import re
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from benchmarks.corpus import resume_text, resume_texts
+from analysis.skills import EXTRACTION_BUDGET_MS, GAZETTEER_PATH, SKILL_GAZETTEER, SkillGazetteer
+
+SIZES = [5000, 10000, 25000, 50000, 100000]
+BUDGET_MAX_CHARS = 50000
+TYPICAL_RESUMES = 500
+REPEATS = 10
+
+
+def sized_text(chars, seed=0):
+    text = ''
+    while len(text) < chars:
+        text += resume_text(seed=seed, jobs=4) + '\n'
+        seed += 1
+    return text[:chars]
+
+
+def best_of(fn, arg, repeats=REPEATS):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def regex_per_phrase():
+    """One compiled \\b...\\b regex per gazetteer phrase: the approach the trie replaces."""
+    patterns = [re.compile(r'(?<!\w)' + re.escape(name.lower()) + r'(?!\w)')
+                for name, _ in SKILL_GAZETTEER.skills]
+
+    def extract(text):
+        text_lower = text.lower()
+        return [p for p in patterns if p.search(text_lower)]
+    return extract
+
+
+def main():
+    print("=" * 72)
+    print("SKILLS EXTRACTION BENCHMARK")
+    print("=" * 72)
+
+    start = time.perf_counter()
+    gazetteer = SkillGazetteer.load(GAZETTEER_PATH)
+    compile_ms = (time.perf_counter() - start) * 1000
+    phrases = sum(1 for _ in _phrases(gazetteer.trie))
+    print(f"Gazetteer: {len(gazetteer.skills)} skills, {phrases} phrases, "
+          f"compiled in {compile_ms:.1f} ms (once per process)")
+
+    timings = []
+    for text in resume_texts(TYPICAL_RESUMES, seed=31):
+        start = time.perf_counter()
+        SKILL_GAZETTEER.extract(text)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    found = sum(len(SKILL_GAZETTEER.extract(t)) for t in resume_texts(50, seed=31)) / 50
+    print(f"Typical resumes ({TYPICAL_RESUMES}): p50 {timings[len(timings) // 2] * 1000:.3f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)] * 1000:.3f} ms, "
+          f"{found:.1f} skills per resume")
+    print()
+
+    naive = regex_per_phrase()
+    over_budget = False
+    print(f"{'Input':<14} {'Trie ms':>9} {'Regex/phrase ms':>16} {'Speedup':>8} {'Skills':>7}  Budget")
+    print("-" * 72)
+    for size in SIZES:
+        text = sized_text(size)
+        trie_s = best_of(SKILL_GAZETTEER.extract, text)
+        naive_s = best_of(naive, text, repeats=3)
+        if size <= BUDGET_MAX_CHARS:
+            within = trie_s * 1000 <= EXTRACTION_BUDGET_MS
+            over_budget |= not within
+            verdict = 'ok' if within else 'OVER'
+        else:
+            verdict = '-'
+        print(f"{size // 1000:>5}k chars {trie_s * 1000:>9.2f} {naive_s * 1000:>16.2f} "
+              f"{naive_s / trie_s:>7.1f}x {len(SKILL_GAZETTEER.extract(text)):>7}  {verdict}")
+    print(f"\nBudget: {EXTRACTION_BUDGET_MS:.1f} ms per resume up to {BUDGET_MAX_CHARS} chars")
+    return 1 if over_budget else 0
+
+
+def _phrases(node):
+    for token, child in node.items():
+        if token == '':
+            yield child
+        else:
+            yield from _phrases(child)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+bench_startup.py — Startup cost of the NLP stack and the effect of warm-up
+
+Run from the backend folder:  python benchmarks/bench_startup.py
+
+Every measurement runs in a fresh interpreter, as a worker would start:
+  - importing models.preprocessor (no network, no downloads)
+  - load_resources(): stopwords and WordNet from the local NLTK bundle
+  - ResumePredictor(): model, vectorizer and label encoder (when trained)
+  - the first preprocess() after warm-up vs a steady-state one
+  - 16 threads preprocessing at once right after startup, counting errors
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.insert(0, backend_dir)
+
+from benchmarks.corpus import resume_text
+
+RUNS = 3
+THREADS = 16
+
+PRELUDE = """
+import json, sys, time
+sys.path.insert(0, {backend_dir!r})
+result = {{}}
+"""
+
+SCENARIOS = {
+    'import': """
+start = time.perf_counter()
+import models.preprocessor
+result['import_ms'] = (time.perf_counter() - start) * 1000
+""",
+    'load': """
+from models.nltk_resources import load_resources
+start = time.perf_counter()
+times = load_resources()
+result['load_ms'] = (time.perf_counter() - start) * 1000
+result.update({f"{k}_ms": v * 1000 for k, v in times.items()})
+""",
+    'predictor': """
+from models.predict import ResumePredictor
+start = time.perf_counter()
+ResumePredictor()
+result['predictor_ms'] = (time.perf_counter() - start) * 1000
+""",
+    'first_request': """
+from models.preprocessor import ResumePreprocessor
+preprocessor = ResumePreprocessor()
+start = time.perf_counter()
+preprocessor.preprocess(TEXT)
+result['first_ms'] = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+preprocessor.preprocess(TEXT)
+result['steady_ms'] = (time.perf_counter() - start) * 1000
+""",
+    'threads': """
+import threading
+from models.preprocessor import ResumePreprocessor
+preprocessor = ResumePreprocessor()
+barrier = threading.Barrier(THREADS)
+outputs, errors = [], []
+def work():
+    barrier.wait()
+    try:
+        outputs.append(preprocessor.preprocess(TEXT))
+    except Exception as e:
+        errors.append(repr(e))
+threads = [threading.Thread(target=work) for _ in range(THREADS)]
+for t in threads: t.start()
+for t in threads: t.join()
+result['errors'] = len(errors)
+result['consistent'] = len(set(outputs)) <= 1
+""",
+}
+
+
+def run(scenario):
+    code = PRELUDE.format(backend_dir=backend_dir) + f"TEXT = {resume_text(seed=7)!r}\n"
+    code += f"THREADS = {THREADS}\n" + SCENARIOS[scenario] + "\nprint(json.dumps(result))\n"
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=backend_dir)
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'failed'
+        return None, last
+    return json.loads(proc.stdout.strip().splitlines()[-1]), None
+
+
+def best(scenario, key):
+    values = []
+    for _ in range(RUNS):
+        result, error = run(scenario)
+        if error:
+            return None, error
+        values.append(result[key])
+    return min(values), None
+
+
+def main():
+    print("=" * 72)
+    print("STARTUP BENCHMARK (fresh interpreter per measurement)")
+    print("=" * 72)
+    rows = [
+        ('import models.preprocessor', 'import', 'import_ms'),
+        ('load_resources() (NLTK data)', 'load', 'load_ms'),
+        ('ResumePredictor()', 'predictor', 'predictor_ms'),
+        ('first preprocess after warm-up', 'first_request', 'first_ms'),
+        ('steady-state preprocess', 'first_request', 'steady_ms'),
+    ]
+    for label, scenario, key in rows:
+        value, error = best(scenario, key)
+        shown = f"{value:>9.1f} ms" if error is None else f"skipped ({error})"
+        print(f"{label:<34} {shown}")
+
+    result, error = run('threads')
+    if error:
+        print(f"{f'{THREADS} concurrent first requests':<34} skipped ({error})")
+    else:
+        print(f"{f'{THREADS} concurrent first requests':<34} {result['errors']} errors, "
+              f"{'identical' if result['consistent'] else 'DIFFERENT'} outputs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+bench_tokenizer.py — fast_tokenize vs NLTK word_tokenize on cleaned resume text
+
+Run from the backend folder:  python benchmarks/bench_tokenizer.py
+
+Checks that both tokenizers return identical tokens for every resume of the
+training CSV (data/resumes_clean.csv, or the synthetic corpus when the CSV is
+not in this checkout) after clean_text, and for randomized word sequences
+around NLTK's contraction rules. Then times tokenization per resume and over
+the whole corpus, and full preprocessing in both modes when the NLTK data
+used by ResumePreprocessor is installed. Exit status is 1 on any mismatch.
+"""
+
+import os
+import random
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(current_dir))
+
+from nltk.tokenize import word_tokenize
+
+from benchmarks.corpus import resume_texts, training_resumes
+from models.preprocessor import CONTRACTION_SPLITS, ResumePreprocessor, fast_tokenize
+
+SYNTHETIC_RESUMES = 1000
+FUZZ_CASES = 20000
+
+
+def reference_tokenizer():
+    """word_tokenize; without the Punkt data, its tokenizer alone (preserve_line)."""
+    try:
+        word_tokenize("warm up")
+        return word_tokenize, "word_tokenize"
+    except LookupError:
+        return (lambda text: word_tokenize(text, preserve_line=True),
+                "word_tokenize(preserve_line=True), Punkt data not installed")
+
+
+def cleaner():
+    try:
+        return ResumePreprocessor()
+    except LookupError:
+        # clean_text uses no NLTK data
+        return ResumePreprocessor.__new__(ResumePreprocessor)
+
+
+def fuzz_texts(count, seed=0):
+    rng = random.Random(seed)
+    words = list(CONTRACTION_SPLITS) + ['can', 'not', 'na', 'me', 'ta', 'dye', 'more', 'moren',
+                                        'gon', 'wan', 'python', 'data', 'a', 'i']
+    for _ in range(count):
+        parts = [rng.choice(words) for _ in range(rng.randint(0, 8))]
+        if parts and rng.random() < 0.3:
+            i = rng.randrange(len(parts))
+            parts[i] = parts[i] + rng.choice(words)
+        yield ' '.join(parts)
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    reference, reference_name = reference_tokenizer()
+    texts = training_resumes()
+    source = "training CSV"
+    if texts is None:
+        texts = resume_texts(SYNTHETIC_RESUMES, seed=41)
+        source = "synthetic corpus (data/resumes_clean.csv not found)"
+    preprocessor = cleaner()
+    cleaned = [preprocessor.clean_text(text) for text in texts]
+
+    print("=" * 72)
+    print("TOKENIZER BENCHMARK")
+    print("=" * 72)
+    print(f"Corpus:    {len(texts)} resumes, {source}")
+    print(f"Reference: {reference_name}")
+
+    mismatches = sum(fast_tokenize(text) != reference(text) for text in cleaned)
+    fuzz_mismatches = sum(fast_tokenize(text) != reference(text)
+                          for text in fuzz_texts(FUZZ_CASES))
+    print(f"Equivalence: {mismatches} mismatches over the corpus, "
+          f"{fuzz_mismatches} over {FUZZ_CASES} contraction cases")
+    print()
+
+    tokens = sum(len(fast_tokenize(text)) for text in cleaned)
+    nltk_s = timed(reference, cleaned)
+    fast_s = timed(fast_tokenize, cleaned)
+    print(f"{'Tokenization':<32} {'NLTK':>12} {'Fast':>12} {'Speedup':>8}")
+    print("-" * 72)
+    print(f"{'per resume':<32} {nltk_s / len(cleaned) * 1e6:>10.1f}us "
+          f"{fast_s / len(cleaned) * 1e6:>10.1f}us {nltk_s / fast_s:>7.1f}x")
+    print(f"{f'whole corpus ({tokens} tokens)':<32} {nltk_s * 1000:>10.1f}ms "
+          f"{fast_s * 1000:>10.1f}ms {nltk_s / fast_s:>7.1f}x")
+
+    try:
+        preprocessors = {mode: ResumePreprocessor(tokenizer=mode) for mode in ('nltk', 'fast')}
+        preprocessors['nltk'].preprocess("warm up")
+    except LookupError:
+        print("\nFull preprocessing timing skipped: NLTK stopwords/wordnet/punkt data not installed")
+    else:
+        preprocess_s = {mode: timed(p.preprocess, texts) for mode, p in preprocessors.items()}
+        same = all(preprocessors['nltk'].preprocess(t) == preprocessors['fast'].preprocess(t)
+                   for t in texts)
+        print(f"{'preprocess(), corpus':<32} {preprocess_s['nltk'] * 1000:>10.1f}ms "
+              f"{preprocess_s['fast'] * 1000:>10.1f}ms "
+              f"{preprocess_s['nltk'] / preprocess_s['fast']:>7.1f}x  same output: "
+              f"{'yes' if same else 'NO'}")
+        mismatches += not same
+
+    return 1 if mismatches or fuzz_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+corpus.py — Synthetic resume corpus shared by the benchmark scripts
+
+Everything is generated from a fixed seed so runs are comparable across
+machines and commits. No real candidate data is used, except by
+training_resumes(), which reads the training CSV when it is present.
+"""
+
+import io
+import os
+import random
+
+FIRST_NAMES = ['John', 'Priya', 'Maria', 'Wei', 'Ahmed', 'Sara', 'Lucas', 'Aisha', 'Kenji', 'Olga']
+LAST_NAMES = ['Doe', 'Sharma', 'Garcia', 'Chen', 'Khan', 'Larsen', 'Silva', 'Okafor', 'Tanaka', 'Ivanova']
+ROLES = ['Data Scientist', 'Web Developer', 'HR Manager', 'Financial Analyst', 'Civil Engineer',
+         'Sales Executive', 'Chef', 'Teacher', 'Graphic Designer', 'Consultant']
+VERBS = ['Developed', 'Managed', 'Led', 'Created', 'Implemented', 'Designed', 'Analyzed',
+         'Improved', 'Coordinated', 'Achieved', 'Executed', 'Built', 'Optimized', 'Delivered']
+OBJECTS = ['a reporting pipeline', 'the onboarding process', 'customer dashboards', 'REST APIs',
+           'quarterly budgets', 'a team of 6 engineers', 'marketing campaigns', 'supplier contracts',
+           'ETL jobs in Python and SQL', 'training material for new hires', 'a React front end',
+           'site inspections and safety audits', 'menu costing and inventory', 'lesson plans']
+OUTCOMES = ['reducing cost by 18%', 'improving retention by 12%', 'cutting latency in half',
+            'increasing revenue by $1.2M', 'ahead of schedule', 'with zero safety incidents',
+            'raising satisfaction scores to 4.8/5', 'across three regions']
+SKILLS = ['Python', 'SQL', 'Excel', 'Tableau', 'JavaScript', 'React', 'AWS', 'Docker', 'AutoCAD',
+          'Salesforce', 'Photoshop', 'Figma', 'Java', 'Power BI', 'Kubernetes', 'Git', 'SAP',
+          'Project Management', 'Negotiation', 'Public Speaking', 'Machine Learning', 'Pandas']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University']
+
+
+def _bullet(rng):
+    return f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}, {rng.choice(OUTCOMES)}"
+
+
+def resume_header(rng):
+    """Name/contact lines that a real resume repeats at the top of each page."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return [
+        f"{first.upper()} {last.upper()}",
+        f"{first.lower()}.{last.lower()}@example.com | +1-555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+    ]
+
+
+def resume_lines(rng, jobs=3, bullets_per_job=5):
+    """Body lines of one synthetic resume, without the header."""
+    lines = ['PROFESSIONAL SUMMARY',
+             f"{rng.choice(ROLES)} with {rng.randint(2, 15)} years of experience "
+             f"in {rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}.",
+             '', 'EXPERIENCE']
+    for year in range(2024, 2024 - jobs * 2, -2):
+        lines.append(f"{rng.choice(ROLES)} - Company {rng.randint(1, 99)} ({year - 2}-{year})")
+        lines.extend(_bullet(rng) for _ in range(bullets_per_job))
+        lines.append('')
+    lines.append('EDUCATION')
+    lines.append(f"Bachelor of Science - {rng.choice(SCHOOLS)} ({rng.randint(2005, 2018)})")
+    lines.append('')
+    lines.append('SKILLS')
+    lines.append(', '.join(rng.sample(SKILLS, 8)))
+    return lines
+
+
+def resume_text(seed=0, jobs=3, bullets_per_job=5):
+    rng = random.Random(seed)
+    return '\n'.join(resume_header(rng) + resume_lines(rng, jobs, bullets_per_job))
+
+
+def resume_texts(count, seed=0, min_jobs=1, max_jobs=6):
+    """A list of `count` resumes of varying length."""
+    rng = random.Random(seed)
+    return [resume_text(seed=rng.randint(0, 10 ** 9), jobs=rng.randint(min_jobs, max_jobs))
+            for _ in range(count)]
+
+
+def training_resumes(limit=None):
+    """
+    Resume texts of data/resumes_clean.csv (the training set), or None when
+    the CSV is not present in this checkout.
+    """
+    csv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'data', 'resumes_clean.csv')
+    if not os.path.exists(csv_path):
+        return None
+    import pandas as pd
+    texts = pd.read_csv(csv_path)['Resume'].fillna('').astype(str).tolist()
+    return texts[:limit] if limit else texts
+
+
+def resume_pages(pages, lines_per_page=45, seed=0):
+    """
+    Page-by-page lines of a long resume. Every page starts with the same
+    name/contact header and ends with a "Page N of M" footer.
+    """
+    rng = random.Random(seed)
+    header = resume_header(rng)
+    body = []
+    while len(body) < pages * lines_per_page:
+        body.extend(resume_lines(rng, jobs=4, bullets_per_job=6))
+    result = []
+    for page_num in range(pages):
+        chunk = body[page_num * lines_per_page:(page_num + 1) * lines_per_page]
+        result.append(header + chunk + [f"Page {page_num + 1} of {pages}"])
+    return result
+
+
+# ── File builders ───────────────────────────────────────────
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def build_pdf(pages):
+    """
+    Minimal single-font PDF writer. `pages` is a list of pages, each a list
+    of text lines. Returns the PDF as bytes.
+    """
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(None)
+    page_tree = add(None)
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    page_ids = []
+    for lines in pages:
+        ops = ["BT /F1 9 Tf 11 TL 40 800 Td"]
+        for line in lines:
+            ops.append(f"({_pdf_escape(line)}) Tj T*")
+        ops.append("ET")
+        stream = '\n'.join(ops).encode('latin-1', 'replace')
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (page_tree, font, content)
+        ))
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % page_tree
+    kids = b' '.join(b"%d 0 R" % pid for pid in page_ids)
+    objects[page_tree - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % num + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+              % (len(objects) + 1, catalog, xref))
+    return out.getvalue()
+
+
+def build_docx(lines, table_rows=0, table_cols=4, merged=False, seed=0):
+    """
+    DOCX with one paragraph per line followed by a table of `table_rows` rows.
+    With `merged`, every other row spans its first two cells. Returns bytes.
+    """
+    import docx
+
+    rng = random.Random(seed)
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    if table_rows:
+        table = document.add_table(rows=table_rows, cols=table_cols)
+        for r, row in enumerate(table.rows):
+            if merged and r % 2:
+                row.cells[0].merge(row.cells[1])
+            for c, cell in enumerate(row.cells):
+                if merged and r % 2 and c == 1:
+                    continue
+                cell.text = f"{rng.choice(SKILLS)} {rng.choice(OUTCOMES)}"
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
@@ -0,0 +1,280 @@
+"""
+bulk_ingest.py — Batch resume ingestion from zip archives and multipart file lists
+
+Files are pulled from the upload one at a time and their text is extracted
+on a small pool of threads, which only wait on the parser sandbox processes
+and on file I/O. Extracted texts are collected and analyzed a batch at a
+time by the caller's analyze function, which spreads the Python-heavy work
+(preprocessing) over processes and scores the batch in one pass over the
+forest, while the threads extract the next files. Results are yielded per
+file as each batch finishes.
+
+Only a fixed window of files is ever in flight (being extracted or waiting
+for analysis), and large archive members are spooled to temporary files
+rather than memory, so a batch of any size runs in bounded memory. A file
+that cannot be read produces an error result and the batch carries on.
+"""
+
+import os
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from extraction.documents import kind_for_filename
+from extraction.spool import SPOOL_THRESHOLD
+
+# Largest uncompressed archive member accepted (guards against zip bombs)
+MAX_MEMBER_BYTES = 50 * 1024 * 1024
+
+COPY_CHUNK = 64 * 1024
+
+
+class BatchItem:
+    """
+    One file of a batch.
+
+    Attributes:
+        filename:   Name reported back to the client
+        kind:       'pdf' or 'docx', or None when the file is rejected
+        source:     Document bytes, or the path of a file on disk
+        owned_path: Temporary file created for this item, removed when it is done
+        error:      Why the file was rejected before processing, if it was
+    """
+
+    def __init__(self, filename, kind=None, source=None, owned_path=None, error=None):
+        self.index = None
+        self.filename = filename
+        self.kind = kind
+        self.source = source
+        self.owned_path = owned_path
+        self.error = error
+
+    def discard(self):
+        if self.owned_path:
+            try:
+                os.remove(self.owned_path)
+            except OSError:
+                pass
+            self.owned_path = None
+
+
+def _is_resume(filename):
+    name = filename.lower()
+    return name.endswith('.pdf') or name.endswith('.docx')
+
+
+def _is_junk(name):
+    base = os.path.basename(name.rstrip('/'))
+    return name.startswith('__MACOSX/') or base.startswith('.') or not base
+
+
+def _read_member(archive, info, threshold, spool_dir, max_bytes):
+    """Returns (source, owned_path) for one archive member, spooling large ones."""
+    with archive.open(info) as member:
+        head = member.read(threshold + 1)
+        if len(head) <= threshold:
+            return head, None
+
+        out = tempfile.NamedTemporaryFile(
+            'wb', prefix='batch-', suffix='.part', dir=spool_dir, delete=False
+        )
+        try:
+            with out:
+                out.write(head)
+                written = len(head)
+                while True:
+                    chunk = member.read(COPY_CHUNK)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise ValueError("File is too large")
+                    out.write(chunk)
+        except Exception:
+            os.remove(out.name)
+            raise
+        return out.name, out.name
+
+
+def iter_zip_items(file, archive_name, threshold=SPOOL_THRESHOLD, spool_dir=None,
+                   max_member_bytes=MAX_MEMBER_BYTES):
+    """
+    Yields a BatchItem per file in a zip archive, reading members lazily.
+
+    Args:
+        file:         Seekable file object of the archive
+        archive_name: Name of the archive, used in error results
+    """
+    try:
+        archive = zipfile.ZipFile(file)
+    except (zipfile.BadZipFile, OSError) as e:
+        yield BatchItem(archive_name, error=f"Could not open archive: {str(e)}")
+        return
+
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir() or _is_junk(info.filename):
+                continue
+            if not _is_resume(info.filename):
+                yield BatchItem(info.filename, error='Invalid file format. Please upload PDF or DOCX')
+                continue
+            if info.file_size > max_member_bytes:
+                yield BatchItem(info.filename, error='File is too large')
+                continue
+            try:
+                source, owned_path = _read_member(archive, info, threshold, spool_dir,
+                                                  max_member_bytes)
+            except Exception as e:
+                yield BatchItem(info.filename, error=f"Could not read file from archive: {str(e)}")
+                continue
+            yield BatchItem(info.filename, kind_for_filename(info.filename.lower()),
+                            source, owned_path)
+
+
+def iter_upload_items(files, threshold=SPOOL_THRESHOLD, spool_dir=None):
+    """
+    Yields a BatchItem per uploaded file (werkzeug FileStorage), expanding zip
+    archives. Files the request already spooled to disk are read by path.
+    """
+    for file in files:
+        filename = file.filename or ''
+        lower = filename.lower()
+        if lower.endswith('.zip'):
+            file.stream.seek(0)
+            yield from iter_zip_items(file.stream, filename, threshold, spool_dir)
+            continue
+        if not filename:
+            yield BatchItem(filename, error='No file selected')
+            continue
+        if not _is_resume(filename):
+            yield BatchItem(filename, error='Invalid file format. Please upload PDF or DOCX')
+            continue
+
+        stream = file.stream
+        name = getattr(stream, 'name', None)
+        if isinstance(name, str) and os.path.isfile(name):
+            stream.flush()
+            source = name
+        else:
+            stream.seek(0)
+            source = stream.read()
+        yield BatchItem(filename, kind_for_filename(lower), source)
+
+
+def run_batch(items, extract, analyze, workers: int = 2, batch_size: int = None):
+    """
+    Extracts batch items on a thread pool and analyzes the extracted texts a
+    batch at a time, yielding one result per item as its batch finishes.
+
+    Args:
+        items:      Iterable of BatchItem, consumed lazily
+        extract:    extract(kind, source) -> (text, None), or (None, (response
+                    body, HTTP status)) when the file cannot be read
+        analyze:    analyze(texts) -> [(response body, HTTP status), ...] in order
+        workers:    Extraction threads, i.e. files parsed at once
+        batch_size: Texts analyzed together (default: `workers`); at most
+                    workers + batch_size files are in flight
+
+    Yields:
+        {'index', 'filename', 'status', 'result' | 'error'}, a batch at a time
+    """
+    workers = max(1, workers)
+    batch_size = max(1, batch_size or workers)
+    window = workers + batch_size
+    items = iter(items)
+    pending = {}
+    ready = []              # (item, extracted text)
+    index = 0
+    exhausted = False
+
+    def _result(item, body, status):
+        line = {'index': item.index, 'filename': item.filename, 'status': status}
+        if status == 200:
+            line['result'] = body
+        else:
+            line['error'] = body.get('error', 'Could not process file')
+        return line
+
+    def _analyze(batch):
+        try:
+            results = analyze([text for _, text in batch])
+        except Exception as e:
+            print(f"[BATCH] Analysis of {len(batch)} files failed: {str(e)}")
+            results = [({'error': f"Server error: {str(e)}"}, 500)] * len(batch)
+        return [_result(item, body, status) for (item, _), (body, status) in zip(batch, results)]
+
+    with ThreadPoolExecutor(max_workers=workers,
+                            thread_name_prefix='resume-batch') as executor:
+        try:
+            while pending or ready or not exhausted:
+                while not exhausted and len(pending) + len(ready) < window:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    item.index = index
+                    index += 1
+                    if item.error:
+                        yield _result(item, {'error': item.error}, 400)
+                        continue
+                    pending[executor.submit(extract, item.kind, item.source)] = item
+
+                # Analyze a full batch, or what is left once nothing is being
+                # extracted; the threads keep extracting the refilled window
+                if ready and (len(ready) >= batch_size or not pending):
+                    batch, ready = ready[:batch_size], ready[batch_size:]
+                    yield from _analyze(batch)
+                    continue
+                if not pending:
+                    continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    item.discard()
+                    try:
+                        text, error = future.result()
+                    except Exception as e:
+                        print(f"[BATCH] '{item.filename}' failed: {str(e)}")
+                        text, error = None, ({'error': f"Server error: {str(e)}"}, 500)
+                    if error:
+                        yield _result(item, *error)
+                    else:
+                        ready.append((item, text))
+        finally:
+            # Client went away or the batch was aborted: drop queued work
+            for future, item in pending.items():
+                future.cancel()
+            executor.shutdown(wait=True)
+            for item in pending.values():
+                item.discard()
+            close = getattr(items, 'close', None)
+            if close:
+                close()
+
+
+class BatchSummary:
+    """Running totals for the final NDJSON line of a batch."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.files = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def add(self, line):
+        self.files += 1
+        if line['status'] == 200:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    def to_dict(self) -> dict:
+        return {
+            'done': True,
+            'files': self.files,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'elapsed_seconds': round(time.perf_counter() - self.started, 3),
+        }
@@ -0,0 +1,92 @@
+"""
+boilerplate.py — Removal of running headers and footers from multi-page PDF text
+
+Resume templates repeat the candidate's name, contact line and a
+"Page N of M" footer on every page. One pass counts how many pages carry
+each line near their top or bottom edge; lines found on enough pages (and
+on at least three, so a two-page resume whose pages happen to start alike
+is left alone) are kept at their first occurrence and dropped everywhere
+else, so the contact details still reach the ATS checker exactly once.
+Lines are compared as written, except that page numbers are masked.
+"""
+
+import math
+import re
+
+# Non-blank lines at each edge of a page considered as header/footer candidates
+EDGE_LINES = 3
+
+# Share of pages a line must appear on to count as a running header/footer
+MIN_PAGE_FRACTION = 0.5
+
+# Fewest pages a line must appear on, whatever the share
+MIN_REPEATS = 3
+
+_SPACES = re.compile(r'\s+')
+# "Page 2", "page 2 of 5", "Page 2/5"
+_PAGE_OF = re.compile(r'\bpage \d+(?: ?(?:of|/) ?\d+)?\b')
+# A line that is only a page number: "2", "- 2 -", "2 / 5", "2 of 5"
+_BARE_PAGE_NUMBER = re.compile(r'^[\W_]*\d+(?: ?(?:of|/) ?\d+)?[\W_]*$')
+
+
+def _line_key(line):
+    # Page numbers differ per page, so "Page 2 of 5" and "Page 3 of 5" share a
+    # key; other digits ("Led a team of 5", "2019 - 2021") are kept
+    key = _SPACES.sub(' ', line).strip().lower()
+    if _BARE_PAGE_NUMBER.match(key):
+        return '#'
+    return _PAGE_OF.sub('page #', key)
+
+
+def _edge_indexes(lines, edge_lines):
+    nonblank = [i for i, line in enumerate(lines) if line.strip()]
+    if len(nonblank) <= 2 * edge_lines:
+        return nonblank
+    return nonblank[:edge_lines] + nonblank[-edge_lines:]
+
+
+def strip_repeated_lines(page_texts, edge_lines=EDGE_LINES, min_fraction=MIN_PAGE_FRACTION):
+    """
+    Drops header/footer lines repeated across pages.
+
+    Runs in time linear in the total text length: each line is visited a
+    constant number of times and repeats are counted in a dict.
+
+    Args:
+        page_texts:   Text of each page, in order
+        edge_lines:   Lines from the top and bottom of each page to consider
+        min_fraction: Share of pages (at least MIN_REPEATS) a line must appear on
+
+    Returns:
+        The page texts with repeats of running headers/footers removed
+    """
+    if len(page_texts) < MIN_REPEATS:
+        return page_texts
+
+    pages = [text.split('\n') for text in page_texts]
+    page_edges = []
+    counts = {}
+    for lines in pages:
+        edges = {i: _line_key(lines[i]) for i in _edge_indexes(lines, edge_lines)}
+        for key in set(edges.values()):
+            counts[key] = counts.get(key, 0) + 1
+        page_edges.append(edges)
+
+    min_pages = max(MIN_REPEATS, math.ceil(len(pages) * min_fraction))
+    repeated = {key for key, pages_seen in counts.items() if pages_seen >= min_pages}
+    if not repeated:
+        return page_texts
+
+    seen = set()
+    result = []
+    for lines, edges in zip(pages, page_edges):
+        kept = []
+        for i, line in enumerate(lines):
+            key = edges.get(i)
+            if key in repeated:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(line)
+        result.append('\n'.join(kept))
+    return result
@@ -0,0 +1,200 @@
+"""
+cache.py — Content-addressed cache of text extracted from uploaded resumes
+
+Entries are keyed by the SHA-256 of the uploaded bytes, so re-uploading the
+exact same PDF/DOCX skips parsing entirely. A bounded in-memory LRU sits in
+front of an optional on-disk store that evicts least recently used files
+once it grows past its byte budget.
+
+The lock only guards the indexes: files are read, written and removed
+outside it, so a slow disk delays the uploads that touch it and no others.
+Entries are stored as the UTF-8 bytes of the text and read back as bytes, so
+a disk hit returns exactly the text that was stored (line endings included).
+"""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+# Bump whenever extraction output changes, so stale entries are never served.
+EXTRACTION_VERSION = 2
+
+
+class ExtractionCache:
+    def __init__(self, max_entries: int = 256, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = 200 * 1024 * 1024):
+        """
+        Args:
+            max_entries:    Texts kept in memory
+            disk_dir:       Folder for the on-disk store (None = memory only)
+            max_disk_bytes: Size budget of the on-disk store
+        """
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory = OrderedDict()
+        self._disk = OrderedDict()          # key -> file size, oldest first
+        self._disk_bytes = 0
+        self._writing = set()               # keys being written to disk
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    @staticmethod
+    def key_for(digest: str, kind: str) -> str:
+        """Cache key for an upload: extractor version, file kind and SHA-256 hex digest."""
+        return f"v{EXTRACTION_VERSION}-{kind}-{digest.lower()}"
+
+    # ─────────────────────────────────────────────
+    # LOOKUP / STORE
+    # ─────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return text
+            if key not in self._disk:
+                self.misses += 1
+                return None
+
+        text = self._read_disk(key)
+        with self._lock:
+            if text is None:
+                # Evicted or unreadable since the lookup
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_bytes -= size
+                self.misses += 1
+                return None
+            if key in self._disk:
+                self._disk.move_to_end(key)
+            self.disk_hits += 1
+            self._remember(key, text)
+            return text
+
+    def put(self, key: str, text: str):
+        with self._lock:
+            self._remember(key, text)
+            write = bool(self.disk_dir) and key not in self._disk and key not in self._writing
+            if write:
+                self._writing.add(key)
+        if not write:
+            return
+
+        size = self._write_disk(key, text)
+        with self._lock:
+            self._writing.discard(key)
+            if size is None or key in self._disk:
+                return
+            self._disk[key] = size
+            self._disk_bytes += size
+            evicted = self._evict_disk()
+        self._remove_files(evicted)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_entries': len(self._memory),
+                'memory_hits': self.memory_hits,
+                'memory_evictions': self.memory_evictions,
+                'disk_enabled': bool(self.disk_dir),
+                'disk_entries': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+                'disk_hits': self.disk_hits,
+                'disk_evictions': self.disk_evictions,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    # Caller holds the lock
+    def _remember(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key + '.txt')
+
+    def _load_disk_index(self):
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith('.txt'):
+                continue
+            stat = os.stat(os.path.join(self.disk_dir, name))
+            entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._remove_files(self._evict_disk())
+
+    # Without the lock: file I/O
+    def _read_disk(self, key):
+        """The stored text, or None if the file is gone or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data.decode('utf-8', 'surrogatepass')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _write_disk(self, key, text):
+        """Writes the entry's file; its size in bytes, or None if it could not be written."""
+        data = text.encode('utf-8', 'surrogatepass')
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"[CACHE] Could not write extraction cache entry: {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return None
+        return len(data)
+
+    def _remove_files(self, keys):
+        # A key written again after its eviction may lose its new file here;
+        # the next lookup then finds it missing and treats it as a miss
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    # Caller holds the lock
+    def _evict_disk(self):
+        """Drops least recently used entries past the byte budget; their keys."""
+        evicted = []
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self.disk_evictions += 1
+            evicted.append(key)
+        return evicted
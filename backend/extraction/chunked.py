@@ -0,0 +1,354 @@
+"""
+chunked.py — Resumable chunked uploads assembled on local disk
+
+A client initiates an upload with the file size, the chunk size and the
+SHA-256 of the whole file, then sends numbered chunks in any order; a chunk
+that is sent again simply overwrites itself, so retries after a dropped
+connection are safe. Each chunk is written straight to its offset in a
+preallocated file, optionally checked against a per-chunk SHA-256 (so a
+corrupt chunk is resent on its own), and the finished file is checked
+against the whole-file SHA-256 before it is handed to the parsers. Uploads
+that go quiet are removed by a background collector, and the number of
+uploads in progress at once is capped, since each holds a preallocated file
+of its full size.
+"""
+
+import hashlib
+import math
+import os
+import tempfile
+import threading
+import time
+import uuid
+from typing import Optional
+
+MIN_CHUNK_BYTES = 64 * 1024
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+MAX_CHUNK_BYTES = 8 * 1024 * 1024
+
+HASH_BLOCK = 1024 * 1024
+
+
+class ChunkedUploadError(Exception):
+    """The request does not fit the upload it refers to."""
+
+
+class UploadNotFoundError(ChunkedUploadError):
+    """No such upload, or it was finalized, aborted or collected."""
+
+
+class TooManyUploadsError(ChunkedUploadError):
+    """max_active uploads are already in progress."""
+
+
+class ChunkedUpload:
+    """
+    Attributes:
+        id:          Upload id handed to the client
+        filename:    Original file name
+        kind:        'pdf' or 'docx'
+        size:        Declared file size in bytes
+        chunk_size:  Size of every chunk but the last
+        chunk_count: Number of chunks
+        sha256:      Expected hex digest of the whole file
+        path:        File the chunks are assembled in
+        received:    Indexes of chunks written so far
+    """
+
+    def __init__(self, filename, kind, size, chunk_size, sha256, path):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.kind = kind
+        self.size = size
+        self.chunk_size = chunk_size
+        self.chunk_count = max(1, math.ceil(size / chunk_size))
+        self.sha256 = sha256
+        self.path = path
+        self.received = set()
+        self.created_at = time.time()
+        self.last_activity = self.created_at
+        self.lock = threading.Lock()
+
+    def chunk_length(self, index):
+        if index == self.chunk_count - 1:
+            return self.size - index * self.chunk_size
+        return self.chunk_size
+
+    def missing(self):
+        return [i for i in range(self.chunk_count) if i not in self.received]
+
+    def to_dict(self, missing_limit=100) -> dict:
+        missing = self.missing()
+        return {
+            'upload_id': self.id,
+            'filename': self.filename,
+            'size': self.size,
+            'chunk_size': self.chunk_size,
+            'chunk_count': self.chunk_count,
+            'received_chunks': len(self.received),
+            'missing_chunks': missing[:missing_limit],
+            'complete': not missing,
+        }
+
+
+class ChunkedUploadStore:
+    def __init__(self, directory: Optional[str] = None,
+                 max_upload_bytes: int = 50 * 1024 * 1024,
+                 max_chunk_bytes: int = MAX_CHUNK_BYTES,
+                 ttl: float = 3600.0, gc_interval: float = 300.0, max_active: int = 64):
+        """
+        Args:
+            directory:        Folder for partial files (None = a folder in the system temp dir)
+            max_upload_bytes: Largest file accepted
+            max_chunk_bytes:  Largest chunk accepted
+            max_active:       Uploads in progress at once; more are refused until
+                              one is finalized, aborted or collected
+            ttl:              Seconds without a chunk after which an upload is collected
+            gc_interval:      Seconds between garbage collection runs
+        """
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'resume-chunked-uploads')
+        self.max_upload_bytes = max_upload_bytes
+        self.max_chunk_bytes = max_chunk_bytes
+        self.ttl = ttl
+        self.gc_interval = gc_interval
+        self.max_active = max_active
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._uploads = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._gc_thread = None
+
+        self.initiated = 0
+        self.completed = 0
+        self.aborted = 0
+        self.expired = 0
+        self.integrity_failures = 0
+        self.refused = 0
+
+    # ─────────────────────────────────────────────
+    # PROTOCOL
+    # ─────────────────────────────────────────────
+
+    def initiate(self, filename: str, kind: str, size: int, sha256: str,
+                 chunk_size: int = DEFAULT_CHUNK_BYTES) -> ChunkedUpload:
+        """
+        Registers a new upload and preallocates its file.
+
+        Args:
+            sha256: Hex SHA-256 digest of the whole file, checked by finalize()
+
+        Raises:
+            TooManyUploadsError: max_active uploads are already in progress
+            ChunkedUploadError:  Invalid size, chunk size or sha256
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ChunkedUploadError("File size must be a positive number of bytes")
+        if size > self.max_upload_bytes:
+            raise ChunkedUploadError(
+                f"File size must be less than {self.max_upload_bytes // (1024 * 1024)}MB"
+            )
+        if not isinstance(chunk_size, int) or not MIN_CHUNK_BYTES <= chunk_size <= self.max_chunk_bytes:
+            raise ChunkedUploadError(
+                f"Chunk size must be between {MIN_CHUNK_BYTES} and {self.max_chunk_bytes} bytes"
+            )
+        if not isinstance(sha256, str):
+            raise ChunkedUploadError("sha256 of the whole file is required")
+        sha256 = sha256.strip().lower()
+        if len(sha256) != 64 or any(c not in '0123456789abcdef' for c in sha256):
+            raise ChunkedUploadError("sha256 must be a hex SHA-256 digest")
+        self._check_capacity()
+
+        fd, path = tempfile.mkstemp(prefix='chunked-', suffix='.part', dir=self.directory)
+        try:
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+        upload = ChunkedUpload(filename, kind, size, chunk_size, sha256, path)
+        try:
+            # Checked again: other uploads may have been initiated meanwhile
+            self._check_capacity(register=upload)
+        except TooManyUploadsError:
+            self._remove(path)
+            raise
+        return upload
+
+    def put_chunk(self, upload_id: str, index: int, data: bytes,
+                  checksum: Optional[str] = None) -> ChunkedUpload:
+        """
+        Writes one chunk at its offset. Chunks may arrive in any order and
+        may be sent more than once.
+
+        Args:
+            checksum: Expected SHA-256 hex digest of the chunk, if the client sent one
+        """
+        upload = self.get(upload_id)
+        if not 0 <= index < upload.chunk_count:
+            raise ChunkedUploadError(f"Chunk index must be between 0 and {upload.chunk_count - 1}")
+        expected = upload.chunk_length(index)
+        if len(data) != expected:
+            raise ChunkedUploadError(f"Chunk {index} must be {expected} bytes, got {len(data)}")
+        if checksum and hashlib.sha256(data).hexdigest() != checksum.strip().lower():
+            self._count('integrity_failures')
+            raise ChunkedUploadError(f"Chunk {index} failed its checksum, please resend it")
+
+        with upload.lock:
+            # Finalize/abort/GC take the upload out of the registry first
+            self.get(upload_id)
+            with open(upload.path, 'r+b') as f:
+                f.seek(index * upload.chunk_size)
+                f.write(data)
+            upload.received.add(index)
+            upload.last_activity = time.time()
+        return upload
+
+    def finalize(self, upload_id: str) -> ChunkedUpload:
+        """
+        Verifies the assembled file and hands it over: the caller now owns
+        upload.path and must delete it. collect_garbage() removes it if it
+        is still there ttl seconds later (left behind by a crash).
+        """
+        upload = self.get(upload_id)
+        with upload.lock:
+            missing = upload.missing()
+            if missing:
+                shown = ', '.join(str(i) for i in missing[:20])
+                raise ChunkedUploadError(
+                    f"{len(missing)} chunk(s) still missing: {shown}{' …' if len(missing) > 20 else ''}"
+                )
+            with self._lock:
+                if self._uploads.pop(upload_id, None) is None:
+                    raise UploadNotFoundError("Unknown or expired upload")
+            # The sweep in collect_garbage() gives .upload files ttl seconds
+            # from now, however long ago the last chunk arrived
+            ready_path = upload.path[:-len('.part')] + '.upload'
+            os.replace(upload.path, ready_path)
+            os.utime(ready_path)
+            upload.path = ready_path
+
+        if self._file_digest(upload.path) != upload.sha256:
+            self._count('integrity_failures')
+            self._remove(upload.path)
+            raise ChunkedUploadError("Assembled file does not match its checksum, please upload it again")
+
+        self._count('completed')
+        return upload
+
+    def abort(self, upload_id: str):
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+            if upload is None:
+                raise UploadNotFoundError("Unknown or expired upload")
+            self.aborted += 1
+        with upload.lock:
+            self._remove(upload.path)
+
+    def get(self, upload_id: str) -> ChunkedUpload:
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise UploadNotFoundError("Unknown or expired upload")
+        return upload
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'active': len(self._uploads),
+                'initiated': self.initiated,
+                'completed': self.completed,
+                'aborted': self.aborted,
+                'expired': self.expired,
+                'integrity_failures': self.integrity_failures,
+                'refused': self.refused,
+                'max_active': self.max_active,
+            }
+
+    # ─────────────────────────────────────────────
+    # GARBAGE COLLECTION
+    # ─────────────────────────────────────────────
+
+    def start(self):
+        """Starts the background collector for abandoned uploads."""
+        if self._gc_thread is None:
+            self._gc_thread = threading.Thread(target=self._gc_loop, name='chunked-upload-gc',
+                                               daemon=True)
+            self._gc_thread.start()
+
+    def shutdown(self):
+        self._stop.set()
+
+    def collect_garbage(self) -> int:
+        """
+        Removes uploads idle for longer than ttl, plus partial and finalized
+        files older than ttl that nothing tracks any more (left by a previous
+        run, or by a crash between finalize and the caller deleting the
+        file). Returns the number of uploads removed.
+        """
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            stale = [upload for upload in self._uploads.values() if upload.last_activity < cutoff]
+            for upload in stale:
+                del self._uploads[upload.id]
+            self.expired += len(stale)
+            live_paths = {upload.path for upload in self._uploads.values()}
+
+        for upload in stale:
+            with upload.lock:
+                self._remove(upload.path)
+
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if (not name.startswith('chunked-') or not name.endswith(('.part', '.upload'))
+                    or path in live_paths):
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+        if stale:
+            print(f"[UPLOADS] Collected {len(stale)} abandoned chunked upload(s)")
+        return len(stale)
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    def _gc_loop(self):
+        while not self._stop.wait(self.gc_interval):
+            try:
+                self.collect_garbage()
+            except Exception as e:
+                print(f"[UPLOADS] Garbage collection failed: {str(e)}")
+
+    def _check_capacity(self, register=None):
+        with self._lock:
+            if len(self._uploads) >= self.max_active:
+                self.refused += 1
+                raise TooManyUploadsError(
+                    "Too many uploads in progress, please retry shortly"
+                )
+            if register is not None:
+                self._uploads[register.id] = register
+                self.initiated += 1
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @staticmethod
+    def _file_digest(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
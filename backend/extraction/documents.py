@@ -0,0 +1,27 @@
+"""
+documents.py — Dispatches an uploaded resume to the right text extractor
+"""
+
+from extraction.docx_text import extract_text_from_docx
+from extraction.pdf_text import extract_text_from_pdf
+
+
+def kind_for_filename(filename: str) -> str:
+    """'pdf' or 'docx' for an upload that already passed the extension check."""
+    return 'pdf' if filename.lower().endswith('.pdf') else 'docx'
+
+
+def extract_document(kind, file, parallel=True, path=None):
+    """
+    Extracts text from a PDF/DOCX file object.
+
+    Args:
+        kind:     'pdf' or 'docx'
+        file:     Binary file object positioned at the start of the document
+        parallel: Allow large PDFs to fan pages out to the process pool (or
+                  the ParallelPdfExtractor to fan them out to)
+        path:     The document on disk, when it is spooled there already
+    """
+    if kind == 'pdf':
+        return extract_text_from_pdf(file, parallel=parallel, path=path)
+    return extract_text_from_docx(file)
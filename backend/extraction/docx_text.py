@@ -0,0 +1,261 @@
+"""
+docx_text.py — DOCX text extraction for uploaded resumes
+
+extract_text_from_docx streams the main document part straight out of the
+zip with an incremental XML parser instead of building the python-docx
+object model. Only one body paragraph or table cell is held in memory at a
+time, and parsing stops as soon as the MAX_TEXT_CHARS cap is reached.
+
+The output is identical to the python-docx implementation, kept below as
+extract_text_from_docx_dom: body paragraphs first, then one line per table
+row, with merged cells repeated the way python-docx's row.cells repeats them.
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+
+import docx
+
+from extraction.limits import MAX_TEXT_CHARS
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_TYPES_NS = '{http://schemas.openxmlformats.org/package/2006/content-types}'
+
+_OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_WML_DOCUMENT_MAIN = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml'
+
+_BODY = _W + 'body'
+_P = _W + 'p'
+_R = _W + 'r'
+_HYPERLINK = _W + 'hyperlink'
+_TBL = _W + 'tbl'
+_TBLGRID = _W + 'tblGrid'
+_GRIDCOL = _W + 'gridCol'
+_TR = _W + 'tr'
+_TC = _W + 'tc'
+_TCPR = _W + 'tcPr'
+_GRIDSPAN = _W + 'gridSpan'
+_VMERGE = _W + 'vMerge'
+_VAL = _W + 'val'
+_BR = _W + 'br'
+_BR_TYPE = _W + 'type'
+
+# Run children python-docx renders as fixed text; w:t and w:br are handled separately.
+_RUN_SYMBOLS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+_T = _W + 't'
+
+
+# ── Text of paragraphs and runs ─────────────────────────────
+
+def _run_text(r):
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or '')
+        elif tag == _BR:
+            if child.get(_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            symbol = _RUN_SYMBOLS.get(tag)
+            if symbol:
+                parts.append(symbol)
+    return ''.join(parts)
+
+
+def _paragraph_text(p):
+    parts = []
+    for child in p:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(r) for r in child if r.tag == _R)
+    return ''.join(parts)
+
+
+def _cell_text(tc):
+    return '\n'.join(_paragraph_text(p) for p in tc if p.tag == _P)
+
+
+def _cell_merge(tc):
+    """(grid span, vertically continued?) of a w:tc element."""
+    tc_pr = tc.find(_TCPR)
+    if tc_pr is None:
+        return 1, False
+    grid_span = tc_pr.find(_GRIDSPAN)
+    v_merge = tc_pr.find(_VMERGE)
+    span = int(grid_span.get(_VAL)) if grid_span is not None else 1
+    continued = v_merge is not None and v_merge.get(_VAL, 'continue') == 'continue'
+    return span, continued
+
+
+# ── Package structure ───────────────────────────────────────
+
+def _main_document_part(zf):
+    """Name of the main document part inside the zip, checked to be a Word document."""
+    part = 'word/document.xml'
+    try:
+        rels = ET.fromstring(zf.read('_rels/.rels'))
+        for rel in rels.iter(_RELS_NS + 'Relationship'):
+            if rel.get('Type') == _OFFICE_DOCUMENT_REL:
+                part = posixpath.normpath(rel.get('Target', part).lstrip('/'))
+                break
+    except KeyError:
+        pass
+
+    content_type = None
+    types = ET.fromstring(zf.read('[Content_Types].xml'))
+    for override in types.iter(_TYPES_NS + 'Override'):
+        if override.get('PartName', '').lstrip('/').lower() == part.lower():
+            content_type = override.get('ContentType')
+            break
+    if content_type is None:
+        extension = posixpath.splitext(part)[1].lstrip('.').lower()
+        for default in types.iter(_TYPES_NS + 'Default'):
+            if default.get('Extension', '').lower() == extension:
+                content_type = default.get('ContentType')
+                break
+    if content_type != _WML_DOCUMENT_MAIN:
+        raise ValueError(f"file is not a Word file, content type is '{content_type}'")
+    return part
+
+
+# ── Streaming extractor ─────────────────────────────────────
+
+class _DocxTextCollector:
+    """
+    Receives body paragraphs and table rows in document order and keeps
+    only what can still land inside the character cap.
+    """
+
+    def __init__(self, char_limit):
+        self.char_limit = char_limit
+        self.paragraphs = []
+        self.paragraphs_length = -1     # '\n'.join length of self.paragraphs
+        self.tables_text = []
+        self.tables_length = -1
+
+    @property
+    def full(self):
+        """Paragraphs are emitted before tables, so nothing later can change the output."""
+        return self.paragraphs_length >= self.char_limit
+
+    @property
+    def tables_full(self):
+        return self.tables_length >= self.char_limit
+
+    def add_paragraph(self, text):
+        if text.strip():
+            self.paragraphs.append(text)
+            self.paragraphs_length += len(text) + 1
+
+    def add_table(self, cells, col_count, row_count):
+        # Same flat row slicing as python-docx's Table.row_cells()
+        for row_idx in range(row_count):
+            row = cells[row_idx * col_count:row_idx * col_count + col_count]
+            row_text = [text for text in row if text.strip()]
+            if row_text:
+                line = ' '.join(row_text)
+                self.tables_text.append(line)
+                self.tables_length += len(line) + 1
+
+    def text(self):
+        return '\n'.join(self.paragraphs + self.tables_text)
+
+
+def _stream_document(xml_file, collector):
+    path = []
+    body = None
+    cells = col_count = row_count = None
+
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            path.append(elem.tag)
+            if len(path) == 2 and elem.tag == _BODY:
+                body = elem
+            elif len(path) == 3 and elem.tag == _TBL and path[1] == _BODY:
+                cells, col_count, row_count = [], 0, 0
+            continue
+
+        depth = len(path)
+        path.pop()
+        if depth > 5 or depth < 3 or path[1] != _BODY:
+            continue
+        tag = elem.tag
+
+        if depth == 3:
+            if tag == _P:
+                collector.add_paragraph(_paragraph_text(elem))
+            elif tag == _TBL:
+                if not collector.tables_full:
+                    collector.add_table(cells, col_count, row_count)
+                cells = None
+            body.clear()
+            if collector.full:
+                return
+        elif path[2] != _TBL:
+            continue
+        elif depth == 4 and tag == _TR:
+            row_count += 1
+            elem.clear()
+        elif depth == 5 and tag == _TC and path[3] == _TR:
+            if not collector.tables_full:
+                # Same grid walk as python-docx's Table._cells
+                text = _cell_text(elem)
+                span, continued = _cell_merge(elem)
+                for span_idx in range(span):
+                    if continued:
+                        cells.append(cells[-col_count])
+                    elif span_idx > 0:
+                        cells.append(cells[-1])
+                    else:
+                        cells.append(text)
+            elem.clear()
+        elif depth == 5 and tag == _GRIDCOL and path[3] == _TBLGRID:
+            col_count += 1
+
+
+def extract_text_from_docx(file):
+    try:
+        with zipfile.ZipFile(file) as zf:
+            part = _main_document_part(zf)
+            collector = _DocxTextCollector(MAX_TEXT_CHARS)
+            with zf.open(part) as xml_file:
+                _stream_document(xml_file, collector)
+        text = collector.text()
+        if not text.strip():
+            raise Exception("No text could be extracted from DOCX file.")
+        if len(text) > MAX_TEXT_CHARS:
+            text = text[:MAX_TEXT_CHARS]
+        return text
+    except Exception as e:
+        raise Exception(f"Error reading DOCX: {str(e)}")
+
+
+# ── python-docx reference implementation ────────────────────
+
+def extract_text_from_docx_dom(file):
+    try:
+        doc = docx.Document(file)
+        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        tables_text = []
+        for table in doc.tables:
+            for row in table.rows:
+                row_text = [cell.text for cell in row.cells if cell.text.strip()]
+                if row_text:
+                    tables_text.append(' '.join(row_text))
+        text = '\n'.join(paragraphs + tables_text)
+        if not text.strip():
+            raise Exception("No text could be extracted from DOCX file.")
+        if len(text) > MAX_TEXT_CHARS:
+            text = text[:MAX_TEXT_CHARS]
+        return text
+    except Exception as e:
+        raise Exception(f"Error reading DOCX: {str(e)}")
@@ -0,0 +1,10 @@
+"""
+limits.py — Shared limits applied to text extracted from uploaded resumes
+"""
+
+# Only the first pages of a PDF are read; longer documents are portfolios,
+# not resumes, and the tail rarely changes the analysis.
+MAX_PDF_PAGES = 50
+
+# Extracted text is truncated to this many characters before analysis.
+MAX_TEXT_CHARS = 50000
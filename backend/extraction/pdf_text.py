@@ -0,0 +1,231 @@
+"""
+pdf_text.py — PDF text extraction for uploaded resumes
+
+Short PDFs are read page by page on the calling thread. Longer ones are
+fanned out to a pool of worker processes in contiguous page ranges and
+reassembled in page order. Either way, no more pages are read once the
+MAX_TEXT_CHARS cap has been reached, and running headers/footers repeated
+on every page are dropped before the text is returned.
+"""
+
+import atexit
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import PyPDF2
+
+from extraction.boilerplate import strip_repeated_lines
+from extraction.limits import MAX_PDF_PAGES, MAX_TEXT_CHARS
+
+# Below this many pages the pool round-trip costs more than it saves
+MIN_PARALLEL_PAGES = 8
+
+# Pages handed to a worker per task
+PAGES_PER_TASK = 2
+
+
+def process_context():
+    """
+    Start method for worker processes created from the web process. Forking
+    a multithreaded server can copy a lock held by another thread into the
+    child, so workers are started by the forkserver (spawn where there is
+    none). The forkserver imports the main module once itself, not once per
+    worker.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _extract_page(pdf_reader, page_num):
+    try:
+        return pdf_reader.pages[page_num].extract_text()
+    except Exception as e:
+        print(f"Warning: Could not extract text from page {page_num + 1}: {str(e)}")
+        return None
+
+
+class _PageCollector:
+    """
+    Accumulates page texts in order and tracks when the character cap is hit.
+    The cap counts the raw page text; running headers/footers are stripped
+    once, in text(), so a document full of them may come out somewhat
+    shorter than the cap.
+    """
+
+    def __init__(self, char_limit):
+        self.char_limit = char_limit
+        self.page_texts = []
+        self.length = 0
+        self.has_text = False
+
+    def add(self, page_text):
+        """Adds one page; returns True once no further pages are needed."""
+        if page_text:
+            self.page_texts.append(page_text)
+            self.length += len(page_text) + 1
+            self.has_text = self.has_text or bool(page_text.strip())
+        return self.has_text and self.length >= self.char_limit
+
+    def text(self):
+        page_texts = strip_repeated_lines(self.page_texts)
+        return "".join(page_text + "\n" for page_text in page_texts)
+
+
+# ── Worker side ─────────────────────────────────────────────
+
+def _extract_page_range(path, start, stop):
+    # Each task opens the document itself and lets go of it when done, so an
+    # idle worker holds nothing of the last upload it read. Opening only
+    # reads the cross-reference table; pages are parsed as they are read.
+    with open(path, 'rb') as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        return [_extract_page(pdf_reader, page_num) for page_num in range(start, stop)]
+
+
+# ── Parent side ─────────────────────────────────────────────
+
+class ParallelPdfExtractor:
+    """
+    Extracts PDF pages on a lazily started pool of worker processes.
+
+    Args:
+        max_workers:    Page worker processes (CPU count when None)
+        pages_per_task: Contiguous pages read per task
+        mp_context:     multiprocessing context the workers are started
+                        with; process_context() when None
+    """
+
+    def __init__(self, max_workers=None, pages_per_task=PAGES_PER_TASK, mp_context=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_task = pages_per_task
+        self.mp_context = mp_context
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=self.mp_context or process_context()
+                )
+            return self._executor
+
+    def start(self):
+        """Starts every worker process now rather than on the first document."""
+        executor = self._get_executor()
+        for future in [executor.submit(os.getpid) for _ in range(self.max_workers)]:
+            future.result()
+
+    def _discard_executor(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def extract_pages(self, path, page_count, collector):
+        """
+        Feeds the text of pages [0, page_count) of the PDF at `path` into
+        `collector` in page order. At most two tasks per worker are in flight,
+        so nothing past the page that fills the collector is dispatched.
+        """
+        executor = self._get_executor()
+        ranges = deque(
+            (start, min(start + self.pages_per_task, page_count))
+            for start in range(0, page_count, self.pages_per_task)
+        )
+        in_flight = deque()
+        window = self.max_workers * 2
+        try:
+            while ranges or in_flight:
+                while ranges and len(in_flight) < window:
+                    start, stop = ranges.popleft()
+                    in_flight.append(executor.submit(_extract_page_range, path, start, stop))
+                full = False
+                for page_text in in_flight.popleft().result():
+                    full = collector.add(page_text)
+                    if full:
+                        break
+                if full:
+                    break
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+parallel_extractor = ParallelPdfExtractor()
+atexit.register(parallel_extractor.shutdown)
+
+
+def _extract_pages_serial(pdf_reader, page_count):
+    collector = _PageCollector(MAX_TEXT_CHARS)
+    for page_num in range(page_count):
+        if collector.add(_extract_page(pdf_reader, page_num)):
+            break
+    return collector
+
+
+def _extract_pages_parallel(file, pdf_reader, page_count, extractor, path=None):
+    # Workers open the document themselves, so hand them a file on disk
+    # rather than pickling the upload into every task; an upload already
+    # spooled to disk is read where it is.
+    copied = path is None
+    if copied:
+        file.seek(0)
+        fd, path = tempfile.mkstemp(suffix='.pdf')
+    try:
+        if copied:
+            with os.fdopen(fd, 'wb') as out:
+                shutil.copyfileobj(file, out)
+        collector = _PageCollector(MAX_TEXT_CHARS)
+        extractor.extract_pages(path, page_count, collector)
+        return collector
+    except BrokenProcessPool:
+        print("Warning: PDF worker pool failed, extracting serially")
+        return _extract_pages_serial(pdf_reader, page_count)
+    finally:
+        if copied:
+            os.remove(path)
+
+
+def extract_text_from_pdf(file, parallel=True, path=None):
+    """
+    Args:
+        file:     Binary file object positioned at the start of the PDF
+        parallel: True fans the pages of large PDFs out to parallel_extractor,
+                  False reads them here; a ParallelPdfExtractor is used instead
+                  of the shared one
+        path:     The same PDF on disk, if it is there already (spooled upload)
+    """
+    try:
+        pdf_reader = PyPDF2.PdfReader(file)
+        total_pages = len(pdf_reader.pages)
+        max_pages = min(total_pages, MAX_PDF_PAGES)
+        extractor = parallel_extractor if parallel is True else parallel or None
+        if extractor is not None and extractor.max_workers > 1 and max_pages >= MIN_PARALLEL_PAGES:
+            collector = _extract_pages_parallel(file, pdf_reader, max_pages, extractor, path)
+        else:
+            collector = _extract_pages_serial(pdf_reader, max_pages)
+        text = collector.text()
+        if not text.strip():
+            raise Exception("No text could be extracted from PDF.")
+        if len(text) > MAX_TEXT_CHARS:
+            text = text[:MAX_TEXT_CHARS]
+        return text
+    except Exception as e:
+        raise Exception(f"Error reading PDF: {str(e)}")
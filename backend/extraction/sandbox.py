@@ -0,0 +1,371 @@
+"""
+sandbox.py — Isolated worker processes for parsing untrusted uploads
+
+A malformed or adversarial PDF can make PyPDF2 spin or balloon memory. Each
+document is parsed in one of a small pool of worker processes under a
+wall-clock deadline and a memory budget. The budget is a hard address-space
+limit inside the worker (an allocation past it fails with MemoryError), and
+the parent polls the worker's RSS against it as well. A worker that exceeds
+either budget is killed and a replacement is started in the background;
+the other workers keep serving requests. Workers are also retired after a
+fixed number of documents so slow leaks in the parsers never accumulate.
+
+Each worker splits the pages of a large PDF across page processes of its
+own, forked from it as it starts, while its only thread is the main one
+(the page pool starts its manager thread once they are all forked). They
+share the worker's deadline and memory budget: its RSS includes theirs, and
+killing it kills them.
+"""
+
+import atexit
+import io
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import psutil
+
+try:
+    import resource
+except ImportError:     # Windows: only the parent's RSS polling applies
+    resource = None
+
+from extraction.documents import extract_document
+from extraction.pdf_text import ParallelPdfExtractor, process_context
+from extraction.spool import MappedFile, open_mapped
+
+
+class ParserBudgetExceeded(Exception):
+    """The document could not be parsed within the sandbox budgets."""
+
+
+class ParseTimeoutError(ParserBudgetExceeded):
+    pass
+
+
+class ParseMemoryError(ParserBudgetExceeded):
+    pass
+
+
+class ParseCrashedError(ParserBudgetExceeded):
+    pass
+
+
+class SandboxBusyError(Exception):
+    """No parser worker became free in time."""
+
+
+# Address space a worker may reserve on top of its memory budget: allocator
+# arenas and thread stacks reserve far more than they ever touch
+ADDRESS_SPACE_SLACK = 256 * 1024 * 1024
+
+# Seconds a new worker (and its page processes) may take to start
+WORKER_START_TIMEOUT = 30
+
+
+# ── Worker side ─────────────────────────────────────────────
+
+def _extract_source(kind, source, extractor):
+    if isinstance(source, bytes):
+        return extract_document(kind, io.BytesIO(source), parallel=extractor or False)
+    handle, mapped = open_mapped(source)
+    view = MappedFile(mapped)
+    try:
+        return extract_document(kind, view, parallel=extractor or False, path=source)
+    finally:
+        view.close()
+        mapped.close()
+        handle.close()
+
+
+def _limit_address_space(max_memory_bytes):
+    """
+    Caps the worker's address space at its current size plus the budget, so
+    a decompression bomb fails its allocation at once instead of growing
+    between two RSS polls of the parent.
+    """
+    if resource is None:
+        return
+    limit = psutil.Process().memory_info().vms + max_memory_bytes + ADDRESS_SPACE_SLACK
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(conn, max_memory_bytes, page_workers):
+    # The page processes are forked now, before the pool starts its manager
+    # thread, and under the worker's limit, so that the RSS they share with
+    # it is part of every job's baseline rather than its growth.
+    _limit_address_space(max_memory_bytes)
+    extractor = None
+    if page_workers > 1:
+        extractor = ParallelPdfExtractor(max_workers=page_workers,
+                                         mp_context=multiprocessing.get_context('fork'))
+        extractor.start()
+    conn.send('ready')
+    try:
+        while True:
+            try:
+                job = conn.recv()
+            except EOFError:
+                return
+            if job is None:
+                return
+            kind, source = job
+            try:
+                _limit_address_space(max_memory_bytes)
+                text = _extract_source(kind, source, extractor)
+                conn.send(('ok', text))
+            except MemoryError:
+                conn.send(('memory', 'Document needs too much memory to parse'))
+            except Exception as e:
+                conn.send(('error', str(e)))
+    finally:
+        if extractor is not None:
+            extractor.shutdown()
+
+
+# ── Parent side ─────────────────────────────────────────────
+
+class _Worker:
+    # Not daemonic: daemonic processes cannot start the page processes.
+    # ParserSandbox.shutdown stops them at exit instead.
+    def __init__(self, ctx, max_memory_bytes, page_workers):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main,
+                                   args=(child_conn, max_memory_bytes, page_workers))
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self._ps = psutil.Process(self.process.pid)
+        # Jobs measure their memory growth from the started worker
+        try:
+            ready = self.conn.poll(WORKER_START_TIMEOUT) and self.conn.recv() == 'ready'
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            self.kill()
+            raise RuntimeError("Parser worker failed to start")
+
+    def rss(self):
+        """RSS of the worker and its page processes."""
+        total = 0
+        try:
+            for process in [self._ps] + self._ps.children(recursive=True):
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    pass
+        except psutil.Error:
+            pass
+        return total
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self):
+        try:
+            children = self._ps.children(recursive=True)
+        except psutil.Error:
+            children = []
+        if self.process.is_alive():
+            self.process.kill()
+        for child in children:
+            try:
+                child.kill()
+            except psutil.Error:
+                pass
+        self.process.join()
+        self.conn.close()
+
+
+class ParserSandbox:
+    def __init__(self, workers: int = 2, timeout: float = 20.0,
+                 max_memory_bytes: int = 512 * 1024 * 1024,
+                 max_jobs_per_worker: int = 200, acquire_timeout: float = 30.0,
+                 poll_interval: float = 0.05, page_workers: int = None):
+        """
+        Args:
+            workers:             Parser processes (started on first use)
+            timeout:             Wall-clock seconds allowed per document
+            max_memory_bytes:    Memory a worker may grow by while parsing one document
+                                 (its address-space limit, and its RSS growth
+                                 as polled from here)
+            max_jobs_per_worker: Documents parsed before a worker is recycled
+            acquire_timeout:     Seconds to wait for a free worker
+            poll_interval:       How often a running job is checked against its budgets
+                                 (and its memory peak sampled)
+            page_workers:        Processes each worker splits a large PDF's pages
+                                 across; None shares the CPUs between the workers,
+                                 1 reads every page in the worker itself
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.max_memory_bytes = max_memory_bytes
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.acquire_timeout = acquire_timeout
+        self.poll_interval = poll_interval
+        self.page_workers = page_workers or max(1, (os.cpu_count() or 1) // workers)
+
+        self._ctx = process_context()
+        # None marks a slot whose worker has not been started yet
+        self._idle = queue.Queue()
+        for _ in range(workers):
+            self._idle.put(None)
+        # Every started worker, idle or busy
+        self._live = set()
+
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.timeouts = 0
+        self.memory_kills = 0
+        self.crashes = 0
+        self.recycled = 0
+        atexit.register(self.shutdown)
+
+    def extract(self, kind: str, source) -> str:
+        """Parses one document in a worker and returns its text."""
+        return self.parse(kind, source)[0]
+
+    def parse(self, kind: str, source):
+        """
+        Parses one document in a worker.
+
+        Args:
+            kind:   'pdf' or 'docx'
+            source: The document bytes, or the path of a spooled upload
+
+        Returns:
+            (text, peak RSS growth of the worker in bytes while parsing)
+
+        Raises:
+            ParserBudgetExceeded: deadline or memory budget blown, or the worker died
+            SandboxBusyError:     no worker became free within acquire_timeout
+            Exception:            the extractor's own error for unreadable files
+        """
+        worker = self._acquire()
+        healthy = False
+        try:
+            status, payload, peak_bytes = self._run(worker, kind, source)
+            healthy = status != 'memory'
+        finally:
+            self._release(worker, healthy)
+
+        if status == 'ok':
+            self._count('completed')
+            return payload, peak_bytes
+        if status == 'memory':
+            self._count('memory_kills')
+            raise ParseMemoryError(payload)
+        raise Exception(payload)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'idle_workers': self._idle.qsize(),
+                'completed': self.completed,
+                'timeouts': self.timeouts,
+                'memory_kills': self.memory_kills,
+                'crashes': self.crashes,
+                'recycled': self.recycled,
+            }
+
+    def shutdown(self):
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            workers, self._live = self._live, set()
+        for worker in workers:
+            worker.stop()
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _acquire(self):
+        try:
+            worker = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise SandboxBusyError("All parser workers are busy, please retry shortly")
+        if worker is not None and not worker.process.is_alive():
+            self._retire(worker, worker.kill)
+            worker = None
+        if worker is None:
+            try:
+                worker = self._start_worker()
+            except Exception:
+                self._idle.put(None)
+                raise
+        return worker
+
+    def _release(self, worker, healthy):
+        worker.jobs += 1
+        if healthy and worker.jobs < self.max_jobs_per_worker:
+            self._idle.put(worker)
+            return
+        if healthy:
+            self._count('recycled')
+            self._retire(worker, worker.stop)
+        else:
+            self._retire(worker, worker.kill)
+        # Starting a worker can take up to WORKER_START_TIMEOUT; the request
+        # that retired this one does not wait for it
+        threading.Thread(target=self._replace, name='sandbox-replace', daemon=True).start()
+
+    def _replace(self):
+        try:
+            worker = self._start_worker()
+        except Exception as e:
+            print(f"[SANDBOX] Could not start replacement worker: {e}")
+            worker = None
+        self._idle.put(worker)
+
+    def _start_worker(self):
+        worker = _Worker(self._ctx, self.max_memory_bytes, self.page_workers)
+        with self._lock:
+            self._live.add(worker)
+        return worker
+
+    def _retire(self, worker, end):
+        with self._lock:
+            self._live.discard(worker)
+        end()
+
+    def _run(self, worker, kind, source):
+        baseline_rss = worker.rss()
+        peak_bytes = 0
+        deadline = time.monotonic() + self.timeout
+        try:
+            worker.conn.send((kind, source))
+            while not worker.conn.poll(self.poll_interval):
+                if time.monotonic() > deadline:
+                    self._count('timeouts')
+                    raise ParseTimeoutError(
+                        f"Document took longer than {self.timeout:g}s to parse"
+                    )
+                peak_bytes = max(peak_bytes, worker.rss() - baseline_rss)
+                if peak_bytes > self.max_memory_bytes:
+                    self._count('memory_kills')
+                    raise ParseMemoryError("Document needs too much memory to parse")
+            status, payload = worker.conn.recv()
+            peak_bytes = max(peak_bytes, worker.rss() - baseline_rss)
+            return status, payload, peak_bytes
+        except (EOFError, OSError):
+            self._count('crashes')
+            raise ParseCrashedError("Parser crashed while reading the document")
@@ -0,0 +1,273 @@
+"""
+spool.py — Disk spooling and memory-mapped access for large uploads
+
+Multipart file parts over SPOOL_THRESHOLD are written straight to a named
+temporary file by SpoolingRequest instead of being buffered in memory.
+SpooledUpload then maps that file read-only, hashes it in place and hands
+the parsers a zero-copy file view; the sandbox workers map the same file
+by path. Temporary files are removed when the request closes.
+"""
+
+import hashlib
+import io
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+
+from flask import Request
+
+# Uploads larger than this are spooled to disk and memory-mapped
+SPOOL_THRESHOLD = 1024 * 1024
+
+
+class SpoolingRequest(Request):
+    """
+    Flask request class that spools large multipart file parts to disk.
+    """
+
+    spool_threshold = SPOOL_THRESHOLD
+    spool_dir = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._spool_paths = []
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        if total_content_length is not None and total_content_length <= self.spool_threshold:
+            return io.BytesIO()
+        stream = tempfile.NamedTemporaryFile(
+            'wb+', prefix='upload-', suffix='.part', dir=self.spool_dir, delete=False
+        )
+        self._spool_paths.append(stream.name)
+        return stream
+
+    def release_spool_file(self, path) -> bool:
+        """
+        Hands a spool file over to the caller, who must delete it.
+        Returns False if `path` is not one of this request's spool files.
+        """
+        if path not in self._spool_paths:
+            return False
+        self._spool_paths.remove(path)
+        return True
+
+    def close(self):
+        super().close()
+        paths, self._spool_paths = self._spool_paths, []
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class MappedFile(io.RawIOBase):
+    """
+    Read-only, seekable file object over a memory map. Reads are served
+    from the page cache without buffering the whole document in memory.
+    """
+
+    def __init__(self, mapped):
+        self._view = memoryview(mapped)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = max(0, min(len(buffer), len(self._view) - self._pos))
+        buffer[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes()
+        self._pos = max(self._pos, end)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def open_mapped(path):
+    """Maps the file at `path` read-only; returns (file handle, mmap)."""
+    handle = open(path, 'rb')
+    try:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        handle.close()
+        raise
+    return handle, mapped
+
+
+class SpooledUpload:
+    """
+    Context manager around an uploaded file (werkzeug FileStorage).
+
+    Small uploads stay in memory; larger ones are read through a memory map
+    of their spool file. On exit every map, handle and spool file created
+    here is released.
+
+    Attributes:
+        kind:   'pdf' or 'docx'
+        digest: SHA-256 hex digest of the upload
+        size:   Upload size in bytes
+        path:   Spool file path, or None for in-memory uploads
+        data:   Upload bytes for in-memory uploads, else None
+    """
+
+    def __init__(self, file, kind, threshold=SPOOL_THRESHOLD, spool_dir=None):
+        self.file = file
+        self.kind = kind
+        self.threshold = threshold
+        self.spool_dir = spool_dir
+        self.digest = None
+        self.size = 0
+        self.path = None
+        self.data = None
+        self._owned_path = None
+        self._handle = None
+        self._mapped = None
+        self._views = []
+
+    def __enter__(self):
+        stream = getattr(self.file, 'stream', self.file)
+        name = getattr(stream, 'name', None)
+
+        if isinstance(name, str) and os.path.isfile(name):
+            # Already spooled by SpoolingRequest
+            stream.flush()
+            self.path = name
+        else:
+            stream.seek(0)
+            head = stream.read(self.threshold + 1)
+            if len(head) <= self.threshold:
+                self.data = head
+            else:
+                self.path = self._owned_path = self._spool(head, stream)
+
+        if self.path is not None:
+            self.size = os.path.getsize(self.path)
+        if self.path is not None and self.size:
+            self._handle, self._mapped = open_mapped(self.path)
+            self.digest = hashlib.sha256(self._mapped).hexdigest()
+        else:
+            self.data = self.data if self.data is not None else b''
+            self.path = None
+            self.size = len(self.data)
+            self.digest = hashlib.sha256(self.data).hexdigest()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for view in self._views:
+            view.close()
+        self._views = []
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._owned_path:
+            try:
+                os.remove(self._owned_path)
+            except OSError:
+                pass
+            self._owned_path = None
+        return False
+
+    @property
+    def spooled(self):
+        return self.path is not None
+
+    @property
+    def source(self):
+        """What the parser sandbox is sent: the spool path, or the bytes themselves."""
+        return self.path if self.spooled else self.data
+
+    @property
+    def buffered_bytes(self):
+        """Bytes of the upload held in this process's heap."""
+        return 0 if self.spooled else self.size
+
+    def open(self):
+        """A fresh file object positioned at the start of the upload."""
+        if not self.spooled:
+            return io.BytesIO(self.data)
+        view = MappedFile(self._mapped)
+        self._views.append(view)
+        return view
+
+    def _spool(self, head, stream):
+        with tempfile.NamedTemporaryFile(
+            'wb', prefix='upload-', suffix='.part', dir=self.spool_dir, delete=False
+        ) as out:
+            out.write(head)
+            shutil.copyfileobj(stream, out)
+        return out.name
+
+
+class UploadMemoryStats:
+    """
+    Per-upload memory figures, to size web and parser workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.uploads = 0
+        self.spooled = 0
+        self.max_upload_bytes = 0
+        self.max_buffered_bytes = 0
+        self.parse_samples = 0
+        self.total_parse_peak_bytes = 0
+        self.max_parse_peak_bytes = 0
+
+    def record(self, upload, parse_peak_bytes=None):
+        """
+        Args:
+            upload:           The SpooledUpload that was parsed
+            parse_peak_bytes: Peak RSS growth of the parser while reading it, if measured
+        """
+        with self._lock:
+            self.uploads += 1
+            self.spooled += int(upload.spooled)
+            self.max_upload_bytes = max(self.max_upload_bytes, upload.size)
+            self.max_buffered_bytes = max(self.max_buffered_bytes, upload.buffered_bytes)
+            if parse_peak_bytes is not None:
+                self.parse_samples += 1
+                self.total_parse_peak_bytes += parse_peak_bytes
+                self.max_parse_peak_bytes = max(self.max_parse_peak_bytes, parse_peak_bytes)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'uploads': self.uploads,
+                'spooled_to_disk': self.spooled,
+                'max_upload_bytes': self.max_upload_bytes,
+                'max_buffered_bytes': self.max_buffered_bytes,
+                'avg_parse_peak_bytes': (self.total_parse_peak_bytes // self.parse_samples
+                                         if self.parse_samples else 0),
+                'max_parse_peak_bytes': self.max_parse_peak_bytes,
+            }
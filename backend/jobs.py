@@ -0,0 +1,165 @@
+"""
+jobs.py — Bounded in-process job queue for slow resume analyses
+
+Work is submitted to a small local thread pool and tracked by job id.
+Finished jobs keep their result for a fixed TTL so clients can poll for it,
+and the number of queued jobs is capped so a burst of slow documents
+cannot pile up unbounded work.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+
+class QueueFullError(Exception):
+    """The job queue is at capacity."""
+
+
+class Job:
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = Job.QUEUED
+        self.stage = 'queued'
+        self.percent = 0
+        self.result = None
+        self.result_status = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def update(self, stage: str, percent: int):
+        """Records progress; called from the job function."""
+        with self._lock:
+            self.stage = stage
+            self.percent = percent
+
+    @property
+    def finished(self):
+        return self.status in (Job.DONE, Job.FAILED)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            data = {
+                'job_id': self.id,
+                'status': self.status,
+                'progress': {'stage': self.stage, 'percent': self.percent},
+                'created_at': self.created_at,
+                'finished_at': self.finished_at,
+            }
+            if self.status == Job.DONE:
+                data['result'] = self.result
+                data['result_status'] = self.result_status
+            elif self.status == Job.FAILED:
+                data['error'] = self.error
+            return data
+
+
+class JobQueue:
+    def __init__(self, workers: int = 2, max_queued: int = 32, result_ttl: float = 600.0):
+        """
+        Args:
+            workers:    Jobs processed concurrently
+            max_queued: Jobs allowed to wait for a worker before submit() refuses
+            result_ttl: Seconds a finished job is kept for polling
+        """
+        self.workers = workers
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='resume-job')
+        self._jobs = {}
+        self._queued = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.rejected = 0
+        self.expired = 0
+
+    def submit(self, fn, *args) -> Job:
+        """
+        Queues fn(job, *args). fn returns (payload, http_status) for the client.
+
+        Raises:
+            QueueFullError: max_queued jobs are already waiting
+        """
+        job = Job()
+        with self._lock:
+            self._purge_expired()
+            if self._queued >= self.max_queued:
+                self.rejected += 1
+                raise QueueFullError("Analysis queue is full, please retry shortly")
+            self._jobs[job.id] = job
+            self._queued += 1
+            self.submitted += 1
+        self._executor.submit(self._run, job, fn, args)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._purge_expired()
+            return self._jobs.get(job_id)
+
+    @property
+    def depth(self) -> int:
+        """Jobs waiting for a worker."""
+        with self._lock:
+            return self._queued
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._purge_expired()
+            return {
+                'workers': self.workers,
+                'queue_depth': self._queued,
+                'queue_capacity': self.max_queued,
+                'running': self._running,
+                'retained': len(self._jobs),
+                'submitted': self.submitted,
+                'rejected': self.rejected,
+                'expired': self.expired,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    def _run(self, job, fn, args):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        job.status = Job.RUNNING
+        try:
+            job.result, job.result_status = fn(job, *args)
+            job.update('done', 100)
+            job.finished_at = time.time()
+            job.status = Job.DONE
+        except Exception as e:
+            print(f"[JOBS] Job {job.id} failed: {str(e)}")
+            job.error = str(e)
+            job.finished_at = time.time()
+            job.status = Job.FAILED
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _purge_expired(self):
+        # Caller holds the lock
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self.expired += len(expired)
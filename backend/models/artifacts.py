@@ -0,0 +1,186 @@
+"""
+artifacts.py — Model artifacts as directories of .npy arrays, memory-mappable
+
+joblib.load gives every process that loads model.pkl and vectorizer.pkl its
+own copy of every array in them. The same arrays saved as .npy files can be
+loaded read-only with mmap instead: the pages come from the OS page cache,
+so any number of web workers share one physical copy, and loading maps the
+files instead of reading and unpickling them.
+
+An artifact directory holds one <name>.npy per array and a meta.json (format
+version plus whatever the owner needs to rebuild the object). Two are written
+by the trainer next to the pickles:
+
+    saved_models/forest/      the RandomForestClassifier (models/forest.py)
+    saved_models/vectorizer/  the TfidfVectorizer: its terms in column order,
+                              idf_ and its parameters
+
+Running `python models/artifacts.py` exports both from existing pickles
+without retraining, and adds the words of the vectorizer's vocabulary to the
+lemma table (models/lemmas.py), so a model exported without its training data
+still serves its own words from the table. Loaders use an export only when it is at least as new as
+its pickle (see is_current), so a model retrained and saved the old way is
+never shadowed by a stale export.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+MODELS_DIR = os.path.join(os.path.dirname(current_dir), 'saved_models')
+VECTORIZER_PATH = os.path.join(MODELS_DIR, 'vectorizer')
+
+VECTORIZER_FORMAT_VERSION = 1
+
+
+def save_arrays(path: str, arrays: dict, meta: dict):
+    """
+    Writes name -> array as <name>.npy plus meta.json into `path`, replacing
+    any previous contents; readers never see a half-written directory.
+    """
+    tmp_path = path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp_path, f"{name}.npy"), np.asarray(array), allow_pickle=False)
+    with open(os.path.join(tmp_path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    old_path = path + '.old'
+    shutil.rmtree(old_path, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, old_path)
+    os.replace(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def load_arrays(path: str, names, version: int, mmap_mode: str = None):
+    """
+    Args:
+        path:      Directory written by save_arrays
+        names:     Arrays to load
+        version:   Format version meta.json must carry
+        mmap_mode: None reads the arrays into memory; 'r' maps them read-only
+                   (shared with every other process mapping the same files)
+
+    Returns:
+        (name -> ndarray, meta dict)
+
+    Raises:
+        FileNotFoundError: No artifact at `path`
+        ValueError: The artifact is from another format version
+    """
+    with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != version:
+        raise ValueError(f"Artifact in {path} has format version {meta.get('version')}, "
+                         f"expected {version}; re-export it")
+    # np.asarray drops the np.memmap subclass (same buffer), whose per-result
+    # wrapping would slow down every fancy-indexing step
+    arrays = {name: np.asarray(np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode,
+                                       allow_pickle=False))
+              for name in names}
+    return arrays, meta
+
+
+def is_current(path: str, pickle_path: str) -> bool:
+    """True if the artifact at `path` exists and is not older than `pickle_path`."""
+    meta_path = os.path.join(path, 'meta.json')
+    if not os.path.exists(meta_path):
+        return False
+    return not os.path.exists(pickle_path) or os.path.getmtime(meta_path) >= os.path.getmtime(pickle_path)
+
+
+def artifact_version(paths) -> str:
+    """
+    Short fingerprint of the files at `paths` (a directory counts as all of
+    its files): changes whenever any of them is written, added or removed.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        files = ([os.path.join(path, name) for name in sorted(os.listdir(path))]
+                 if os.path.isdir(path) else [path])
+        for file_path in files:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            digest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+    return digest.hexdigest()[:16]
+
+
+# ─────────────────────────────────────────────
+# VECTORIZER
+# ─────────────────────────────────────────────
+
+def save_vectorizer(vectorizer: TfidfVectorizer, path: str = VECTORIZER_PATH):
+    """
+    Exports a fitted TfidfVectorizer. Its parameters go to meta.json, so
+    they must be plain values (no custom tokenizer or analyzer callables).
+    """
+    params = {}
+    for key, value in vectorizer.get_params().items():
+        if key == 'dtype':
+            value = np.dtype(value).name
+        elif callable(value):
+            raise ValueError(f"Cannot export a vectorizer with a callable {key!r}")
+        elif isinstance(value, (tuple, frozenset, set)):
+            value = list(value)
+        params[key] = value
+
+    terms = [None] * len(vectorizer.vocabulary_)
+    for term, column in vectorizer.vocabulary_.items():
+        terms[column] = term
+    meta = {'version': VECTORIZER_FORMAT_VERSION, 'n_features': len(terms), 'params': params}
+    save_arrays(path, {'terms': np.array(terms, dtype=str), 'idf': vectorizer.idf_}, meta)
+
+
+def load_vectorizer(path: str = VECTORIZER_PATH, mmap_mode: str = None) -> TfidfVectorizer:
+    """
+    A TfidfVectorizer whose transform gives exactly what the exported one
+    gave. The vocabulary is a dict, so it is rebuilt in each process; idf_
+    is copied by TfidfTransformer, so mmap_mode mainly saves the read.
+    """
+    arrays, meta = load_arrays(path, ('terms', 'idf'), VECTORIZER_FORMAT_VERSION, mmap_mode)
+    params = dict(meta['params'])
+    params['dtype'] = np.dtype(params['dtype']).type
+    params['ngram_range'] = tuple(params['ngram_range'])
+    if params.get('vocabulary') is not None:
+        params['vocabulary'] = None
+
+    vectorizer = TfidfVectorizer(**params)
+    vectorizer.vocabulary_ = {term: column for column, term in enumerate(arrays['terms'].tolist())}
+    vectorizer.idf_ = arrays['idf']
+    return vectorizer
+
+
+# Export the pickled model and vectorizer without retraining
+if __name__ == "__main__":
+    import joblib
+
+    try:
+        from models.forest import FOREST_PATH, ForestEngine
+        from models.lemmas import LEMMA_TABLE_PATH, extend_lemma_table, vectorizer_vocabulary
+        from models.nltk_resources import load_resources
+    except ImportError:
+        from forest import FOREST_PATH, ForestEngine
+        from lemmas import LEMMA_TABLE_PATH, extend_lemma_table, vectorizer_vocabulary
+        from nltk_resources import load_resources
+
+    engine = ForestEngine.from_model(joblib.load(os.path.join(MODELS_DIR, 'model.pkl')))
+    engine.save(FOREST_PATH)
+    print(f"✅ Forest: {engine.n_estimators} trees, {len(engine.feature)} nodes, "
+          f"depth {engine.max_depth} exported to {FOREST_PATH}")
+
+    vectorizer = joblib.load(os.path.join(MODELS_DIR, 'vectorizer.pkl'))
+    save_vectorizer(vectorizer, VECTORIZER_PATH)
+    print(f"✅ Vectorizer: {len(vectorizer.vocabulary_)} terms exported to {VECTORIZER_PATH}")
+
+    load_resources()
+    table = extend_lemma_table(vectorizer_vocabulary(vectorizer), LEMMA_TABLE_PATH)
+    print(f"✅ Lemma table: {len(table)} words (vectorizer vocabulary included) saved to {LEMMA_TABLE_PATH}")
@@ -0,0 +1,235 @@
+"""
+forest.py — The trained RandomForest as flat NumPy arrays, and its inference engine
+
+RandomForestClassifier.predict_proba walks every tree through sklearn's
+per-estimator dispatch, and loading model.pkl unpickles the whole object
+graph (100 trees, each its own objects). export_forest flattens the forest
+into a handful of contiguous node arrays, concatenated over all trees with
+each tree's nodes numbered level by level, so both children of a node are
+adjacent:
+
+    feature, threshold    the split of each node: x[feature] <= threshold goes
+                          to the first child, otherwise to the second
+    children              global index of the first child; a leaf points to
+                          itself and has an infinite threshold
+    leaf                  row of leaf_proba for leaves, -1 elsewhere
+    leaf_proba            class probabilities of each leaf, normalized as
+                          DecisionTreeClassifier.predict_proba normalizes them
+    roots                 the root node of each tree
+
+ForestEngine evaluates all trees at once: every (tree, row) pair descends one
+level per step for max_depth steps (leaves stay where they are), then the
+leaf probabilities are summed tree by tree in estimator order and divided by
+the number of trees, the same operations in the same order as predict_proba,
+so the results are identical to it (with n_jobs=1; more jobs sum the trees
+in thread completion order).
+
+The arrays are saved as an artifact directory, saved_models/forest/ (see
+models/artifacts.py), and can be memory-mapped so web workers share them.
+"""
+
+import os
+
+import numpy as np
+import scipy.sparse as sp
+
+try:
+    from models.artifacts import MODELS_DIR, load_arrays, save_arrays
+except ImportError:
+    from artifacts import MODELS_DIR, load_arrays, save_arrays
+
+FOREST_PATH = os.path.join(MODELS_DIR, 'forest')
+
+FOREST_FORMAT_VERSION = 1
+
+# Values of X scored at a time: rows go through the trees in blocks of at
+# most this many values (16 MB of float32), so sparse input is never
+# densified whole
+BLOCK_VALUES = 1 << 22
+
+ARRAYS = ('feature', 'threshold', 'children', 'leaf', 'leaf_proba', 'roots', 'classes')
+
+
+def export_forest(model) -> dict:
+    """
+    Flattens a fitted single-output RandomForestClassifier.
+
+    Returns:
+        name -> array (see the module docstring), plus 'classes' (model.classes_)
+    """
+    if getattr(model, 'n_outputs_', 1) != 1:
+        raise ValueError("Only single-output forests can be exported")
+
+    n_classes = int(model.n_classes_)
+    features, thresholds, children, leaves, probas, roots = [], [], [], [], [], []
+    offset = 0
+    leaf_offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+
+        # Level order: the children of a level's internal nodes, pair by pair
+        levels = [np.array([0])]
+        while True:
+            internal = levels[-1][tree.children_left[levels[-1]] != -1]
+            if not len(internal):
+                break
+            levels.append(np.column_stack([tree.children_left[internal],
+                                           tree.children_right[internal]]).ravel())
+        order = np.concatenate(levels)
+        position = np.empty_like(order)
+        position[order] = np.arange(len(order))
+
+        is_leaf = tree.children_left[order] == -1
+        n_internal = len(order) - is_leaf.sum()
+        first_child = np.empty(len(order), dtype=np.intp)
+        first_child[~is_leaf] = 1 + 2 * np.arange(n_internal)
+        first_child[is_leaf] = np.flatnonzero(is_leaf)
+
+        roots.append(offset)
+        features.append(np.where(is_leaf, 0, tree.feature[order]))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold[order]))
+        children.append(first_child + offset)
+
+        leaf_rows = np.full(len(order), -1)
+        leaf_rows[is_leaf] = np.arange(is_leaf.sum()) + leaf_offset
+        leaves.append(leaf_rows)
+
+        # DecisionTreeClassifier.predict_proba, applied to each leaf once
+        proba = np.ascontiguousarray(tree.value[order[is_leaf]][:, 0, :n_classes], dtype=np.float64)
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+        probas.append(proba)
+
+        offset += len(order)
+        leaf_offset += len(proba)
+
+    return {
+        'feature': np.concatenate(features).astype(np.intp),
+        'threshold': np.concatenate(thresholds).astype(np.float64),
+        'children': np.concatenate(children).astype(np.intp),
+        'leaf': np.concatenate(leaves).astype(np.intp),
+        'leaf_proba': np.concatenate(probas),
+        'roots': np.array(roots, dtype=np.intp),
+        'classes': np.asarray(model.classes_),
+    }
+
+
+class ForestEngine:
+    """
+    Vectorized inference over an exported forest. Provides the parts of the
+    RandomForestClassifier interface ResumePredictor uses: predict_proba,
+    predict, classes_, n_estimators, n_features_in_.
+
+    Args:
+        arrays:     export_forest output (or the arrays loaded by load())
+        n_features: Number of input features (the vectorizer's vocabulary)
+        max_depth:  Deepest leaf over all trees; computed when None
+    """
+
+    def __init__(self, arrays: dict, n_features: int, max_depth: int = None):
+        self.feature = arrays['feature']
+        self.threshold = arrays['threshold']
+        self.children = arrays['children']
+        self.leaf = arrays['leaf']
+        self.leaf_proba = arrays['leaf_proba']
+        self.roots = arrays['roots']
+        self.classes_ = arrays['classes']
+        self.n_estimators = len(self.roots)
+        self.n_features_in_ = n_features
+        self.max_depth = max_depth if max_depth is not None else self._depth()
+
+    @classmethod
+    def from_model(cls, model) -> 'ForestEngine':
+        return cls(export_forest(model), n_features=int(model.n_features_in_))
+
+    @classmethod
+    def load(cls, path: str = FOREST_PATH, mmap_mode: str = None) -> 'ForestEngine':
+        """
+        Args:
+            path:      Directory written by save()
+            mmap_mode: 'r' maps the arrays read-only instead of reading them
+                       (see load_arrays)
+        """
+        arrays, meta = load_arrays(path, ARRAYS, FOREST_FORMAT_VERSION, mmap_mode)
+        return cls(arrays, n_features=meta['n_features'], max_depth=meta['max_depth'])
+
+    def save(self, path: str = FOREST_PATH):
+        """Writes the arrays and meta.json, replacing any previous export at `path`."""
+        meta = {
+            'version': FOREST_FORMAT_VERSION,
+            'n_estimators': self.n_estimators,
+            'n_classes': len(self.classes_),
+            'n_features': self.n_features_in_,
+            'n_nodes': len(self.feature),
+            'max_depth': self.max_depth,
+        }
+        save_arrays(path, {name: self._array(name) for name in ARRAYS}, meta)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Class probabilities, (n_samples, n_classes), as predict_proba.
+
+        Args:
+            X: Sparse or dense (n_samples, n_features) matrix; like sklearn,
+               the values are compared as float32. Rows are scored (and sparse
+               ones densified) a block at a time, see BLOCK_VALUES
+        """
+        if not sp.issparse(X):
+            X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[-1]} features, but the forest expects "
+                             f"{self.n_features_in_}")
+        if sp.issparse(X):
+            X = X.tocsr()
+
+        block_rows = max(1, BLOCK_VALUES // max(X.shape[1], 1))
+        proba = np.empty((X.shape[0], self.leaf_proba.shape[1]), dtype=np.float64)
+        for start in range(0, X.shape[0], block_rows):
+            block = X[start:start + block_rows]
+            if sp.issparse(block):
+                block = block.astype(np.float32).toarray()
+            proba[start:start + len(block)] = self._predict_block(block)
+        return proba
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+    # ─────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────
+
+    def _predict_block(self, X):
+        # X: dense float32 (n_samples, n_features)
+        n_samples = X.shape[0]
+        values = X.ravel()
+        row_offsets = (np.arange(n_samples, dtype=np.intp) * X.shape[1])[np.newaxis, :]
+
+        # All trees of all rows descend together, one level per step: to the
+        # first child, or one past it when x[feature] > threshold
+        nodes = np.repeat(self.roots[:, np.newaxis], n_samples, axis=1)
+        for _ in range(self.max_depth):
+            nodes = (self.children[nodes]
+                     + (values[row_offsets + self.feature[nodes]] > self.threshold[nodes]))
+
+        # Sum over the trees in estimator order, as predict_proba accumulates them
+        leaves = self.leaf[nodes]
+        proba = np.zeros((n_samples, self.leaf_proba.shape[1]), dtype=np.float64)
+        for tree in range(self.n_estimators):
+            proba += self.leaf_proba[leaves[tree]]
+        proba /= self.n_estimators
+        return proba
+
+    def _array(self, name):
+        return self.classes_ if name == 'classes' else getattr(self, name)
+
+    def _depth(self):
+        # Longest root-to-leaf path, following every tree level by level
+        nodes = np.asarray(self.roots)
+        depth = 0
+        while True:
+            nodes = self.children[nodes[self.leaf[nodes] < 0]]
+            if not len(nodes):
+                return depth
+            nodes = np.concatenate([nodes, nodes + 1])
+            depth += 1
@@ -0,0 +1,209 @@
+"""
+lemmas.py — Lemma lookup: precomputed table, bounded LRU, WordNet fallback
+
+Lemmatizing every token with WordNet is the slowest step of preprocessing,
+and loading WordNet dominates the first request. Resume vocabulary repeats
+heavily, so lemmas are served from three tiers:
+
+  1. a table precomputed offline (saved_models/lemma_table.json): the
+     training vocabulary, written by the trainer, plus the words of the
+     vectorizer's vocabulary, added when the model is exported
+     (`python models/artifacts.py`); `python models/lemmas.py` rebuilds it
+     from the training CSV, or from the vectorizer when the CSV is absent
+  2. a bounded LRU of words seen since startup that are not in the table
+  3. WordNetLemmatizer, only on a miss in both; WordNet comes from the local
+     NLTK bundle, loaded once (nltk_resources.load_resources)
+
+Every tier returns exactly what WordNetLemmatizer.lemmatize(word) returns.
+"""
+
+import json
+import os
+import sys
+import threading
+from functools import lru_cache
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+LEMMA_TABLE_PATH = os.path.join(os.path.dirname(current_dir), 'saved_models', 'lemma_table.json')
+
+# Distinct out-of-table words remembered; beyond this the least recently
+# used are evicted
+DEFAULT_CACHE_SIZE = 50000
+
+TABLE_FORMAT_VERSION = 1
+
+
+class LemmaCache:
+    """
+    Args:
+        table:      word -> lemma, precomputed (see build_lemma_table)
+        cache_size: LRU size for words missing from the table (None = unbounded)
+        lemmatizer: object with lemmatize(word); WordNetLemmatizer by default,
+                    created on the first miss
+    """
+
+    def __init__(self, table=None, cache_size=DEFAULT_CACHE_SIZE, lemmatizer=None):
+        self.table = table or {}
+        self.cache_size = cache_size
+        self._lemmatizer = lemmatizer
+        self._lemmatizer_lock = threading.Lock()
+        self._fallback = lru_cache(maxsize=cache_size)(self._lemmatize_uncached)
+        self.lookups = 0
+
+    @classmethod
+    def load(cls, path: str = LEMMA_TABLE_PATH, **kwargs) -> 'LemmaCache':
+        """LemmaCache over the table saved at `path`; an empty table if there is none."""
+        return cls(table=load_lemma_table(path), **kwargs)
+
+    @property
+    def lemmatizer(self):
+        if self._lemmatizer is None:
+            with self._lemmatizer_lock:
+                if self._lemmatizer is None:
+                    from nltk.stem import WordNetLemmatizer
+                    try:
+                        from models.nltk_resources import load_resources
+                    except ImportError:
+                        from nltk_resources import load_resources
+                    load_resources()
+                    self._lemmatizer = WordNetLemmatizer()
+        return self._lemmatizer
+
+    def _lemmatize_uncached(self, word):
+        return self.lemmatizer.lemmatize(word)
+
+    def lemmatize(self, word: str) -> str:
+        self.lookups += 1
+        lemma = self.table.get(word)
+        return lemma if lemma is not None else self._fallback(word)
+
+    def lemmatize_many(self, words) -> list:
+        """Lemmas of `words`, in order."""
+        get = self.table.get
+        fallback = self._fallback
+        lemmas = []
+        for word in words:
+            lemma = get(word)
+            lemmas.append(lemma if lemma is not None else fallback(word))
+        self.lookups += len(lemmas)
+        return lemmas
+
+    def stats(self) -> dict:
+        """Lookups served by each tier since startup (approximate under threads)."""
+        info = self._fallback.cache_info()
+        table_hits = max(self.lookups - info.hits - info.misses, 0)
+        lookups = max(self.lookups, 1)
+        return {
+            'lookups': self.lookups,
+            'table_entries': len(self.table),
+            'table_hits': table_hits,
+            'lru_hits': info.hits,
+            'wordnet_calls': info.misses,
+            'lru_entries': info.currsize,
+            'lru_size': self.cache_size,
+            'table_hit_rate': table_hits / lookups,
+            'hit_rate': (table_hits + info.hits) / lookups,
+        }
+
+
+# ─────────────────────────────────────────────
+# OFFLINE TABLE BUILD
+# ─────────────────────────────────────────────
+
+def training_vocabulary(preprocessor, texts) -> set:
+    """Words that reach the lemmatizer when `texts` are preprocessed."""
+    vocabulary = set()
+    stop_words = preprocessor.stop_words
+    for text in texts:
+        for word in preprocessor.tokenize(preprocessor.clean_text(text)):
+            if word not in stop_words and len(word) > 2:
+                vocabulary.add(word)
+    return vocabulary
+
+
+def vectorizer_vocabulary(vectorizer) -> set:
+    """
+    Words of a fitted vectorizer's terms (n-grams split into their words):
+    the lemmas the model was trained on, which are also the words resumes
+    most often contain before lemmatizing.
+    """
+    return {word for term in vectorizer.vocabulary_ for word in term.split()}
+
+
+def extend_lemma_table(words, path: str = LEMMA_TABLE_PATH, lemmatizer=None) -> dict:
+    """
+    Adds the words of `words` missing from the table saved at `path` (none
+    there yet counts as empty) and saves it.
+
+    Returns:
+        The extended table
+    """
+    table = load_lemma_table(path)
+    table.update(build_lemma_table(set(words) - table.keys(), lemmatizer))
+    save_lemma_table(table, path)
+    return table
+
+
+def build_lemma_table(words, lemmatizer=None) -> dict:
+    """word -> WordNet lemma for every word of `words`."""
+    if lemmatizer is None:
+        from nltk.stem import WordNetLemmatizer
+        lemmatizer = WordNetLemmatizer()
+    return {word: lemmatizer.lemmatize(word) for word in sorted(words)}
+
+
+def save_lemma_table(table: dict, path: str = LEMMA_TABLE_PATH):
+    """
+    Writes the table compactly: words that are their own lemma are stored
+    once, in a list, and only the others as word -> lemma pairs.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {
+        'version': TABLE_FORMAT_VERSION,
+        'unchanged': [word for word, lemma in table.items() if word == lemma],
+        'lemmas': {word: lemma for word, lemma in table.items() if word != lemma},
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def load_lemma_table(path: str = LEMMA_TABLE_PATH) -> dict:
+    """The saved table, or {} if it is missing or from another format version."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if data.get('version') != TABLE_FORMAT_VERSION:
+        return {}
+    table = {word: word for word in data['unchanged']}
+    table.update(data['lemmas'])
+    return table
+
+
+# Rebuild the table without retraining: from the training CSV, or from the
+# saved vectorizer's vocabulary when the CSV is not there
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(current_dir))
+    from models.nltk_resources import load_resources
+
+    load_resources()
+    csv_path = os.path.join(os.path.dirname(current_dir), 'data', 'resumes_clean.csv')
+    if os.path.exists(csv_path):
+        import pandas as pd
+        from models.preprocessor import ResumePreprocessor
+
+        texts = pd.read_csv(csv_path)['Resume'].tolist()
+        vocabulary = training_vocabulary(ResumePreprocessor(), texts)
+        source = f"{len(texts)} resumes"
+    else:
+        import joblib
+
+        vectorizer = joblib.load(os.path.join(os.path.dirname(LEMMA_TABLE_PATH), 'vectorizer.pkl'))
+        vocabulary = vectorizer_vocabulary(vectorizer)
+        source = "the vectorizer's vocabulary"
+    table = build_lemma_table(vocabulary)
+    save_lemma_table(table)
+    print(f"✅ Lemma table: {len(table)} words from {source} saved to {LEMMA_TABLE_PATH}")
@@ -0,0 +1,154 @@
+"""
+nltk_resources.py — Offline NLTK data: local bundle, explicit thread-safe loading
+
+NLTK data is read from a local bundle (backend/nltk_data, or the directory
+in NLTK_DATA_DIR), searched before NLTK's default locations. The bundle is
+filled once, at build or deploy time, with:
+
+    python models/nltk_resources.py download
+
+Nothing is downloaded at import or at runtime by default: load_resources()
+fails fast, naming that command, when required data is missing. A deployment
+with network access can opt in to load_resources(download_missing=True)
+(the app's NLTK_DOWNLOAD_MISSING), which fetches the missing required
+packages into the bundle once.
+
+load_resources() loads the corpora up front and exactly once per process.
+NLTK's lazy corpus loaders replace themselves with the real reader on first
+access, which is not safe when several threads get there at the same time,
+so the app calls it before it accepts traffic and every later access finds
+the corpora already loaded.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import nltk
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+NLTK_DATA_DIR = os.environ.get('NLTK_DATA_DIR',
+                               os.path.join(os.path.dirname(current_dir), 'nltk_data'))
+
+if NLTK_DATA_DIR not in nltk.data.path:
+    nltk.data.path.insert(0, NLTK_DATA_DIR)
+
+# package -> resource path; needed by ResumePreprocessor in every mode
+REQUIRED_RESOURCES = {
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+}
+
+# Only needed by the 'nltk' tokenizer mode (word_tokenize) and by WordNet
+# lookups in languages other than English
+OPTIONAL_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'omw-1.4': 'corpora/omw-1.4',
+}
+
+_load_lock = threading.Lock()
+_load_times = None
+
+
+class NLTKResourceError(LookupError):
+    """Required NLTK data is missing from the local bundle."""
+
+
+def missing_resources(resources=REQUIRED_RESOURCES) -> list:
+    """Packages of `resources` that cannot be found on the NLTK data path."""
+    missing = []
+    for package, path in resources.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            try:
+                nltk.data.find(f"{path}.zip")
+            except LookupError:
+                missing.append(package)
+    return missing
+
+
+def load_resources(download_missing: bool = False) -> dict:
+    """
+    Loads the required corpora once per process (thread-safe; later calls
+    return immediately).
+
+    Args:
+        download_missing: Download required packages missing from the local
+                          bundle into it (once, logged) instead of failing
+
+    Returns:
+        Seconds spent per step of the first call: 'stopwords', 'wordnet'
+
+    Raises:
+        NLTKResourceError: A required package is not in the local bundle (and
+                           could not be downloaded, with download_missing)
+    """
+    global _load_times
+    if _load_times is not None:
+        return _load_times
+    with _load_lock:
+        if _load_times is not None:
+            return _load_times
+
+        missing = missing_resources()
+        if missing and download_missing:
+            print(f"[NLTK] Data not found: {', '.join(missing)}; downloading it once into "
+                  f"{NLTK_DATA_DIR} (run 'python models/nltk_resources.py download' at deploy "
+                  f"time to skip this)")
+            download(optional=False)
+            missing = missing_resources()
+        if missing:
+            raise NLTKResourceError(
+                f"NLTK data not found: {', '.join(missing)}. Install it into {NLTK_DATA_DIR} "
+                f"with: python models/nltk_resources.py download"
+            )
+
+        from nltk.corpus import stopwords, wordnet
+        from nltk.stem import WordNetLemmatizer
+        times = {}
+        start = time.perf_counter()
+        stopwords.ensure_loaded()
+        stopwords.words('english')
+        times['stopwords'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        wordnet.ensure_loaded()
+        # The first lookup builds WordNet's lemma and exception indexes
+        WordNetLemmatizer().lemmatize('resumes')
+        times['wordnet'] = time.perf_counter() - start
+
+        _load_times = times
+        return times
+
+
+def download(directory: str = NLTK_DATA_DIR, optional: bool = True) -> bool:
+    """
+    Fetches the packages into the local bundle. A build/deploy step; the app
+    only calls it (required packages only) for data missing at startup.
+    """
+    packages = list(REQUIRED_RESOURCES)
+    if optional:
+        packages += list(OPTIONAL_RESOURCES)
+    os.makedirs(directory, exist_ok=True)
+    return all([nltk.download(package, download_dir=directory, quiet=True) for package in packages])
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'check'
+    if command == 'download':
+        ok = download()
+        print(f"{'✅' if ok else '❌'} NLTK data in {NLTK_DATA_DIR}")
+        sys.exit(0 if ok else 1)
+
+    required = missing_resources()
+    optional = missing_resources(OPTIONAL_RESOURCES)
+    print(f"NLTK data path: {NLTK_DATA_DIR} (searched first)")
+    print(f"Required: {'all present' if not required else 'missing ' + ', '.join(required)}")
+    print(f"Optional: {'all present' if not optional else 'missing ' + ', '.join(optional)}")
+    if not required:
+        times = load_resources()
+        print("Load times: " + ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in times.items()))
+    sys.exit(1 if required else 0)
@@ -1,5 +1,7 @@
 import joblib
+import numpy as np
 import os
+import scipy.sparse as sp
 import sys
 
 # Add parent directory to path for imports
@@ -8,21 +10,68 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 try:
+    from models.artifacts import VECTORIZER_PATH, artifact_version, is_current, load_vectorizer
+    from models.forest import FOREST_PATH, ForestEngine
+    from models.lemmas import LEMMA_TABLE_PATH
     from models.preprocessor import ResumePreprocessor
 except ImportError:
+    from artifacts import VECTORIZER_PATH, artifact_version, is_current, load_vectorizer
+    from forest import FOREST_PATH, ForestEngine
+    from lemmas import LEMMA_TABLE_PATH
     from preprocessor import ResumePreprocessor
+from analysis.document import ResumeDocument
+
+# Roles listed in a prediction's 'top_3_roles'
+TOP_ROLES = 3
+
+# Exported artifacts are memory-mapped read-only, so preforked web workers
+# share one copy of the forest through the page cache (None reads them in)
+MMAP_MODE = 'r'
+
+
+def top_k_columns(probabilities, k):
+    """
+    Column indices of the k largest entries of each row, largest first
+    
+    A partial sort: np.partition finds each row's k-th largest value, the
+    entries above it and enough of the entries equal to it are selected, and
+    only those k are sorted. Ties go to the lower column, so the first column
+    is always the row's argmax (the predicted class).
+    
+    Args:
+        probabilities: (n, classes) array
+        k: Columns per row (at most the number of classes)
+        
+    Returns:
+        (n, k) array of column indices
+    """
+    rows, columns = probabilities.shape
+    k = min(k, columns)
+    if k <= 0:
+        return np.empty((rows, 0), dtype=np.intp)
+    kth = -np.partition(-probabilities, k - 1, axis=1)[:, k - 1:k]
+    above = probabilities > kth
+    tied = probabilities == kth
+    room = k - above.sum(axis=1, keepdims=True)
+    selected = above | (tied & (np.cumsum(tied, axis=1) <= room))
+    chosen = np.nonzero(selected)[1].reshape(rows, k)
+    order = np.argsort(-np.take_along_axis(probabilities, chosen, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(chosen, order, axis=1)
+
 
 class ResumePredictor:
     """
     Loads trained model and predicts job role from resume text
     """
     
-    def __init__(self):
+    def __init__(self, mmap_mode=MMAP_MODE):
         self.preprocessor = ResumePreprocessor()
+        self.mmap_mode = mmap_mode
         self.model = None
         self.vectorizer = None
         self.label_encoder = None
         self.inverse_label_encoder = None
+        self.model_version = None
         self.load_model()
     
     def load_model(self):
@@ -35,21 +84,56 @@ class ResumePredictor:
         encoder_path = os.path.join(models_dir, 'label_encoder.pkl')
         
         # Load all components
-        self.model = joblib.load(model_path)
-        self.vectorizer = joblib.load(vectorizer_path)
+        self.model = self.load_artifact(model_path, FOREST_PATH, ForestEngine.load)
+        self.vectorizer = self.load_artifact(vectorizer_path, VECTORIZER_PATH, load_vectorizer)
         self.label_encoder = joblib.load(encoder_path)
         
+        n_features = len(self.vectorizer.vocabulary_)
+        if self.model.n_features_in_ != n_features:
+            raise ValueError(f"Model expects {self.model.n_features_in_} features, "
+                             f"vectorizer produces {n_features}; retrain the model")
+        
         # Create inverse mapping
         self.inverse_label_encoder = {v: k for k, v in self.label_encoder.items()}
         
+        # Role of each predict_proba column
+        self.column_roles = [self.inverse_label_encoder[label] for label in self.model.classes_]
+        
+        # Fingerprint of the artifacts just loaded; caches of derived results
+        # (AnalysisCache) are dropped when a reload changes it
+        self.model_version = artifact_version([model_path, FOREST_PATH, vectorizer_path,
+                                               VECTORIZER_PATH, encoder_path, LEMMA_TABLE_PATH])
+        
         print("✅ Model loaded successfully!")
     
-    def predict(self, resume_text):
+    def load_artifact(self, pickle_path, export_path, load_export):
+        """
+        The exported arrays at export_path (saved_models/forest/ loads as a
+        ForestEngine: same probabilities, faster) when they are at least as
+        new as the pickle, memory-mapped with self.mmap_mode; otherwise the
+        pickle
+        """
+        if is_current(export_path, pickle_path):
+            return load_export(export_path, mmap_mode=self.mmap_mode)
+        return joblib.load(pickle_path)
+    
+    def document(self, resume_text):
+        """
+        Wrap resume text in a ResumeDocument bound to this predictor's
+        preprocessor and vectorizer
+        """
+        return ResumeDocument(resume_text, preprocessor=self.preprocessor, vectorizer=self.vectorizer)
+    
+    def predict(self, resume_text, section_weights=None):
         """
         Predict job role from resume text
         
         Args:
-            resume_text (str): Raw resume text
+            resume_text (str | ResumeDocument): Raw resume text, or a document
+                whose memoized preprocessing and features are reused
+            section_weights (dict): Optional section name -> weight (e.g.
+                {'skills': 2.0, 'header': 0}); sections default to 1.0 and a
+                weight of 0 restricts the prediction to the other sections
             
         Returns:
             dict: {
@@ -58,32 +142,93 @@ class ResumePredictor:
                 'top_3_roles': list of tuples (role, probability)
             }
         """
-        # Step 1: Preprocess the text
-        cleaned_text = self.preprocessor.preprocess(resume_text)
+        return self.predict_many([resume_text], section_weights=section_weights)[0]
+    
+    def predict_many(self, resumes, section_weights=None, top_k=TOP_ROLES, workers=1):
+        """
+        Predict job roles for many resumes with a single pass over the forest
         
-        # Step 2: Convert to TF-IDF features
-        features = self.vectorizer.transform([cleaned_text])
+        One predict_proba call scores the whole batch; each label is the most
+        probable class of its row (what model.predict would return) and the
+        top roles come from a vectorized partial sort.
         
+        Args:
+            resumes (list): Raw resume texts and/or ResumeDocuments
+            section_weights (dict): As for predict()
+            top_k (int): Roles listed in 'top_3_roles', most probable first
+            workers (int): Processes preprocessing the raw texts
+                (preprocess_many); 1 = this process, None = all cores, for
+                offline scoring
+            
+        Returns:
+            list: One predict() result per resume, in input order
+        """
+        resumes = list(resumes)
+        if not resumes:
+            return []
+        
+        # Steps 1-2: Preprocess the texts and convert to TF-IDF features
+        features = self.features_many(resumes, section_weights, workers)
+        
+        # Steps 3-5
+        return self.predict_features(features, top_k)
+    
+    def predict_features(self, features, top_k=TOP_ROLES):
+        """
+        predict_many for TF-IDF rows already computed
+        
+        Args:
+            features: (n, vocabulary) matrix, one row per resume
+            top_k (int): As for predict_many()
+            
+        Returns:
+            list: One predict() result per row
+        """
         # Step 3: Predict
-        prediction = self.model.predict(features)[0]
-        probabilities = self.model.predict_proba(features)[0]
-        
-        # Step 4: Get predicted role
-        predicted_role = self.inverse_label_encoder[prediction]
-        confidence = probabilities[prediction]
-        
-        # Step 5: Get top 3 predictions
-        top_3_indices = probabilities.argsort()[-3:][::-1]
-        top_3_roles = [
-            (self.inverse_label_encoder[idx], float(probabilities[idx]))
-            for idx in top_3_indices
-        ]
-        
-        return {
-            'predicted_role': predicted_role,
-            'confidence': float(confidence),
-            'top_3_roles': top_3_roles
-        }
+        probabilities = self.model.predict_proba(features)
+        
+        # Steps 4-5: Predicted role (column 0) and the top roles
+        top_columns = top_k_columns(probabilities, max(top_k, 1))
+        top_probabilities = np.take_along_axis(probabilities, top_columns, axis=1)
+        
+        results = []
+        for columns, values in zip(top_columns.tolist(), top_probabilities.tolist()):
+            top_roles = [(self.column_roles[column], value) for column, value in zip(columns, values)]
+            results.append({
+                'predicted_role': top_roles[0][0],
+                'confidence': top_roles[0][1],
+                'top_3_roles': top_roles[:top_k]
+            })
+        return results
+    
+    def features_many(self, resumes, section_weights=None, workers=1):
+        """
+        TF-IDF feature matrix, one row per resume
+        
+        Documents contribute their memoized rows; raw texts are preprocessed
+        with preprocess_many and vectorized in one transform call.
+        """
+        if section_weights:
+            return sp.vstack([
+                (resume if isinstance(resume, ResumeDocument) else self.document(resume))
+                .section_features(section_weights)
+                for resume in resumes
+            ], format='csr')
+        
+        raw = [i for i, resume in enumerate(resumes) if not isinstance(resume, ResumeDocument)]
+        if raw:
+            texts = [resumes[i] for i in raw]
+            matrix = self.vectorizer.transform(list(
+                self.preprocessor.preprocess_many(texts, workers=workers)
+            ))
+            if len(raw) == len(resumes):
+                return matrix
+        
+        rows = [None if not isinstance(resume, ResumeDocument) else resume.features
+                for resume in resumes]
+        for position, i in enumerate(raw):
+            rows[i] = matrix[position]
+        return sp.vstack(rows, format='csr')
 
 # Test the predictor
 if __name__ == "__main__":
@@ -1,28 +1,148 @@
+import os
 import re
-import nltk
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
 
-# Download required NLTK data (run once)
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    print("Downloading NLTK data...")
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
-    nltk.download('omw-1.4')
-    nltk.download('punkt_tab')
+    from models.lemmas import LemmaCache
+    from models.nltk_resources import NLTKResourceError, load_resources, missing_resources
+except ImportError:
+    from lemmas import LemmaCache
+    from nltk_resources import NLTKResourceError, load_resources, missing_resources
+
+# NLTK data comes from the local bundle (see nltk_resources.py) and is
+# loaded when the first ResumePreprocessor is created, never downloaded
+
+# word_tokenize splits these words even when they contain no punctuation
+# (Treebank contraction rules), so the fast tokenizer does the same
+CONTRACTION_SPLITS = {
+    'cannot': ['can', 'not'],
+    'gimme': ['gim', 'me'],
+    'gonna': ['gon', 'na'],
+    'gotta': ['got', 'ta'],
+    'lemme': ['lem', 'me'],
+    'wanna': ['wan', 'na'],
+}
+
+
+def fast_tokenize(text):
+    """
+    word_tokenize for clean_text output (lowercase letters and single spaces):
+    a C-level whitespace split, plus the contraction splits NLTK applies
+    """
+    tokens = text.split()
+    if CONTRACTION_SPLITS.keys().isdisjoint(tokens):
+        return tokens
+    split = []
+    for token in tokens:
+        parts = CONTRACTION_SPLITS.get(token)
+        if parts:
+            split.extend(parts)
+        else:
+            split.append(token)
+    return split
+
+
+URL_PATTERN = re.compile(r'http\S+|www\S+|https\S+')
+EMAIL_PATTERN = re.compile(r'\S+@\S+')
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+INTL_PHONE_PATTERN = re.compile(r'\+\d{1,3}\s?\d+')
+NON_LETTER_PATTERN = re.compile(r'[^a-zA-Z\s]')
+
+# URLs and emails never cross whitespace, so only whitespace-separated runs
+# containing http/www/@/+ can change in steps 2-4, together with the
+# digit-led runs an international number ("+44 20...") can reach through
+# one whitespace character. A plain PHONE_PATTERN number is bounded by
+# non-letters: removing it or blanking it leaves the same words.
+CONTACT_TRIGGER_PATTERN = re.compile(r'http|www|@|\+')
+CONTACT_RUN_PATTERN = re.compile(r'\S*?(?:http|www|@|\+)\S*(?:\s\d\S*)*')
+# Up to and including the last whitespace character before a position
+RUN_PREFIX_PATTERN = re.compile(r'.*\s', re.DOTALL)
+LETTER_RUN_PATTERN = re.compile(r'[a-zA-Z]+')
+# Byte table for ASCII text: letters kept, every other byte turned into a space
+LETTER_BYTES = bytes(c if chr(c).isascii() and chr(c).isalpha() else 32 for c in range(256))
+
+
+def _strip_contact_runs(text):
+    """Steps 2-4 applied only to the runs that can contain a match."""
+    pieces = []
+    pos = 0
+    for trigger in CONTACT_TRIGGER_PATTERN.finditer(text):
+        if trigger.start() < pos:
+            continue
+        prefix = RUN_PREFIX_PATTERN.match(text, pos, trigger.start())
+        start = prefix.end() if prefix else pos
+        end = CONTACT_RUN_PATTERN.match(text, start).end()
+        run = URL_PATTERN.sub('', text[start:end])
+        run = EMAIL_PATTERN.sub('', run)
+        run = PHONE_PATTERN.sub('', run)
+        pieces.append(text[pos:start])
+        pieces.append(INTL_PHONE_PATTERN.sub('', run))
+        pos = end
+    if not pieces:
+        return text
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+
+def _letter_runs(text):
+    """Steps 5-6: the runs of ASCII letters, single-spaced."""
+    if text.isascii():
+        return b' '.join(text.encode('ascii').translate(LETTER_BYTES).split()).decode('ascii')
+    return ' '.join(LETTER_RUN_PATTERN.findall(text))
+
+
+def clean_lowercase_text_stepwise(text):
+    """
+    The original step-by-step cleaner, kept as the reference for
+    ResumePreprocessor.clean_lowercase_text and its benchmark
+    """
+    # Step 2: Remove URLs
+    text = URL_PATTERN.sub('', text)
+    
+    # Step 3: Remove email addresses
+    text = EMAIL_PATTERN.sub('', text)
+    
+    # Step 4: Remove phone numbers
+    text = PHONE_PATTERN.sub('', text)
+    text = INTL_PHONE_PATTERN.sub('', text)
+    
+    # Step 5: Remove special characters and numbers
+    text = NON_LETTER_PATTERN.sub(' ', text)
+    
+    # Step 6: Remove extra whitespace
+    return ' '.join(text.split())
+
+
+# Texts per preprocess_many task: large enough to amortize the round trip
+# to a worker, small enough to keep all workers busy to the end
+PREPROCESS_CHUNK_SIZE = 32
+
 
 class ResumePreprocessor:
     """
     Cleans and preprocesses resume text for ML model
+    
+    Args:
+        tokenizer:   'fast' (fast_tokenize, the default) or 'nltk' (word_tokenize);
+                     both give the same tokens on clean_text output
+        lemma_cache: LemmaCache serving the lemmas; by default one over the
+                     precomputed table in saved_models/lemma_table.json
     """
     
-    def __init__(self):
+    def __init__(self, tokenizer='fast', lemma_cache=None):
+        if tokenizer not in ('fast', 'nltk'):
+            raise ValueError(f"Unknown tokenizer: {tokenizer!r}")
+        load_resources()
+        if tokenizer == 'nltk' and missing_resources({'punkt': 'tokenizers/punkt'}):
+            raise NLTKResourceError("The 'nltk' tokenizer needs the punkt data in the local bundle")
+        self.tokenizer = tokenizer
         self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
+        self.lemmas = lemma_cache if lemma_cache is not None else LemmaCache.load()
         
     def clean_text(self, text):
         """
@@ -32,41 +152,52 @@ class ResumePreprocessor:
             return ""
         
         # Step 1: Convert to lowercase
-        text = text.lower()
-        
-        # Step 2: Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text)
-        
-        # Step 3: Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Step 4: Remove phone numbers
-        text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '', text)
-        text = re.sub(r'\+\d{1,3}\s?\d+', '', text)
-        
-        # Step 5: Remove special characters and numbers
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+        return self.clean_lowercase_text(text.lower())
+    
+    def clean_lowercase_text(self, text):
+        """
+        clean_text for text that is already lowercase (e.g. shared by a ResumeDocument)
         
-        # Step 6: Remove extra whitespace
-        text = ' '.join(text.split())
+        Instead of five substitutions and a split over the whole text, one scan
+        finds the runs that can hold a URL, email or phone number (only those
+        are rewritten) and one collects the words. The output is identical to
+        clean_lowercase_text_stepwise.
+        """
+        # Steps 2-4: Remove URLs, email addresses and phone numbers
+        text = _strip_contact_runs(text)
         
-        return text
+        # Steps 5-6: Keep the runs of letters, single-spaced
+        return _letter_runs(text)
     
     def tokenize_and_lemmatize(self, text):
         """
         Tokenize and lemmatize the text
         """
         # Tokenize
-        tokens = word_tokenize(text)
+        tokens = self.tokenize(text)
         
         # Remove stopwords and lemmatize
-        tokens = [
-            self.lemmatizer.lemmatize(word) 
+        return self.lemmatize_tokens(tokens)
+    
+    def tokenize(self, text):
+        """
+        Split cleaned text into tokens
+        """
+        if self.tokenizer == 'fast':
+            return fast_tokenize(text)
+        return word_tokenize(text)
+    
+    def lemmatize_tokens(self, tokens):
+        """
+        Drop stopwords and short tokens, lemmatize the rest
+        """
+        words = [
+            word
             for word in tokens 
             if word not in self.stop_words and len(word) > 2
         ]
         
-        return ' '.join(tokens)
+        return ' '.join(self.lemmas.lemmatize_many(words))
     
     def preprocess(self, text):
         """
@@ -79,6 +210,89 @@ class ResumePreprocessor:
         processed = self.tokenize_and_lemmatize(cleaned)
         
         return processed
+    
+    def preprocess_many(self, texts, workers=None, chunk_size=PREPROCESS_CHUNK_SIZE, executor=None):
+        """
+        preprocess() over many texts, spread across a pool of worker processes
+        
+        Args:
+            texts:      Any iterable of texts (list, pandas Series, generator);
+                        read lazily, a bounded number of chunks ahead
+            workers:    Worker processes (default: all cores); 1 = this process
+            chunk_size: Texts sent to a worker per task
+            executor:   A running pool from preprocess_executor() to use instead
+                        of starting one (left running afterwards, and used
+                        however few the texts); `workers` is then its size
+            
+        Yields:
+            The preprocessed texts, in input order, as their chunks complete
+        """
+        workers = workers or os.cpu_count() or 1
+        texts = iter(texts)
+        first = list(islice(texts, chunk_size))
+        if executor is None and (workers == 1 or len(first) < chunk_size):
+            # One chunk or one core: a pool would only add start-up cost
+            for text in first:
+                yield self.preprocess(text)
+            for text in texts:
+                yield self.preprocess(text)
+            return
+        
+        owned = executor is None
+        if owned:
+            executor = self.preprocess_executor(workers)
+        chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+        in_flight = deque([executor.submit(_preprocess_chunk, first)])
+        try:
+            # Two chunks per worker in flight keeps every core busy while
+            # holding only a bounded slice of the input in memory
+            for chunk in islice(chunks, workers * 2 - 1):
+                in_flight.append(executor.submit(_preprocess_chunk, chunk))
+            while in_flight:
+                results = in_flight.popleft().result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    in_flight.append(executor.submit(_preprocess_chunk, chunk))
+                yield from results
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if owned:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def preprocess_executor(self, workers=None, mp_context=None):
+        """
+        Process pool for preprocess_many(executor=...): each worker builds a
+        preprocessor like this one, over the same lemma table, once
+        
+        Args:
+            workers:    Worker processes (default: all cores)
+            mp_context: multiprocessing context the workers start from
+                        (default: the platform's)
+        """
+        return ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            mp_context=mp_context,
+            initializer=_init_preprocess_worker,
+            initargs=(self.tokenizer, self.lemmas.table, self.lemmas.cache_size)
+        )
+
+
+# ── preprocess_many worker side ─────────────────────────────
+
+_worker_preprocessor = None
+
+
+def _init_preprocess_worker(tokenizer, lemma_table, cache_size):
+    """Each worker builds its own preprocessor once, over the parent's lemma table."""
+    global _worker_preprocessor
+    lemma_cache = LemmaCache(table=lemma_table, cache_size=cache_size)
+    _worker_preprocessor = ResumePreprocessor(tokenizer=tokenizer, lemma_cache=lemma_cache)
+
+
+def _preprocess_chunk(texts):
+    return [_worker_preprocessor.preprocess(text) for text in texts]
+
 
 # Test the preprocessor
 if __name__ == "__main__":
@@ -5,7 +5,11 @@ from sklearn.model_selection import train_test_split
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, accuracy_score
+from models.artifacts import VECTORIZER_PATH, save_vectorizer
+from models.forest import FOREST_PATH, ForestEngine
 from models.preprocessor import ResumePreprocessor
+from models.lemmas import (LEMMA_TABLE_PATH, build_lemma_table, save_lemma_table, training_vocabulary,
+                           vectorizer_vocabulary)
 
 class ResumeClassifierTrainer:
     """
@@ -38,9 +42,9 @@ class ResumeClassifierTrainer:
     def preprocess_data(self, df):
         """Clean all resume texts"""
         print("\n🧹 Preprocessing resume texts...")
-        print("This may take 2-3 minutes...")
+        print(f"Using {os.cpu_count() or 1} worker processes...")
         
-        df['Cleaned_Resume'] = df['Resume'].apply(self.preprocessor.preprocess)
+        df['Cleaned_Resume'] = list(self.preprocessor.preprocess_many(df['Resume']))
         df = df[df['Cleaned_Resume'].str.len() > 50]
         
         print(f"✅ Preprocessed {len(df)} resumes")
@@ -147,9 +151,26 @@ class ResumeClassifierTrainer:
         encoder_path = os.path.join(models_dir, 'label_encoder.pkl')
         joblib.dump(self.label_encoder, encoder_path)
         
+        # Memory-mappable exports, written after the pickles so they are newer
+        ForestEngine.from_model(self.model).save(FOREST_PATH)
+        save_vectorizer(self.vectorizer, VECTORIZER_PATH)
+        
         print("✅ Model saved to:", model_path)
         print("✅ Vectorizer saved to:", vectorizer_path)
         print("✅ Label encoder saved to:", encoder_path)
+        print("✅ Forest arrays saved to:", FOREST_PATH)
+        print("✅ Vectorizer arrays saved to:", VECTORIZER_PATH)
+
+    def save_lemmas(self, df):
+        """Precompute the lemmas of the training and vectorizer vocabularies for ResumePreprocessor"""
+        print("\n💾 Saving lemma table...")
+        
+        vocabulary = training_vocabulary(self.preprocessor, df['Resume'])
+        vocabulary |= vectorizer_vocabulary(self.vectorizer)
+        table = build_lemma_table(vocabulary, self.preprocessor.lemmas.lemmatizer)
+        save_lemma_table(table, LEMMA_TABLE_PATH)
+        
+        print(f"✅ Lemma table ({len(table)} words) saved to:", LEMMA_TABLE_PATH)
 
 def main():
     print("="*60)
@@ -176,6 +197,9 @@ def main():
     # Step 6: Save model
     trainer.save_model()
     
+    # Step 7: Save lemma table
+    trainer.save_lemmas(df)
+    
     print("\n" + "="*60)
     print(f"✅ TRAINING COMPLETED! Final Accuracy: {accuracy * 100:.2f}%")
     print("="*60)
@@ -0,0 +1,152 @@
+"""
+Analysis cache tests: results served through AnalysisCache must be exactly
+what analyzing every request gives, copies the caller may modify, and the
+model's layers must be dropped when the model version changes
+
+Run from the backend folder:  python -m pytest test_analysis_cache.py
+
+The predictor is a ResumePredictor over a small forest fitted here on fixed
+resumes. Needs the NLTK stopwords and WordNet data (skipped without them).
+"""
+
+import os
+import sys
+
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analysis.ats import check_ats_friendliness
+from analysis.cache import AnalysisCache
+from models.forest import ForestEngine
+from models.predict import ResumePredictor
+from models.preprocessor import ResumePreprocessor
+
+TEMPLATE = """{name}
+{name_lower}@example.com | +1 555 010 {phone}
+SUMMARY
+{role} who {verbs} {work}.
+EXPERIENCE
+{role}, Example Corp (2019-2024): {work}, {extra}.
+EDUCATION
+BSc, State University
+SKILLS
+{skills}
+"""
+
+ROLES = {
+    'Data Analyst': ('developed and managed', 'SQL reporting and Tableau dashboards',
+                     'Python, SQL, Excel, Tableau, statistics'),
+    'Web Developer': ('designed and implemented', 'React frontends and REST APIs',
+                      'JavaScript, React, HTML, CSS, Node'),
+    'Network Engineer': ('led and optimized', 'routing, firewalls and VPN rollouts',
+                         'Cisco, TCP/IP, BGP, firewalls, Linux'),
+}
+EXTRAS = ['improved reliability', 'mentored two juniors', 'cut costs by a fifth',
+          'automated weekly reports']
+
+
+def resume(role, i):
+    verbs, work, skills = ROLES[role]
+    name = f"Candidate {chr(65 + i)}"
+    return TEMPLATE.format(name=name, name_lower=name.lower().replace(' ', '.'),
+                           phone=2000 + i, role=role, verbs=verbs, work=work,
+                           extra=EXTRAS[i % len(EXTRAS)], skills=skills)
+
+
+TEXTS = [resume(role, i) for role in ROLES for i in range(4)]
+
+
+@pytest.fixture(scope='module')
+def predictor():
+    try:
+        preprocessor = ResumePreprocessor()
+    except LookupError:
+        pytest.skip("NLTK stopwords/wordnet data not installed")
+
+    roles = sorted(ROLES)
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    features = vectorizer.fit_transform([preprocessor.preprocess(text) for text in TEXTS])
+    labels = [roles.index(role) for role in ROLES for _ in range(4)]
+    model = RandomForestClassifier(n_estimators=10, random_state=0, n_jobs=1).fit(features, labels)
+
+    predictor = ResumePredictor.__new__(ResumePredictor)
+    predictor.preprocessor = preprocessor
+    predictor.vectorizer = vectorizer
+    predictor.model = ForestEngine.from_model(model)
+    predictor.label_encoder = {role: i for i, role in enumerate(roles)}
+    predictor.inverse_label_encoder = dict(enumerate(roles))
+    predictor.column_roles = [roles[label] for label in predictor.model.classes_]
+    predictor.model_version = 'test'
+    return predictor
+
+
+def requests():
+    """Every resume twice, and again with only a different phone number or spacing."""
+    for text in TEXTS:
+        yield text
+        yield text
+        yield text.replace('+1 555 010', '+44 20 7946')
+        yield text.replace(', ', ',  ')
+
+
+def test_same_results_as_uncached(predictor):
+    cache = AnalysisCache(predictor)
+    for text in requests():
+        assert cache.ats(predictor.document(text)) == check_ats_friendliness(predictor.document(text))
+        assert cache.prediction(predictor.document(text)) == predictor.predict(predictor.document(text))
+
+    stats = cache.stats()['layers']
+    # Only exact repeats hit the processed and ats layers (keyed on the raw
+    # text); the near-duplicates preprocess to the same text as the original,
+    # so from the features layer on every resume is computed once
+    assert stats['processed']['hits'] == len(TEXTS)
+    assert stats['ats']['hits'] == len(TEXTS)
+    assert stats['features']['hits'] == 3 * len(TEXTS)
+    assert stats['prediction']['hits'] == 3 * len(TEXTS)
+
+
+def test_section_weights(predictor):
+    cache = AnalysisCache(predictor)
+    weights = {'skills': 2.0, 'header': 0}
+    for text in TEXTS[:3] * 2:
+        assert (cache.prediction(predictor.document(text), weights)
+                == predictor.predict(predictor.document(text), weights))
+    assert cache.stats()['layers']['prediction']['hits'] == 3
+
+
+def test_results_are_copies(predictor):
+    cache = AnalysisCache(predictor)
+    text = TEXTS[0]
+
+    ats = cache.ats(predictor.document(text))
+    ats['issues'].append('changed')
+    ats['details']['length'] = 'changed'
+    prediction = cache.prediction(predictor.document(text))
+    prediction['predicted_role'] = 'changed'
+    prediction['top_3_roles'].clear()
+
+    assert cache.ats(predictor.document(text)) == check_ats_friendliness(text)
+    assert cache.prediction(predictor.document(text)) == predictor.predict(text)
+
+
+def test_model_version_change_clears_the_model_layers(predictor):
+    cache = AnalysisCache(predictor)
+    for text in TEXTS:
+        cache.ats(predictor.document(text))
+        cache.prediction(predictor.document(text))
+
+    predictor.model_version = 'test-retrained'
+    try:
+        cache.prediction(predictor.document(TEXTS[0]))
+        stats = cache.stats()
+    finally:
+        predictor.model_version = 'test'
+
+    assert stats['model_version'] == 'test-retrained'
+    assert stats['invalidations'] == 1
+    for name in ('processed', 'features', 'prediction'):
+        assert stats['layers'][name]['entries'] == 1
+    assert stats['layers']['ats']['entries'] == len(TEXTS)
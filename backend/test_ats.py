@@ -0,0 +1,112 @@
+"""
+ATS check tests: the precompiled matcher must score exactly as the original
+regex-based check (check_ats_friendliness_regex), and the vectorized batch
+scorer exactly as scoring one document at a time
+
+Run from the backend folder:  python -m pytest test_ats.py
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analysis.ats import (ATS_MATCHER, EMAIL_PATTERN, LEGACY_ATS_MATCHER, PHONE_PATTERN,
+                          SPECIAL_CHAR_PATTERN, check_ats_friendliness, check_ats_friendliness_many,
+                          check_ats_friendliness_regex)
+from analysis.ats_rules import ATS_SCORER, PENALTY_RULES, ATSScorer
+
+GOOD_RESUME = """JANE DOE
+jane.doe@example.com | +1 555-010-2000 | linkedin.com/in/janedoe
+
+SUMMARY
+Data analyst with six years of experience turning raw data into decisions.
+
+EXPERIENCE
+Senior Data Analyst, Example Corp (2020-2024)
+- Developed SQL pipelines feeding the company's revenue dashboards
+- Managed a team of three analysts and led the reporting migration
+- Designed Tableau dashboards used by 200+ staff every week
+- Implemented automated data quality checks, improved accuracy by 30%
+Data Analyst, Sample Ltd (2018-2020)
+- Created forecasting models in Python and optimized monthly reporting
+- Automated the weekly sales extract, saving the finance team a day per week
+- Built a churn analysis that informed the retention campaign for 2019
+
+EDUCATION
+BSc Statistics, State University (2014-2018)
+
+SKILLS
+Python, SQL, Excel, Tableau, Power BI, statistics, forecasting
+"""
+
+RESUMES = [
+    GOOD_RESUME,
+    '',
+    'Too short: no contact details, no sections.',
+    GOOD_RESUME.replace('@', ' (at) '),
+    GOOD_RESUME.replace('555-010-2000', 'on request'),
+    GOOD_RESUME.replace('EDUCATION', 'STUDIES').replace('SKILLS', 'TOOLS'),
+    GOOD_RESUME.upper(),
+    GOOD_RESUME[:500],
+    '•★✓ ' * 120 + GOOD_RESUME,
+    GOOD_RESUME * 3,
+]
+
+FRAGMENTS = [
+    '', 'a@b.co', 'x@y', 'first.last+tag@mail.example.org.', '@example.com', 'me@@example.com',
+    'é@example.com', 'user_1@host-name.io', 'a@b.c', 'mail me:a@b.cd,thanks',
+    '555-0100', '555 010 2000', '(555) 010-2000', '+44 20 7946 0958', '+1.555.010.2000', '٣٣٣-٣٣٣-٣٣٣٣',
+    '12345', 'call 5550102000 now', 'tabs\tand\nnewlines', '•★✓ € # * | _ ~', 'İstanbul café', '\x1c\xa0',
+]
+
+
+@pytest.mark.parametrize('text', RESUMES)
+def test_legacy_matcher_scores_as_the_regex_check(text):
+    assert ATS_SCORER.score(LEGACY_ATS_MATCHER.scan(text)) == check_ats_friendliness_regex(text)
+
+
+@pytest.mark.parametrize('text', FRAGMENTS)
+def test_email_phone_and_special_characters_match_the_patterns(text):
+    assert ATS_MATCHER.has_email(text) == bool(re.search(EMAIL_PATTERN, text))
+    assert ATS_MATCHER.has_phone(text) == bool(re.search(PHONE_PATTERN, text))
+    assert ATS_MATCHER.count_special(text) == len(re.findall(SPECIAL_CHAR_PATTERN, text))
+
+
+def test_good_resume_is_ats_friendly():
+    result = check_ats_friendliness(GOOD_RESUME)
+    assert result['is_ats_friendly']
+    assert result['issues'] == []
+    assert result['details']['contact_info'] == 'Complete'
+
+
+def test_missing_required_section_is_reported():
+    result = check_ats_friendliness(GOOD_RESUME.replace(
+        'EDUCATION\nBSc Statistics, State University (2014-2018)\n', ''))
+    assert "Missing 'Education' section" in result['issues']
+
+
+@pytest.mark.parametrize('matcher', [ATS_MATCHER, LEGACY_ATS_MATCHER], ids=['headings', 'keywords'])
+def test_batch_scores_as_one_at_a_time(matcher):
+    features = [matcher.scan(text) for text in RESUMES]
+    batch = ATS_SCORER.score_many(features)
+    assert batch == [ATS_SCORER.score(f) for f in features]
+    # Plain Python values, as the JSON responses need
+    assert all(type(r['score']) is int and type(r['is_ats_friendly']) is bool for r in batch)
+
+
+def test_batch_of_documents_and_empty_batch():
+    assert check_ats_friendliness_many(RESUMES) == [check_ats_friendliness(text) for text in RESUMES]
+    assert check_ats_friendliness_many([]) == []
+
+
+def test_scorer_follows_its_rule_table():
+    # Without the email rule a missing email address costs nothing
+    scorer = ATSScorer(penalty_rules=[rule for rule in PENALTY_RULES if rule[0] != 'has_email'])
+    features = ATS_MATCHER.scan(GOOD_RESUME.replace('@', ' (at) '))
+    assert ATS_SCORER.score(features)['score'] == 85
+    assert scorer.score(features)['score'] == 100
+    assert scorer.score_many([features]) == [scorer.score(features)]
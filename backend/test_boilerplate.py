@@ -0,0 +1,69 @@
+"""
+Header/footer stripping tests: running headers, footers and page numbers
+must be dropped after their first occurrence, and real content kept
+
+Run from the backend folder:  python -m pytest test_boilerplate.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from extraction.boilerplate import MIN_REPEATS, strip_repeated_lines
+
+HEADER = ['JANE DOE', 'jane.doe@example.com | +1 555 010 2000']
+SKILL_LINE = 'Python, SQL, Tableau, Power BI'
+
+
+def body(page_num):
+    return [f'Project {page_num}: reporting pipeline for team {page_num}',
+            SKILL_LINE,
+            f'Led a team of {page_num + 2} analysts through release {page_num}',
+            f'Improved accuracy by {page_num}0%']
+
+
+def page(page_num, count, footer='Page {n} of {m}'):
+    return '\n'.join(HEADER + body(page_num) + ['', footer.format(n=page_num, m=count)])
+
+
+@pytest.mark.parametrize('footer', ['Page {n} of {m}', '- {n} -', '{n}/{m}', '{n}'])
+def test_running_header_footer_and_page_numbers_are_stripped(footer):
+    pages = [page(n, 5, footer) for n in range(1, 6)]
+    result = strip_repeated_lines(pages)
+
+    # The first page keeps its header and footer, so the contact details
+    # still appear once; the others keep only their body
+    assert result[0] == pages[0]
+    for n, text in enumerate(result[1:], start=2):
+        assert text == '\n'.join(body(n) + [''])
+
+
+def test_repeated_body_line_is_kept():
+    # The skill line is on every page, but never near an edge
+    pages = [page(n, 4) for n in range(1, 5)]
+    result = strip_repeated_lines(pages)
+    assert all(SKILL_LINE in text.split('\n') for text in result)
+
+
+def test_lines_differing_in_other_digits_are_kept():
+    # Edge lines that differ only in counts and percentages are not page numbers
+    pages = ['\n'.join([f'Led a team of {n} analysts', f'Release {n} shipped', f'Improved accuracy by {n}0%'])
+             for n in range(1, 6)]
+    assert strip_repeated_lines(pages) == pages
+
+
+def test_line_on_too_few_pages_is_kept():
+    # Under half of the pages carry the extra line at their top
+    pages = [page(n, 8) for n in range(1, 9)]
+    pages[1:4] = ['Summary of projects\n' + text for text in pages[1:4]]
+    result = strip_repeated_lines(pages)
+    assert sum('Summary of projects' in text for text in result) == 3
+
+
+@pytest.mark.parametrize('count', range(MIN_REPEATS))
+def test_short_documents_are_left_alone(count):
+    pages = [page(n, count) for n in range(1, count + 1)]
+    assert strip_repeated_lines(pages) == pages
@@ -0,0 +1,123 @@
+"""
+Chunked upload tests: chunks sent in any order or more than once assemble
+the exact file, corrupt data is refused, and idle uploads are collected
+
+Run from the backend folder:  python -m pytest test_chunked_uploads.py
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from extraction.chunked import (MIN_CHUNK_BYTES, ChunkedUploadError, ChunkedUploadStore,
+                                UploadNotFoundError)
+
+CHUNK = MIN_CHUNK_BYTES
+DATA = bytes(range(256)) * (3 * CHUNK // 256) + b'last partial chunk'
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def chunk(index, data=DATA):
+    return data[index * CHUNK:(index + 1) * CHUNK]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ChunkedUploadStore(directory=str(tmp_path), ttl=60)
+
+
+def initiate(store, data=DATA):
+    return store.initiate('resume.pdf', 'pdf', len(data), sha256(data), chunk_size=CHUNK)
+
+
+def finalized_bytes(store, upload_id):
+    upload = store.finalize(upload_id)
+    with open(upload.path, 'rb') as f:
+        data = f.read()
+    os.remove(upload.path)
+    return data
+
+
+def test_out_of_order_and_retried_chunks(store):
+    upload = initiate(store)
+    assert upload.chunk_count == 4
+    for index in [3, 1, 1, 0]:
+        store.put_chunk(upload.id, index, chunk(index))
+    # A chunk resent after a dropped connection overwrites itself
+    store.put_chunk(upload.id, 3, chunk(3), checksum=sha256(chunk(3)))
+
+    status = store.get(upload.id).to_dict()
+    assert status['missing_chunks'] == [2] and not status['complete']
+    with pytest.raises(ChunkedUploadError, match='missing: 2'):
+        store.finalize(upload.id)
+
+    store.put_chunk(upload.id, 2, chunk(2))
+    assert finalized_bytes(store, upload.id) == DATA
+    assert store.stats()['completed'] == 1 and store.stats()['active'] == 0
+    with pytest.raises(UploadNotFoundError):
+        store.get(upload.id)
+
+
+def test_chunk_checksum_mismatch_is_refused(store):
+    upload = initiate(store)
+    corrupt = b'\xff' + chunk(0)[1:]
+    with pytest.raises(ChunkedUploadError, match='checksum'):
+        store.put_chunk(upload.id, 0, corrupt, checksum=sha256(chunk(0)))
+    assert 0 not in store.get(upload.id).received
+    assert store.stats()['integrity_failures'] == 1
+
+
+def test_file_checksum_mismatch_is_refused(store, tmp_path):
+    upload = initiate(store)
+    for index in range(upload.chunk_count):
+        data = chunk(index)
+        store.put_chunk(upload.id, index, b'\xff' + data[1:] if index == 1 else data)
+    with pytest.raises(ChunkedUploadError, match='checksum'):
+        store.finalize(upload.id)
+    assert os.listdir(tmp_path) == []
+    assert store.stats()['integrity_failures'] == 1
+
+
+@pytest.mark.parametrize('sha', [None, '', 'abc', 'g' * 64])
+def test_whole_file_checksum_is_required(store, sha):
+    with pytest.raises(ChunkedUploadError, match='sha256'):
+        store.initiate('resume.pdf', 'pdf', len(DATA), sha, chunk_size=CHUNK)
+
+
+def test_wrong_chunk_length_is_refused(store):
+    upload = initiate(store)
+    with pytest.raises(ChunkedUploadError, match='must be'):
+        store.put_chunk(upload.id, 3, chunk(3) + b'x')
+
+
+def test_idle_uploads_and_orphaned_files_are_collected(store, tmp_path):
+    idle = initiate(store)
+    active = initiate(store)
+    finalized = initiate(store)
+    for index in range(finalized.chunk_count):
+        store.put_chunk(finalized.id, index, chunk(index))
+    path = store.finalize(finalized.id).path
+
+    # The idle upload and the finalized file nobody deleted are older than ttl
+    past = time.time() - store.ttl - 1
+    idle.last_activity = past
+    os.utime(idle.path, (past, past))
+    os.utime(path, (past, past))
+    other = tmp_path / 'not-an-upload.part'
+    other.write_bytes(b'')
+    os.utime(other, (past, past))
+
+    assert store.collect_garbage() == 1
+    assert sorted(os.listdir(tmp_path)) == sorted([os.path.basename(active.path), other.name])
+    with pytest.raises(UploadNotFoundError):
+        store.put_chunk(idle.id, 0, chunk(0))
+    store.put_chunk(active.id, 0, chunk(0))
+    assert store.stats()['expired'] == 1
@@ -0,0 +1,49 @@
+"""
+clean_text tests: the fused cleaner must give byte-for-byte what the original
+step-by-step cleaner gives (lowercase, then clean_lowercase_text_stepwise)
+
+Run from the backend folder:  python -m pytest test_clean_text.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.preprocessor import ResumePreprocessor, clean_lowercase_text_stepwise
+
+CASES = [
+    '',
+    '   \n\t ',
+    'Plain words only',
+    'JOHN DOE\njohn.doe@example.com | +1 555 010 2000 | https://johndoe.dev/cv',
+    'Call 555-555-5555 or 555.555.5555 or 5555555555 today',
+    'Visit www.example.com/jobs?id=12, then http://x.y and https://a.b/c',
+    '+44 20 7946 0958 and +1\n2 3 4 then +33',
+    'x@ @x a@b@c mail:me@example.org.',
+    'C++ / C# / .NET, Node.js; 5+ years (2018-2024)',
+    'Café résumé naïve ٣ \xa0spaces em\x85next\x1csep',
+    'wwwexample httpserver user@host+1 555',
+    'x' * 200 + '@' + 'y' * 200,
+]
+
+
+def fused(text):
+    # clean_text uses no NLTK data
+    return ResumePreprocessor.__new__(ResumePreprocessor).clean_text(text)
+
+
+def stepwise(text):
+    return clean_lowercase_text_stepwise(text.lower())
+
+
+@pytest.mark.parametrize('text', CASES)
+def test_matches_stepwise_cleaner(text):
+    assert fused(text) == stepwise(text)
+
+
+def test_removes_contact_details_and_non_letters():
+    text = 'Jane Doe, jane@example.com, +1 555 010 2000, https://jane.dev - Python & SQL (5 yrs)'
+    assert fused(text) == 'jane doe python sql yrs'
@@ -0,0 +1,88 @@
+"""
+DOCX extraction tests: the streaming extractor must return exactly what the
+python-docx implementation (extract_text_from_docx_dom) returns
+
+Run from the backend folder:  python -m pytest test_docx_extraction.py
+"""
+
+import io
+import os
+import sys
+
+import docx
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from extraction.docx_text import extract_text_from_docx, extract_text_from_docx_dom
+
+LINES = [
+    'JANE DOE',
+    'jane.doe@example.com | +1 555 010 2000',
+    '',
+    'SKILLS',
+    'Python, SQL, Excel, Tableau',
+    '   ',
+    'EXPERIENCE',
+    'Data Analyst - Example Corp (2020-2024)',
+]
+
+
+def build(lines=LINES, table=None, merge=False, tab_and_break=False):
+    """DOCX bytes: `lines` as paragraphs, then `table` (list of rows) if given."""
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    if tab_and_break:
+        paragraph = document.add_paragraph('Skills:')
+        run = paragraph.add_run()
+        run.add_tab()
+        run.add_text('Python')
+        run.add_break()
+        run.add_text('SQL')
+    if table:
+        grid = document.add_table(rows=len(table), cols=len(table[0]))
+        for r, row in enumerate(table):
+            for c, value in enumerate(row):
+                grid.cell(r, c).text = value
+        if merge:
+            grid.cell(0, 0).merge(grid.cell(0, 1))
+            grid.cell(1, 2).merge(grid.cell(2, 2))
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+TABLE = [
+    ['Skill', 'Level', 'Years'],
+    ['Python', 'Expert', '6'],
+    ['SQL', '', '4'],
+    ['', '', ''],
+]
+
+DOCUMENTS = {
+    'paragraphs': build(),
+    'tab and line break': build(tab_and_break=True),
+    'table': build(table=TABLE),
+    'merged cells': build(table=TABLE, merge=True),
+    'table only': build(lines=[], table=TABLE),
+}
+
+
+@pytest.mark.parametrize('name', sorted(DOCUMENTS))
+def test_matches_python_docx(name):
+    data = DOCUMENTS[name]
+    assert extract_text_from_docx(io.BytesIO(data)) == extract_text_from_docx_dom(io.BytesIO(data))
+
+
+def test_empty_document_is_an_error():
+    data = build(lines=['', '  '])
+    with pytest.raises(Exception, match='No text could be extracted'):
+        extract_text_from_docx(io.BytesIO(data))
+    with pytest.raises(Exception, match='No text could be extracted'):
+        extract_text_from_docx_dom(io.BytesIO(data))
+
+
+def test_not_a_docx_is_an_error():
+    with pytest.raises(Exception, match='Error reading DOCX'):
+        extract_text_from_docx(io.BytesIO(b'plain text, not a zip'))
@@ -0,0 +1,64 @@
+"""
+Extraction cache tests: a disk hit must return exactly the text that was
+stored, and the on-disk store must stay within its byte budget
+
+Run from the backend folder:  python -m pytest test_extraction_cache.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from extraction.cache import ExtractionCache
+
+TEXT = "JANE DOE\r\nSKILLS\rPython\nété — résumé\r\n"
+
+
+def key(n):
+    return ExtractionCache.key_for(f"{n:064x}", 'pdf')
+
+
+def test_disk_hit_returns_the_stored_text(tmp_path):
+    ExtractionCache(disk_dir=str(tmp_path)).put(key(1), TEXT)
+    # A new cache (e.g. after a restart) only has the disk store
+    cache = ExtractionCache(disk_dir=str(tmp_path))
+    assert cache.get(key(1)) == TEXT
+    assert cache.stats()['disk_hits'] == 1
+    # The second lookup is served from memory
+    assert cache.get(key(1)) == TEXT
+    assert cache.stats()['memory_hits'] == 1
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    entry_bytes = len(TEXT.encode('utf-8'))
+    cache = ExtractionCache(max_entries=1, disk_dir=str(tmp_path), max_disk_bytes=2 * entry_bytes)
+    cache.put(key(1), TEXT)
+    cache.put(key(2), TEXT)
+    assert cache.get(key(1)) == TEXT          # from disk: now the most recently used
+    cache.put(key(3), TEXT)
+
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{key(n)}.txt" for n in (1, 3))
+    assert cache.stats()['disk_bytes'] == 2 * entry_bytes
+    assert cache.get(key(2)) is None
+
+
+def test_missing_file_is_a_miss(tmp_path):
+    cache = ExtractionCache(max_entries=1, disk_dir=str(tmp_path))
+    cache.put(key(1), TEXT)
+    cache.put(key(2), TEXT)                   # pushes key(1) out of memory
+    os.remove(tmp_path / f"{key(1)}.txt")
+    assert cache.get(key(1)) is None
+    assert cache.stats()['disk_entries'] == 1
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path, monkeypatch):
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    cache = ExtractionCache(disk_dir=str(tmp_path))
+    monkeypatch.setattr(os, 'replace', fail)
+    cache.put(key(1), TEXT)
+    assert os.listdir(tmp_path) == []
+    assert cache.stats()['disk_entries'] == 0
+    assert cache.get(key(1)) == TEXT          # still served from memory
@@ -0,0 +1,88 @@
+"""
+ForestEngine tests: the exported forest must give exactly the probabilities
+of the RandomForestClassifier it was exported from
+
+Run from the backend folder:  python -m pytest test_forest.py
+
+The forest is fitted here on a small fixed random sparse matrix (TF-IDF-like:
+mostly zeros, values in [0, 1)), with n_jobs=1 so sklearn sums the trees in
+estimator order, as ForestEngine does.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import models.forest
+from models.forest import ForestEngine
+
+N_FEATURES = 60
+
+
+def sparse_rows(n_rows, seed):
+    return sp.random(n_rows, N_FEATURES, density=0.1, format='csr', dtype=np.float64,
+                     random_state=np.random.RandomState(seed))
+
+
+@pytest.fixture(scope='module')
+def model():
+    X = sparse_rows(120, seed=0)
+    # Labels that depend on the features, so the trees are deep and uneven
+    y = np.array(['analyst', 'developer', 'designer'])[
+        (X[:, :20].sum(axis=1).A1 > X[:, 20:40].sum(axis=1).A1).astype(int)
+        + (X[:, 40:].sum(axis=1).A1 > 0.8).astype(int)]
+    forest = RandomForestClassifier(n_estimators=15, max_features='sqrt', random_state=0, n_jobs=1)
+    return forest.fit(X, y)
+
+
+@pytest.fixture(scope='module')
+def X():
+    return sparse_rows(40, seed=1)
+
+
+def test_matches_sklearn_on_sparse_rows(model, X):
+    engine = ForestEngine.from_model(model)
+    np.testing.assert_array_equal(engine.predict_proba(X), model.predict_proba(X))
+    np.testing.assert_array_equal(engine.predict(X), model.predict(X))
+
+
+def test_matches_sklearn_on_dense_rows(model, X):
+    engine = ForestEngine.from_model(model)
+    np.testing.assert_array_equal(engine.predict_proba(X.toarray()), model.predict_proba(X))
+
+
+def test_matches_sklearn_one_row_at_a_time(model, X):
+    engine = ForestEngine.from_model(model)
+    for i in range(5):
+        np.testing.assert_array_equal(engine.predict_proba(X[i]), model.predict_proba(X[i]))
+
+
+def test_scores_in_blocks(model, X, monkeypatch):
+    # Blocks of 3 rows: 40 rows go through the trees in 14 blocks, the last partial
+    monkeypatch.setattr(models.forest, 'BLOCK_VALUES', 3 * N_FEATURES)
+    engine = ForestEngine.from_model(model)
+    np.testing.assert_array_equal(engine.predict_proba(X), model.predict_proba(X))
+
+
+@pytest.mark.parametrize('mmap_mode', [None, 'r'])
+def test_save_and_load(model, X, tmp_path, mmap_mode):
+    path = str(tmp_path / 'forest')
+    exported = ForestEngine.from_model(model)
+    exported.save(path)
+    engine = ForestEngine.load(path, mmap_mode=mmap_mode)
+    assert engine.max_depth == exported.max_depth
+    assert engine.n_estimators == model.n_estimators
+    np.testing.assert_array_equal(engine.classes_, model.classes_)
+    np.testing.assert_array_equal(engine.predict_proba(X), model.predict_proba(X))
+
+
+def test_rejects_wrong_feature_count(model):
+    engine = ForestEngine.from_model(model)
+    with pytest.raises(ValueError, match='features'):
+        engine.predict_proba(np.zeros((1, N_FEATURES + 1)))
@@ -0,0 +1,84 @@
+"""
+Live session tests: a document updated edit by edit, reusing unchanged
+paragraphs, must equal a full analysis of the same text
+
+Run from the backend folder:  python -m pytest test_live_sessions.py
+
+Edits are seeded random insertions, deletions and reversals, plus edits
+that add or remove paragraph breaks and headings. Needs the NLTK stopwords
+and WordNet data (skipped without them).
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analysis.document import ResumeDocument
+from analysis.live import LiveSessionStore
+from benchmarks.corpus import resume_texts
+from models.preprocessor import ResumePreprocessor
+
+TEXTS = resume_texts(80, seed=5)
+SNIPPETS = ['\n', '\n\n', 'SKILLS\n', '\nEXPERIENCE\n', 'EDUCATION', 'Python, SQL ', 'developed ',
+            'jo@example.com', '+44 20 7946 0958', 'é', '•', '  ', '\r\n', 'x']
+WEIGHTS = {'skills': 2.0, 'header': 0, 'experience': 1.5}
+
+
+@pytest.fixture(scope='module')
+def preprocessor():
+    try:
+        return ResumePreprocessor()
+    except LookupError:
+        pytest.skip("NLTK stopwords/wordnet data not installed")
+
+
+def edit(rng, text):
+    i = rng.randrange(len(text) + 1)
+    r = rng.random()
+    if r < 0.5:
+        return text[:i] + rng.choice(SNIPPETS) + text[i:]
+    if r < 0.8:
+        return text[:i] + text[i + rng.randint(1, 8):]
+    j = rng.randrange(i, len(text) + 1)
+    return text[:i] + text[i:j][::-1] + text[j:]
+
+
+def assert_same(document, reference):
+    assert document.sections == reference.sections
+    assert document.ats_features == reference.ats_features
+    assert document.processed == reference.processed
+    np.testing.assert_array_equal(document.features.toarray(), reference.features.toarray())
+    np.testing.assert_array_equal(document.term_counts.toarray(), reference.term_counts.toarray())
+    np.testing.assert_array_equal(document.section_features(WEIGHTS).toarray(),
+                                  reference.section_features(WEIGHTS).toarray())
+
+
+@pytest.mark.parametrize('params', [
+    {'ngram_range': (1, 2), 'min_df': 2},
+    {'ngram_range': (1, 3), 'sublinear_tf': True},
+    {'analyzer': 'char_wb', 'ngram_range': (2, 3), 'max_features': 500},
+], ids=['bigrams', 'trigrams', 'characters'])
+def test_incremental_edits_equal_full_analysis(preprocessor, params):
+    vectorizer = TfidfVectorizer(**params).fit([preprocessor.preprocess(text) for text in TEXTS])
+    store = LiveSessionStore(preprocessor, vectorizer)
+    assert store.analyzer.incremental == (params.get('analyzer', 'word') == 'word')
+    rng = random.Random(0)
+
+    for start in TEXTS[:3]:
+        session = store.create()
+        text = start
+        for _ in range(40):
+            text = edit(rng, text)
+            document = session.update(text)
+            assert_same(document, ResumeDocument(text, preprocessor=preprocessor, vectorizer=vectorizer))
+        # Back to the start, and to nothing at all
+        for text in [start, '', start]:
+            assert_same(session.update(text),
+                        ResumeDocument(text, preprocessor=preprocessor, vectorizer=vectorizer))
+        assert store.get(session.id) is session
@@ -0,0 +1,75 @@
+"""
+predict_many tests: scoring a batch must give exactly what predict() gives
+one resume at a time, for raw texts, ResumeDocuments or a mix of both
+
+Run from the backend folder:  python -m pytest test_predict_many.py
+
+The predictor is a ResumePredictor over a small forest fitted here on
+generated resumes. Needs the NLTK stopwords and WordNet data (skipped
+without them).
+"""
+
+import os
+import sys
+
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.corpus import resume_texts
+from models.forest import ForestEngine
+from models.predict import ResumePredictor
+from models.preprocessor import ResumePreprocessor
+
+ROLES = ['Data Analyst', 'Network Engineer', 'Web Developer']
+TRAINING = resume_texts(60, seed=3)
+TEXTS = resume_texts(12, seed=4) + ['', 'Python developer', TRAINING[0]]
+
+
+@pytest.fixture(scope='module')
+def predictor():
+    try:
+        preprocessor = ResumePreprocessor()
+    except LookupError:
+        pytest.skip("NLTK stopwords/wordnet data not installed")
+
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), min_df=2)
+    features = vectorizer.fit_transform([preprocessor.preprocess(text) for text in TRAINING])
+    # Labels only loosely tied to the text, so many rows have close or tied scores
+    labels = [len(text) % len(ROLES) for text in TRAINING]
+    model = RandomForestClassifier(n_estimators=10, random_state=0, n_jobs=1).fit(features, labels)
+
+    predictor = ResumePredictor.__new__(ResumePredictor)
+    predictor.preprocessor = preprocessor
+    predictor.vectorizer = vectorizer
+    predictor.model = ForestEngine.from_model(model)
+    predictor.label_encoder = {role: i for i, role in enumerate(ROLES)}
+    predictor.inverse_label_encoder = dict(enumerate(ROLES))
+    predictor.column_roles = [ROLES[label] for label in predictor.model.classes_]
+    predictor.model_version = 'test'
+    return predictor
+
+
+def test_raw_texts(predictor):
+    assert predictor.predict_many(TEXTS) == [predictor.predict(text) for text in TEXTS]
+
+
+def test_documents_and_texts_mixed(predictor):
+    # Every other resume as a document, some with their features already computed
+    resumes = [predictor.document(text) if i % 2 else text for i, text in enumerate(TEXTS)]
+    for document in resumes[1::4]:
+        document.features
+    assert predictor.predict_many(resumes) == [predictor.predict(text) for text in TEXTS]
+
+
+def test_section_weights(predictor):
+    weights = {'skills': 2.0, 'header': 0}
+    resumes = [predictor.document(text) if i % 3 == 0 else text for i, text in enumerate(TEXTS)]
+    assert (predictor.predict_many(resumes, weights)
+            == [predictor.predict(text, weights) for text in TEXTS])
+
+
+def test_empty_batch(predictor):
+    assert predictor.predict_many([]) == []
@@ -0,0 +1,57 @@
+"""
+preprocess_many tests: the texts must come back in input order and exactly
+as preprocess() returns them, in this process or across worker processes
+
+Run from the backend folder:  python -m pytest test_preprocess_many.py
+
+Needs the NLTK stopwords and WordNet data (skipped without them).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.corpus import resume_texts
+from models.preprocessor import ResumePreprocessor
+
+# Long resumes first, so the first chunks finish after later ones
+TEXTS = ([text * 20 for text in resume_texts(3, seed=1)] + resume_texts(20, seed=2)
+         + ['', '   \n', 'Python, SQL & C++ (5+ years)'])
+
+
+@pytest.fixture(scope='module')
+def preprocessor():
+    try:
+        return ResumePreprocessor()
+    except LookupError:
+        pytest.skip("NLTK stopwords/wordnet data not installed")
+
+
+@pytest.fixture(scope='module')
+def expected(preprocessor):
+    return [preprocessor.preprocess(text) for text in TEXTS]
+
+
+def test_in_process(preprocessor, expected):
+    assert list(preprocessor.preprocess_many(TEXTS, workers=1)) == expected
+    assert list(preprocessor.preprocess_many([], workers=1)) == []
+
+
+def test_worker_processes_keep_input_order(preprocessor, expected):
+    # A generator, read a few chunks ahead
+    results = preprocessor.preprocess_many((text for text in TEXTS), workers=2, chunk_size=2)
+    assert list(results) == expected
+
+
+def test_shared_executor(preprocessor, expected):
+    executor = preprocessor.preprocess_executor(2)
+    try:
+        assert list(preprocessor.preprocess_many(TEXTS, executor=executor, chunk_size=4)) == expected
+        # Used even for fewer texts than one chunk, and left running
+        assert list(preprocessor.preprocess_many(TEXTS[-3:], executor=executor)) == expected[-3:]
+        assert list(preprocessor.preprocess_many(TEXTS[:1], executor=executor)) == expected[:1]
+    finally:
+        executor.shutdown()
@@ -0,0 +1,72 @@
+"""
+Parser sandbox tests: a document that blows the deadline or the memory
+budget kills its worker, and a replacement worker serves the next one
+
+Run from the backend folder:  python -m pytest test_sandbox.py
+
+The runaway document is a PDF whose page content is a compressed stream
+of a few hundred MB of text operators (a decompression bomb).
+"""
+
+import io
+import os
+import sys
+import zlib
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.corpus import build_pdf, resume_pages
+from extraction.pdf_text import extract_text_from_pdf
+from extraction.sandbox import ParseMemoryError, ParserSandbox, ParseTimeoutError
+
+MB = 1024 * 1024
+
+
+def bomb(size_mb):
+    """A one-page PDF whose content stream inflates to `size_mb` MB."""
+    compressor = zlib.compressobj(9)
+    block = b'(x) Tj ' * (1 << 17)
+    body = b''.join(compressor.compress(block) for _ in range(size_mb * MB // len(block)))
+    body += compressor.flush()
+    pdf = build_pdf([['placeholder']])
+    start = pdf.index(b'<< /Length')
+    end = pdf.index(b'endstream', start) + len(b'endstream')
+    stream = b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream' % (len(body), body)
+    return pdf[:start] + stream + pdf[end:]
+
+
+@pytest.fixture(scope='module')
+def resume():
+    data = build_pdf(resume_pages(3))
+    return data, extract_text_from_pdf(io.BytesIO(data), parallel=False)
+
+
+@pytest.fixture(scope='module')
+def runaway():
+    return bomb(400)
+
+
+@pytest.mark.parametrize('budget, error, counter', [
+    ({'timeout': 0.2, 'max_memory_bytes': 2048 * MB}, ParseTimeoutError, 'timeouts'),
+    ({'timeout': 60, 'max_memory_bytes': 64 * MB}, ParseMemoryError, 'memory_kills'),
+], ids=['timeout', 'memory'])
+def test_killed_worker_is_replaced(resume, runaway, budget, error, counter):
+    data, expected = resume
+    sandbox = ParserSandbox(workers=1, page_workers=1, **budget)
+    try:
+        assert sandbox.extract('pdf', data) == expected
+        first = sandbox._idle.queue[0].process.pid
+
+        with pytest.raises(error):
+            sandbox.extract('pdf', runaway)
+
+        # The next document waits for the replacement, started in the background
+        assert sandbox.extract('pdf', data) == expected
+        assert sandbox._idle.queue[0].process.pid != first
+        stats = sandbox.stats()
+        assert stats[counter] == 1
+        assert stats['completed'] == 2
+    finally:
+        sandbox.shutdown()
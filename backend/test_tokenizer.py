@@ -0,0 +1,93 @@
+"""
+Tokenizer tests: fast_tokenize must return exactly what NLTK's word_tokenize
+returns on clean_text output
+
+Run from the backend folder:  python -m pytest test_tokenizer.py
+
+word_tokenize runs with preserve_line=True (its Treebank tokenizer alone), so
+no NLTK data is needed; clean_text output is a single line without sentence
+punctuation, where Punkt sentence splitting changes nothing. The check over
+the training set compares against word_tokenize as the 'nltk' tokenizer mode
+calls it, Punkt included; it is skipped without the CSV or the Punkt data.
+"""
+
+import os
+import sys
+
+import pytest
+from nltk.tokenize import word_tokenize
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.corpus import training_resumes
+from models.nltk_resources import missing_resources
+from models.preprocessor import CONTRACTION_SPLITS, ResumePreprocessor, fast_tokenize
+
+RESUMES = [
+    """JOHN DOE
+john.doe@example.com | +1 555 010 2000 | www.johndoe.dev
+SKILLS: Python, Django, REST APIs, PostgreSQL, Docker
+EXPERIENCE
+Senior Software Engineer - Tech Corp (2020-2024)
+- Built scalable web applications; cannot stop shipping!
+""",
+    "Data analyst: SQL, Tableau, Excel (5+ years). I'm gonna wanna lemme gimme gotta.",
+    "",
+    "   \n\t  ",
+]
+
+CONTRACTION_CASES = [
+    'cannot',
+    'i cannot do it',
+    'gonna wanna gotta',
+    'lemme gimme',
+    'cannotcannot gonnawanna',
+    'can not gon na wan na',
+    'moren dye more',
+    'a i python data',
+]
+
+
+def clean_text(text):
+    # clean_text uses no NLTK data
+    return ResumePreprocessor.__new__(ResumePreprocessor).clean_text(text)
+
+
+def reference(text):
+    return word_tokenize(text, preserve_line=True)
+
+
+@pytest.mark.parametrize('text', RESUMES)
+def test_matches_word_tokenize_on_cleaned_resumes(text):
+    cleaned = clean_text(text)
+    assert fast_tokenize(cleaned) == reference(cleaned)
+
+
+@pytest.mark.parametrize('text', CONTRACTION_CASES)
+def test_matches_word_tokenize_on_contractions(text):
+    assert fast_tokenize(text) == reference(text)
+
+
+@pytest.mark.parametrize('word', sorted(CONTRACTION_SPLITS))
+def test_splits_each_contraction(word):
+    assert fast_tokenize(f"we {word} go") == ['we'] + CONTRACTION_SPLITS[word] + ['go']
+
+
+def test_plain_words_are_a_whitespace_split():
+    assert fast_tokenize('python data science') == ['python', 'data', 'science']
+    assert fast_tokenize('') == []
+
+
+def test_matches_word_tokenize_on_the_training_set():
+    texts = training_resumes()
+    if texts is None:
+        pytest.skip("data/resumes_clean.csv not present")
+    if missing_resources({'punkt': 'tokenizers/punkt'}):
+        pytest.skip("NLTK punkt data not installed")
+
+    mismatched = []
+    for row, text in enumerate(texts):
+        cleaned = clean_text(text)
+        if fast_tokenize(cleaned) != word_tokenize(cleaned):
+            mismatched.append(row)
+    assert not mismatched, f"{len(mismatched)} of {len(texts)} rows differ, first: {mismatched[:10]}"